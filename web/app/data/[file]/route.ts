@@ -0,0 +1,19 @@
+import { getDataFiles } from "@/lib/manifest";
+
+// Emitted as plain files under out/data/ by the static export
+export const dynamic = "force-static";
+export const dynamicParams = false;
+
+export function generateStaticParams() {
+  return Array.from(getDataFiles().keys()).map((file) => ({ file }));
+}
+
+export function GET(_request: Request, { params }: { params: { file: string } }) {
+  const body = getDataFiles().get(params.file);
+  if (body === undefined) {
+    return new Response("Not found", { status: 404 });
+  }
+  return new Response(body, {
+    headers: { "content-type": "application/json" },
+  });
+}
@@ -0,0 +1,8 @@
+import { notFound } from "next/navigation";
+import KoiBench from "@/components/KoiBench";
+
+// Development-only benchmark; exported builds get a 404 here.
+export default function KoiBenchPage() {
+  if (process.env.NODE_ENV === "production") notFound();
+  return <KoiBench />;
+}
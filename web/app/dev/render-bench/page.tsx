@@ -0,0 +1,8 @@
+import { notFound } from "next/navigation";
+import RenderBench from "@/components/RenderBench";
+
+// Development-only benchmark; exported builds get a 404 here.
+export default function RenderBenchPage() {
+  if (process.env.NODE_ENV === "production") notFound();
+  return <RenderBench />;
+}
@@ -6,15 +6,20 @@ import NavBar from "@/components/NavBar";
 import Footer from "@/components/Footer";
 import { NowPlayingProvider } from "@/components/NowPlayingContext";
 import NowPlayingBar from "@/components/NowPlayingBar";
+import { getPostsManifestUrl } from "@/lib/manifest";
 
 // Define font variables
 const fontSans = GeistSans;
 const fontMono = GeistMono;
 
-export const metadata: Metadata = {
-  title: "VIBES.FM — Music Mixes & Tracklists",
-  description: "Nalostta's curated music mixes, playlists, and tracklists.",
-};
+export function generateMetadata(): Metadata {
+  return {
+    title: "VIBES.FM — Music Mixes & Tracklists",
+    description: "Nalostta's curated music mixes, playlists, and tracklists.",
+    // Read by lib/manifestClient.ts so client components can find the hashed manifest
+    other: { "posts-manifest": getPostsManifestUrl() },
+  };
+}
 
 export default function RootLayout({
   children,
@@ -0,0 +1,13 @@
+import MixesPageView from "@/components/MixesPageView";
+import { getListingPageCount } from "@/lib/posts";
+
+export const dynamicParams = false;
+
+export async function generateStaticParams() {
+  // Page 1 is always emitted: static export rejects an empty param list
+  return Array.from({ length: getListingPageCount() }, (_, i) => ({ n: String(i + 1) }));
+}
+
+export default function MixesListingPage({ params }: { params: { n: string } }) {
+  return <MixesPageView page={Number(params.n)} />;
+}
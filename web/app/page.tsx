@@ -1,13 +1,14 @@
 import Link from "next/link";
 import MixCard from "@/components/MixCard";
 import AudioPlayer from "@/components/AudioPlayer";
-import { getAllPosts, getCoverFromEmbed } from "@/lib/posts";
+import { getPostListings, getCoverFromEmbed } from "@/lib/posts";
 import KoiBackground from "@/components/KoiBackground";
 import type { Mix } from "@/components/MixCard";
+import { getAudioGainDb, getAudioPeaksId } from "@/lib/audioAnalysis";
 
 
 export default function Home() {
-  const posts = getAllPosts().slice(0, 6);
+  const posts = getPostListings().slice(0, 6);
   const latestMix: Mix = {
     id: "latest",
     title: "Latest Mix — Midnight Drift",
@@ -57,17 +58,21 @@ export default function Home() {
         </div>
         <div className="grid gap-6 sm:grid-cols-2 lg:grid-cols-3">
           {posts.map((p) => {
-            const desc = p.content ? p.content.split("\n\n")[0] : undefined;
+            const desc = p.excerpt || undefined;
             const mixLike: Mix = {
               id: p.slug,
               title: p.title,
               description: desc,
               cover: getCoverFromEmbed(p) ?? undefined,
               audioUrl: p.audioUrl ?? undefined,
-              embed: p.embed ?? undefined,
+              gainDb: getAudioGainDb(p.audioUrl),
+              peaks: getAudioPeaksId(p.audioUrl),
+              videoId: p.videoId,
+              startSeconds: p.videoStart,
+              endSeconds: p.videoEnd,
               genre: p.tags?.[0],
               mood: p.tags?.[1],
-              duration: undefined,
+              duration: p.duration,
               releaseDate: p.date,
             };
             return <MixCard key={p.slug} mix={mixLike} href={`/posts/${p.slug}`} />;
@@ -1,19 +1,30 @@
-import { getPostBySlug, getAllPosts } from "@/lib/posts";
+import { getPostBySlugAsync, getAllPostsAsync, getCoverFromEmbed, type Post } from "@/lib/posts";
 import { notFound } from "next/navigation";
 import YouTubeAudioPlayer from "@/components/YouTubeAudioPlayer";
+import PostWaveform from "@/components/PostWaveform";
+import Tracklist from "@/components/Tracklist";
+import { getAudioGainDb, getAudioPeaksId } from "@/lib/audioAnalysis";
 
 export const dynamicParams = false;
 
 export async function generateStaticParams() {
-  const posts = getAllPosts();
+  const posts = await getAllPostsAsync();
   return posts.map((post) => ({ slug: post.slug }));
 }
 
-function Embed({ type, url, title }: { type: "youtube" | "soundcloud"; url: string; title: string }) {
-  if (type === "youtube") {
+function Embed({ post }: { post: Post }) {
+  if (!post.embed) return null;
+  if (post.embed.type === "youtube") {
     return (
       <div className="w-full overflow-hidden rounded-md border border-white/10 bg-black/40">
-        <YouTubeAudioPlayer url={url} title={title} />
+        <YouTubeAudioPlayer
+          videoId={post.videoId ?? null}
+          title={post.title}
+          cover={getCoverFromEmbed(post) ?? undefined}
+          duration={post.duration}
+          startSeconds={post.videoStart}
+          endSeconds={post.videoEnd}
+        />
       </div>
     );
   }
@@ -25,7 +36,7 @@ function Embed({ type, url, title }: { type: "youtube" | "soundcloud"; url: stri
         scrolling="no"
         frameBorder="no"
         allow="autoplay"
-        src={url}
+        src={post.embed.url}
       />
     </div>
   );
@@ -33,9 +44,11 @@ function Embed({ type, url, title }: { type: "youtube" | "soundcloud"; url: stri
 
  
 
-export default function PostPage({ params }: { params: { slug: string } }) {
-  const post = getPostBySlug(params.slug);
+export default async function PostPage({ params }: { params: { slug: string } }) {
+  const post = await getPostBySlugAsync(params.slug);
   if (!post) return notFound();
+  const peaks = getAudioPeaksId(post.audioUrl);
+  const gainDb = getAudioGainDb(post.audioUrl);
 
   return (
     <main className="mx-auto max-w-3xl px-4 py-10 space-y-6">
@@ -58,16 +71,25 @@ export default function PostPage({ params }: { params: { slug: string } }) {
 
       <h1 className="text-2xl sm:text-3xl font-semibold">{post.title}</h1>
 
-      {post.embed ? <Embed type={post.embed.type} url={post.embed.url} title={post.title} /> : null}
+      {post.audioUrl && peaks ? (
+        <PostWaveform slug={post.slug} title={post.title} src={post.audioUrl} peaks={peaks} gainDb={gainDb} />
+      ) : null}
+
+      <Embed post={post} />
 
-      {post.tracklist && post.tracklist.length ? (
+      {post.tracks.length ? (
         <section className="space-y-2">
           <h2 className="text-lg font-semibold">Tracklist</h2>
-          <ol className="list-decimal list-inside text-sm text-white/80 space-y-1">
-            {post.tracklist.map((line, i) => (
-              <li key={i}>{line}</li>
-            ))}
-          </ol>
+          <Tracklist
+            tracks={post.tracks}
+            slug={post.slug}
+            title={post.title}
+            audioUrl={post.audioUrl}
+            gainDb={gainDb}
+            peaks={peaks}
+            videoId={post.videoId}
+            videoStart={post.videoStart}
+          />
         </section>
       ) : null}
 
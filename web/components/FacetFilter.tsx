@@ -0,0 +1,88 @@
+"use client";
+import { useMemo, useState } from "react";
+import { countBits } from "@/lib/bitset";
+import type { FacetName } from "@/lib/facets";
+import type { DecodedFacets } from "@/lib/manifestClient";
+
+export type FacetSelection = Record<FacetName, Set<string>>;
+
+type Props = {
+  facets: DecodedFacets;
+  selected: FacetSelection;
+  onToggle: (facet: FacetName, value: string) => void;
+  onClear: () => void;
+};
+
+const groups: { facet: FacetName; label: string }[] = [
+  { facet: "tag", label: "Genre & mood" },
+  { facet: "postType", label: "Type" },
+  { facet: "duration", label: "Duration" },
+  { facet: "year", label: "Released" },
+];
+
+export function emptySelection(): FacetSelection {
+  return { tag: new Set(), postType: new Set(), year: new Set(), duration: new Set() };
+}
+
+export default function FacetFilter({ facets, selected, onToggle, onClear }: Props) {
+  const [tagQuery, setTagQuery] = useState("");
+
+  // Counts only change when a new facet index loads, so compute them once
+  const options = useMemo(() => {
+    const out = {} as Record<FacetName, { value: string; count: number }[]>;
+    for (const { facet } of groups) {
+      out[facet] = Array.from(facets[facet], ([value, bits]) => ({ value, count: countBits(bits) }));
+    }
+    out.tag.sort((a, b) => b.count - a.count || a.value.localeCompare(b.value));
+    out.year.sort((a, b) => b.value.localeCompare(a.value));
+    return out;
+  }, [facets]);
+
+  const anySelected = groups.some(({ facet }) => selected[facet].size > 0);
+  const q = tagQuery.trim().toLowerCase();
+
+  return (
+    <div className="rounded-lg border border-white/10 bg-black/40 p-4 space-y-4">
+      {groups.map(({ facet, label }) => {
+        const values = facet === "tag" && q ? options.tag.filter((o) => o.value.toLowerCase().includes(q)) : options[facet];
+        return (
+          <div key={facet} className="space-y-2">
+            <div className="flex items-center justify-between gap-3">
+              <h2 className="text-xs uppercase tracking-wide text-white/60">{label}</h2>
+              {facet === "tag" ? (
+                <input
+                  value={tagQuery}
+                  onChange={(e) => setTagQuery(e.target.value)}
+                  placeholder="Filter tags…"
+                  aria-label="Filter tags"
+                  className="w-40 bg-black/50 border border-white/10 rounded px-2 py-1 text-xs outline-none focus:border-white/30"
+                />
+              ) : null}
+            </div>
+            <div className="flex flex-wrap gap-2 max-h-32 overflow-auto">
+              {values.map(({ value, count }) => {
+                const active = selected[facet].has(value);
+                return (
+                  <button
+                    key={value}
+                    type="button"
+                    aria-pressed={active}
+                    onClick={() => onToggle(facet, value)}
+                    className={`text-xs rounded px-2 py-1 border ${active ? "border-white bg-white text-black" : "border-white/10 bg-black/40 text-white/70 hover:text-white"}`}
+                  >
+                    {facet === "postType" ? value.replace(/_/g, " ") : value} <span className="opacity-60">{count}</span>
+                  </button>
+                );
+              })}
+            </div>
+          </div>
+        );
+      })}
+      {anySelected ? (
+        <button type="button" onClick={onClear} className="text-xs underline underline-offset-4 text-white/70 hover:text-white">
+          Clear filters
+        </button>
+      ) : null}
+    </div>
+  );
+}
@@ -1,149 +1,100 @@
 'use client'; // Add this if using Next.js 13+ App Router
 
 import { useEffect, useRef } from 'react';
+import { createKoiRenderer, startKoiLoop } from '@/lib/koiRenderer';
 
-export default function KoiCometBackground() {
-  const canvasRef = useRef(null);
+// 'auto' draws in a Web Worker on an OffscreenCanvas where the browser supports it and
+// falls back to the main thread; NEXT_PUBLIC_KOI_RENDERER=main forces the fallback.
+const DEFAULT_MODE = process.env.NEXT_PUBLIC_KOI_RENDERER === 'main' ? 'main' : 'auto';
+const STATS_INTERVAL_MS = 1000;
+
+export function canRenderInWorker() {
+  return (
+    typeof Worker !== 'undefined' &&
+    typeof OffscreenCanvas !== 'undefined' &&
+    typeof HTMLCanvasElement.prototype.transferControlToOffscreen === 'function'
+  );
+}
+
+function startInWorker(canvas, width, height, onStats) {
+  const worker = new Worker(new URL('../lib/koi.worker.js', import.meta.url), { type: 'module' });
+  const offscreen = canvas.transferControlToOffscreen();
+  worker.postMessage({ type: 'init', canvas: offscreen, width, height, reportStats: Boolean(onStats) }, [offscreen]);
+  worker.onmessage = (e) => {
+    if (e.data.type === 'stats') onStats?.({ renderer: 'worker', ...e.data.stats });
+  };
+  const onVisibility = () => worker.postMessage({ type: 'visibility', visible: !document.hidden });
+  document.addEventListener('visibilitychange', onVisibility);
+  return {
+    resize: (w, h) => worker.postMessage({ type: 'resize', width: w, height: h }),
+    stop: () => {
+      document.removeEventListener('visibilitychange', onVisibility);
+      worker.terminate();
+    },
+  };
+}
+
+function startOnMainThread(canvas, width, height, onStats) {
+  canvas.width = width;
+  canvas.height = height;
+  const renderer = createKoiRenderer(canvas, (w, h) => {
+    const sprite = document.createElement('canvas');
+    sprite.width = w;
+    sprite.height = h;
+    return sprite;
+  });
+  // rAF already pauses in background tabs
+  const stopLoop = startKoiLoop(renderer, window);
+  const timer = onStats ? setInterval(() => onStats({ renderer: 'main', ...renderer.stats() }), STATS_INTERVAL_MS) : 0;
+  return {
+    resize: (w, h) => renderer.resize(w, h),
+    stop: () => {
+      stopLoop();
+      clearInterval(timer);
+    },
+  };
+}
+
+// `mode` and `onStats` exist for /dev/koi-bench; pages just render <KoiBackground />.
+export default function KoiCometBackground({ mode = DEFAULT_MODE, onStats }) {
+  const boxRef = useRef(null);
+  const onStatsRef = useRef(onStats);
+  onStatsRef.current = onStats;
 
   useEffect(() => {
-    const canvas = canvasRef.current;
-    if (!canvas) return;
+    const box = boxRef.current;
+    if (!box) return;
 
-    const ctx = canvas.getContext('2d');
-    
-    const COLOR_SCHEME = [
-      { r: 100, g: 200, b: 255 },
-      { r: 150, g: 100, b: 255 },
-      { r: 50, g: 255, b: 200 },
-      { r: 100, g: 150, b: 255 },
-      { r: 200, g: 100, b: 255 }
-    ];
-    
-    const COMET_COUNT = 8;
-    const TRAIL_LENGTH = 120;
-    
-    const setCanvasSize = () => {
-      canvas.width = window.innerWidth;
-      canvas.height = window.innerHeight;
+    // A canvas can only be transferred once, so each mount gets a fresh element
+    const canvas = document.createElement('canvas');
+    canvas.className = 'block w-full';
+    canvas.style.filter = 'blur(1.8px)';
+    canvas.style.background = '#0a0e27';
+    box.appendChild(canvas);
+
+    const size = () => {
+      canvas.style.height = `${window.innerHeight}px`;
+      return [window.innerWidth, window.innerHeight];
     };
-    
-    setCanvasSize();
+    const report = onStatsRef.current ? (s) => onStatsRef.current?.(s) : undefined;
+    const useWorker = mode !== 'main' && canRenderInWorker();
+    const [width, height] = size();
+    const field = useWorker ? startInWorker(canvas, width, height, report) : startOnMainThread(canvas, width, height, report);
+
+    const setCanvasSize = () => field.resize(...size());
     window.addEventListener('resize', setCanvasSize);
 
     // Observe document height changes (images load, content expands, etc.)
     const ro = new ResizeObserver(() => setCanvasSize());
     ro.observe(document.body);
-    
-    class Comet {
-      constructor() {
-        this.reset();
-        this.y = Math.random() * canvas.height;
-        this.color = COLOR_SCHEME[Math.floor(Math.random() * COLOR_SCHEME.length)];
-        this.trail = [];
-      }
-      
-      reset() {
-        this.x = -100;
-        this.y = Math.random() * canvas.height;
-        this.speed = (0.5 + Math.random() * 1.5) * 3.9; // ~3.9x faster (≈30% more than before)
-        this.amplitude = 30 + Math.random() * 50;
-        this.frequency = 0.001 + Math.random() * 0.002;
-        this.size = 8 + Math.random() * 15;
-        this.phase = Math.random() * Math.PI * 2;
-        this.opacity = Math.min(1, (0.6 + Math.random() * 0.4) * 2.0); // ~100% brighter, capped at 1
-        this.color = COLOR_SCHEME[Math.floor(Math.random() * COLOR_SCHEME.length)];
-        this.trail = [];
-      }
-      
-      update() {
-        this.x += this.speed;
-        this.y += Math.sin(this.x * this.frequency + this.phase) * 0.5;
-        
-        this.trail.unshift({ x: this.x, y: this.y });
-        if (this.trail.length > TRAIL_LENGTH) {
-          this.trail.pop();
-        }
-        
-        if (this.x > canvas.width + 100) {
-          this.reset();
-        }
-      }
-      
-      draw() {
-        for (let i = 0; i < this.trail.length; i++) {
-          const point = this.trail[i];
-          const alpha = (1 - i / this.trail.length) * this.opacity;
-          const size = this.size * (1 - i / this.trail.length);
-          
-          const gradient = ctx.createRadialGradient(
-            point.x, point.y, 0,
-            point.x, point.y, size
-          );
-          
-          gradient.addColorStop(0, `rgba(${this.color.r}, ${this.color.g}, ${this.color.b}, ${alpha})`);
-          gradient.addColorStop(0.5, `rgba(${this.color.r}, ${this.color.g}, ${this.color.b}, ${alpha * 0.5})`);
-          gradient.addColorStop(1, `rgba(${this.color.r}, ${this.color.g}, ${this.color.b}, 0)`);
-          
-          ctx.fillStyle = gradient;
-          ctx.beginPath();
-          ctx.arc(point.x, point.y, size, 0, Math.PI * 2);
-          ctx.fill();
-        }
-        
-        const headGradient = ctx.createRadialGradient(
-          this.x, this.y, 0,
-          this.x, this.y, this.size * 1.5
-        );
-        
-        headGradient.addColorStop(0, `rgba(${this.color.r + 50}, ${this.color.g + 50}, ${this.color.b + 50}, ${this.opacity})`);
-        headGradient.addColorStop(0.4, `rgba(${this.color.r}, ${this.color.g}, ${this.color.b}, ${this.opacity})`);
-        headGradient.addColorStop(1, `rgba(${this.color.r}, ${this.color.g}, ${this.color.b}, 0)`);
-        
-        ctx.fillStyle = headGradient;
-        ctx.beginPath();
-        ctx.arc(this.x, this.y, this.size * 1.5, 0, Math.PI * 2);
-        ctx.fill();
-      }
-    }
-    
-    const comets = [];
-    for (let i = 0; i < COMET_COUNT; i++) {
-      comets.push(new Comet());
-    }
-    
-    let animationId;
-    let lastTime = 0;
-    function animate(ts = 0) {
-      if (ts - lastTime < 33) { // ~30 FPS throttle
-        animationId = requestAnimationFrame(animate);
-        return;
-      }
-      lastTime = ts;
-      ctx.fillStyle = 'rgba(10, 14, 39, 0.08)';
-      ctx.fillRect(0, 0, canvas.width, canvas.height);
-      
-      comets.forEach(comet => {
-        comet.update();
-        comet.draw();
-      });
-      
-      animationId = requestAnimationFrame(animate);
-    }
-    
-    animate();
-    
+
     return () => {
       window.removeEventListener('resize', setCanvasSize);
-      cancelAnimationFrame(animationId);
       ro.disconnect();
+      field.stop();
+      canvas.remove();
     };
-  }, []);
+  }, [mode]);
 
-  return (
-    <canvas
-      ref={canvasRef}
-      className="absolute top-0 left-0 w-full -z-10 pointer-events-none"
-      style={{ filter: 'blur(1.8px)', background: '#0a0e27' }}
-    />
-  );
-}
\ No newline at end of file
+  return <div ref={boxRef} className="absolute top-0 left-0 w-full -z-10 pointer-events-none" aria-hidden />;
+}
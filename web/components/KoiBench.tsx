@@ -0,0 +1,102 @@
+"use client";
+import { useEffect, useRef, useState } from "react";
+import KoiBackground, { canRenderInWorker } from "@/components/KoiBackground";
+
+type Mode = "worker" | "main";
+const MODES: Mode[] = ["worker", "main"];
+const SAMPLE_MS = 5000;
+// A main-thread frame longer than this is visible as jank in scrolling and the player UI
+const LONG_FRAME_MS = 50;
+
+type RendererStats = { renderer: Mode; frames: number; meanMs: number; p95Ms: number; maxMs: number };
+type Result = { drawMeanMs: number; drawP95Ms: number; frameP95Ms: number; longFrames: number };
+
+function percentile(sorted: number[], p: number): number {
+  return sorted.length ? sorted[Math.min(sorted.length - 1, Math.floor(sorted.length * p))] : 0;
+}
+
+// Runs the comet field for SAMPLE_MS in each renderer and compares the time spent drawing
+// with the main thread's own frame intervals. In worker mode drawing happens off the main
+// thread, so its frame intervals should stay at the display's refresh rate.
+export default function KoiBench() {
+  const [running, setRunning] = useState<Mode | null>(null);
+  const [results, setResults] = useState<Partial<Record<Mode, Result>>>({});
+  const [supported, setSupported] = useState<boolean | null>(null);
+  const latest = useRef<RendererStats | null>(null);
+
+  useEffect(() => setSupported(canRenderInWorker()), []);
+
+  useEffect(() => {
+    if (!running) return;
+    latest.current = null;
+    const deltas: number[] = [];
+    let last = performance.now();
+    let id = requestAnimationFrame(function frame(now) {
+      deltas.push(now - last);
+      last = now;
+      id = requestAnimationFrame(frame);
+    });
+    const done = setTimeout(() => {
+      const stats = latest.current;
+      const sorted = deltas.slice(1).sort((a, b) => a - b);
+      setResults((r) => ({
+        ...r,
+        [running]: {
+          drawMeanMs: stats?.meanMs ?? 0,
+          drawP95Ms: stats?.p95Ms ?? 0,
+          frameP95Ms: percentile(sorted, 0.95),
+          longFrames: sorted.filter((d) => d > LONG_FRAME_MS).length,
+        },
+      }));
+      setRunning(MODES[MODES.indexOf(running) + 1] ?? null);
+    }, SAMPLE_MS);
+    return () => {
+      cancelAnimationFrame(id);
+      clearTimeout(done);
+    };
+  }, [running]);
+
+  const start = () => {
+    setResults({});
+    setRunning(canRenderInWorker() ? "worker" : "main");
+  };
+
+  return (
+    <>
+      {running ? <KoiBackground key={running} mode={running} onStats={(s: RendererStats) => (latest.current = s)} /> : null}
+      <main className="relative mx-auto max-w-3xl px-4 py-10 space-y-6 text-sm">
+        <div className="flex items-center gap-4">
+          <button onClick={start} disabled={Boolean(running)} className="px-3 py-2 rounded-md bg-white/10 hover:bg-white/20 disabled:opacity-50">
+            {running ? `Sampling ${running}…` : "Run comparison"}
+          </button>
+          <span className="text-white/60">OffscreenCanvas in a worker: {supported === null ? "…" : supported ? "supported" : "not supported"}</span>
+        </div>
+        <table className="w-full text-left">
+          <thead className="text-white/60">
+            <tr>
+              <th className="py-1">renderer</th>
+              <th>draw mean</th>
+              <th>draw p95</th>
+              <th>main-thread frame p95</th>
+              <th>frames &gt; {LONG_FRAME_MS} ms</th>
+            </tr>
+          </thead>
+          <tbody>
+            {MODES.map((mode) => {
+              const r = results[mode];
+              return (
+                <tr key={mode}>
+                  <td className="py-1">{mode}</td>
+                  <td>{r ? `${r.drawMeanMs.toFixed(2)} ms` : "–"}</td>
+                  <td>{r ? `${r.drawP95Ms.toFixed(2)} ms` : "–"}</td>
+                  <td>{r ? `${r.frameP95Ms.toFixed(1)} ms` : "–"}</td>
+                  <td>{r ? r.longFrames : "–"}</td>
+                </tr>
+              );
+            })}
+          </tbody>
+        </table>
+      </main>
+    </>
+  );
+}
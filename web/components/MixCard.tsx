@@ -1,8 +1,9 @@
 "use client";
 import Link from "next/link";
 import Image from "next/image";
-import { useRef } from "react";
 import { useNowPlaying } from "@/components/NowPlayingContext";
+import { preloadYouTubeApi } from "@/lib/youtubeManager";
+import type { QueueItem } from "@/lib/queue";
 
 export type Mix = {
   id: string;
@@ -10,7 +11,12 @@ export type Mix = {
   description?: string;
   cover?: string;
   audioUrl?: string;
-  embed?: { type: "youtube" | "soundcloud"; url: string };
+  gainDb?: number;
+  peaks?: string;
+  // Canonical YouTube id and embed offsets from the content index (see lib/embed.ts)
+  videoId?: string;
+  startSeconds?: number;
+  endSeconds?: number;
   genre?: string;
   mood?: string;
   duration?: string;
@@ -20,42 +26,24 @@ export type Mix = {
 type Props = { mix: Mix; href?: string };
 
 export default function MixCard({ mix, href }: Props) {
-  const audioRef = useRef<HTMLAudioElement | null>(null);
-  const { requestPlayAudio, requestPlayYouTube } = useNowPlaying();
+  const { playFromManifest } = useNowPlaying();
 
-  const getYouTubeId = (url?: string) => {
-    if (!url) return null;
-    try {
-      const u = new URL(url);
-      if (u.hostname === "youtu.be") return u.pathname.slice(1);
-      if (u.searchParams.get("v")) return u.searchParams.get("v");
-      // Fallback for embed URLs
-      const parts = u.pathname.split("/").filter(Boolean);
-      const i = parts.findIndex((p) => p === "embed");
-      if (i >= 0 && parts[i + 1]) return parts[i + 1];
-    } catch {}
+  const queueItem = (): QueueItem | null => {
+    if (mix.audioUrl) return { type: "audio", id: mix.audioUrl, title: mix.title, slug: mix.id, src: mix.audioUrl, gainDb: mix.gainDb, peaks: mix.peaks };
+    if (mix.videoId) return { type: "youtube", id: mix.videoId, title: mix.title, slug: mix.id, startSeconds: mix.startSeconds, endSeconds: mix.endSeconds };
     return null;
   };
 
   const onPlay = async (e: React.MouseEvent) => {
     e.preventDefault();
     e.stopPropagation();
-    if (mix.audioUrl) {
-      const el = audioRef.current;
-      if (!el) return;
-      // Ensure src set before play
-      if (el.src !== mix.audioUrl) el.src = mix.audioUrl;
-      el.preload = "metadata";
-      await requestPlayAudio(el, { id: mix.audioUrl, title: mix.title });
-      return;
-    }
-    if (mix.embed?.type === "youtube") {
-      const vid = getYouTubeId(mix.embed.url);
-      if (vid) await requestPlayYouTube(vid, { title: mix.title });
-      return;
-    }
+    const item = queueItem();
+    // Playback continues through the following posts in the manifest
+    if (item) await playFromManifest(mix.id, item);
     // For other types (e.g., SoundCloud), fall back to navigating to the detail page if provided
   };
+  // Fetch the IFrame API script on first sign of intent rather than on page load
+  const onIntent = mix.videoId && !mix.audioUrl ? preloadYouTubeApi : undefined;
   const content = (
     <>
       <div className="relative aspect-video bg-black/40 group">
@@ -67,6 +55,9 @@ export default function MixCard({ mix, href }: Props) {
           type="button"
           onMouseDown={(e) => { e.preventDefault(); e.stopPropagation(); }}
           onClick={onPlay}
+          onPointerEnter={onIntent}
+          onFocus={onIntent}
+          onTouchStart={onIntent}
           aria-label="Play"
           className="absolute inset-0 flex items-center justify-center focus:outline-none"
         >
@@ -98,10 +89,6 @@ export default function MixCard({ mix, href }: Props) {
           {mix.duration ? <span>{mix.duration}</span> : null}
         </div>
       </div>
-      {/* Hidden audio element used to drive playback via NowPlayingContext */}
-      {mix.audioUrl ? (
-        <audio ref={audioRef} src={mix.audioUrl} preload="metadata" className="hidden" />
-      ) : null}
     </>
   );
 
@@ -0,0 +1,118 @@
+"use client";
+import { useEffect, useMemo, useState, type ReactNode } from "react";
+import type { Mix } from "@/components/MixCard";
+import VirtualMixGrid from "@/components/VirtualMixGrid";
+import FacetFilter, { emptySelection, type FacetSelection } from "@/components/FacetFilter";
+import { andInto, bitsetToIds, createBitset, orInto, type Bitset } from "@/lib/bitset";
+import type { FacetName } from "@/lib/facets";
+import type { ManifestEntry, PostsManifest } from "@/lib/manifest";
+import { loadFacets, loadPostsManifest, type DecodedFacets } from "@/lib/manifestClient";
+
+// `pager` is the page's own pagination; it is hidden while a filter is applied, since
+// filtered results come from the whole manifest rather than the current page.
+type Props = { mixes: Mix[]; pager?: ReactNode };
+
+function mixFromManifest(entry: ManifestEntry): Mix {
+  return {
+    id: entry.slug,
+    title: entry.title,
+    description: entry.excerpt,
+    cover: entry.cover,
+    audioUrl: entry.audioUrl,
+    gainDb: entry.gainDb,
+    peaks: entry.peaks,
+    videoId: entry.videoId,
+    startSeconds: entry.videoStart,
+    endSeconds: entry.videoEnd,
+    genre: entry.tags?.[0],
+    mood: entry.tags?.[1],
+    duration: entry.duration,
+    releaseDate: entry.date,
+  };
+}
+
+// OR within a facet, AND across facets; null when nothing is selected.
+function selectIds(facets: DecodedFacets, selected: FacetSelection, size: number): number[] | null {
+  let result: Bitset | null = null;
+  for (const facet of Object.keys(selected) as FacetName[]) {
+    if (!selected[facet].size) continue;
+    const union = createBitset(size);
+    selected[facet].forEach((value) => {
+      const bits = facets[facet].get(value);
+      if (bits) orInto(union, bits);
+    });
+    result = result ? andInto(result, union) : union;
+  }
+  return result ? bitsetToIds(result) : null;
+}
+
+export default function MixesBrowser({ mixes, pager }: Props) {
+  const [open, setOpen] = useState(false);
+  const [manifest, setManifest] = useState<PostsManifest | null>(null);
+  const [facets, setFacets] = useState<DecodedFacets | null>(null);
+  const [selected, setSelected] = useState<FacetSelection>(emptySelection);
+
+  // Facet data is only fetched once the panel is opened
+  useEffect(() => {
+    if (!open || facets) return;
+    let cancelled = false;
+    void loadPostsManifest().then(async (m) => {
+      if (!m) return;
+      const f = await loadFacets(m);
+      if (cancelled) return;
+      setManifest(m);
+      setFacets(f);
+    });
+    return () => {
+      cancelled = true;
+    };
+  }, [open, facets]);
+
+  const filtered = useMemo(() => {
+    if (!manifest || !facets) return null;
+    const ids = selectIds(facets, selected, manifest.posts.length);
+    return ids ? ids.map((id) => mixFromManifest(manifest.posts[id])) : null;
+  }, [manifest, facets, selected]);
+
+  const toggle = (facet: FacetName, value: string) => {
+    setSelected((s) => {
+      const next = new Set(s[facet]);
+      if (next.has(value)) next.delete(value);
+      else next.add(value);
+      return { ...s, [facet]: next };
+    });
+  };
+
+  const shown = filtered ?? mixes;
+  const clear = () => setSelected(emptySelection());
+
+  return (
+    <div className="space-y-6">
+      <div className="flex items-center justify-between">
+        <button
+          type="button"
+          aria-expanded={open}
+          onClick={() => setOpen((o) => !o)}
+          className="px-3 py-2 rounded-md bg-white/10 hover:bg-white/20 text-sm"
+        >
+          {open ? "Hide filters" : "Filter"}
+        </button>
+        {filtered ? (
+          <span className="flex items-center gap-3 text-xs text-white/60">
+            {open ? `${filtered.length} matching` : `Filters active · ${filtered.length} matching`}
+            {open ? null : (
+              <button type="button" onClick={clear} className="underline hover:text-white">
+                Clear
+              </button>
+            )}
+          </span>
+        ) : null}
+      </div>
+      {open && facets ? (
+        <FacetFilter facets={facets} selected={selected} onToggle={toggle} onClear={clear} />
+      ) : null}
+      <VirtualMixGrid mixes={shown} />
+      {filtered ? null : pager}
+    </div>
+  );
+}
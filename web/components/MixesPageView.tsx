@@ -0,0 +1,65 @@
+import Link from "next/link";
+import { notFound } from "next/navigation";
+import type { Mix } from "@/components/MixCard";
+import MixesBrowser from "@/components/MixesBrowser";
+import KoiBackground from "@/components/KoiBackground";
+import PrefetchRoute from "@/components/PrefetchRoute";
+import SearchBox from "@/components/SearchBox";
+import { getCoverFromEmbed, getListingPageCount, getPostListingsPage } from "@/lib/posts";
+
+export function mixesPageHref(page: number): string {
+  return page <= 1 ? "/mixes" : `/mixes/page/${page}`;
+}
+
+// Shared by /mixes and /mixes/page/[n]; each page only carries its own slice of posts.
+export default function MixesPageView({ page }: { page: number }) {
+  const posts = getPostListingsPage(page);
+  if (!posts) return notFound();
+  const pageCount = getListingPageCount();
+  const mixes: Mix[] = posts.map((p) => ({
+    id: p.slug,
+    title: p.title,
+    description: p.excerpt || undefined,
+    cover: getCoverFromEmbed(p) ?? undefined,
+    audioUrl: p.audioUrl ?? undefined,
+    videoId: p.videoId,
+    startSeconds: p.videoStart,
+    endSeconds: p.videoEnd,
+    genre: p.tags?.[0],
+    mood: p.tags?.[1],
+    duration: p.duration,
+    releaseDate: p.date,
+  }));
+
+  const pager =
+    pageCount > 1 ? (
+      <nav aria-label="Pagination" className="pt-4 flex items-center justify-between text-sm">
+        {page > 1 ? (
+          <Link href={mixesPageHref(page - 1)} className="px-4 py-2 rounded border border-white/30 text-white">← Newer</Link>
+        ) : <span />}
+        {page < pageCount ? (
+          <Link href={mixesPageHref(page + 1)} className="px-4 py-2 rounded border border-white/30 text-white">Older →</Link>
+        ) : null}
+      </nav>
+    ) : null;
+
+  return (
+    <>
+      <KoiBackground />
+      <div className="relative">
+        <div className="fixed inset-0 z-0 pointer-events-none bg-black/70 backdrop-blur-lg" />
+        <main className="relative z-10 mx-auto max-w-6xl px-4 py-10">
+          <div className="flex flex-col sm:flex-row sm:items-center sm:justify-between gap-4 mb-6">
+            <h1 className="text-2xl font-semibold">
+              All Mixes
+              {pageCount > 1 ? <span className="ml-3 text-sm font-normal text-white/60">Page {page} of {pageCount}</span> : null}
+            </h1>
+            <SearchBox />
+          </div>
+          <MixesBrowser mixes={mixes} pager={pager} />
+          {page < pageCount ? <PrefetchRoute href={mixesPageHref(page + 1)} /> : null}
+        </main>
+      </div>
+    </>
+  );
+}
@@ -1,20 +1,15 @@
 "use client";
-import { useNowPlaying } from "@/components/NowPlayingContext";
-import { useEffect, useState } from "react";
+import { useNowPlaying, usePlaybackTime } from "@/components/NowPlayingContext";
+import type { RepeatMode } from "@/lib/queue";
+import Waveform from "@/components/Waveform";
+
+const NEXT_REPEAT: Record<RepeatMode, RepeatMode> = { off: "all", all: "one", one: "off" };
 
 export default function NowPlayingBar() {
-  const { state, toggle, pauseAll, stop, seekBy, seekTo, next, prev, position, duration } = useNowPlaying();
+  const { state, toggle, pauseAll, stop, seekBy, seekTo, next, prev, setShuffle, setRepeat } = useNowPlaying();
   const title = state.current?.title ?? (state.current?.type === "audio" ? state.current?.id : state.current ? `YouTube ${state.current.id}` : "");
 
-  // We don't yet expose position/duration directly; poll using available sources
-  useEffect(() => {
-    let id: any;
-    id = setInterval(() => {
-      // Lightweight: rely on native audio timeupdate wired in context, but mirror here through queue index changes
-      // For robustness, we keep local slider state responsive; context handlers update underlying media
-    }, 1000);
-    return () => clearInterval(id);
-  }, [state.index, state.current?.type]);
+  const item = state.queue[state.index];
 
   if (!state.current) return null;
 
@@ -29,26 +24,39 @@ export default function NowPlayingBar() {
             <button onClick={(e) => { e.preventDefault(); e.stopPropagation(); toggle(); }} className="px-3 py-2 rounded-md bg-white/10 hover:bg-white/20 text-base" aria-label={state.playing ? "Pause" : "Play"} title={state.playing ? "Pause" : "Play"}>{state.playing ? "❚❚" : "►"}</button>
             <button onClick={(e) => { e.preventDefault(); e.stopPropagation(); seekBy(10); }} className="px-3 py-2 rounded-md bg-white/10 hover:bg-white/20 text-base" aria-label="Forward 10s" title="Forward 10s">+10s</button>
             <button onClick={(e) => { e.preventDefault(); e.stopPropagation(); next(); }} className="px-3 py-2 rounded-md bg-white/10 hover:bg-white/20 text-base" aria-label="Next" title="Next">⏭</button>
+            <button onClick={(e) => { e.preventDefault(); e.stopPropagation(); setShuffle(!state.shuffle); }} className={`px-3 py-2 rounded-md hover:bg-white/20 text-base ${state.shuffle ? "bg-white/25" : "bg-white/10"}`} aria-label="Shuffle" aria-pressed={state.shuffle} title="Shuffle">⇄</button>
+            <button onClick={(e) => { e.preventDefault(); e.stopPropagation(); setRepeat(NEXT_REPEAT[state.repeat]); }} className={`px-3 py-2 rounded-md hover:bg-white/20 text-base ${state.repeat !== "off" ? "bg-white/25" : "bg-white/10"}`} aria-label={`Repeat: ${state.repeat}`} title={`Repeat: ${state.repeat}`}>{state.repeat === "one" ? "↻1" : "↻"}</button>
             <button onClick={(e) => { e.preventDefault(); e.stopPropagation(); stop(); }} className="px-3 py-2 rounded-md bg-white/10 hover:bg-white/20 text-base" aria-label="Stop" title="Stop">■</button>
           </div>
         </div>
-        <div className="flex items-center gap-4">
-          <input
-            type="range"
-            className="w-full"
-            min={0}
-            max={Math.max(1, Math.floor(duration || 0))}
-            step={1}
-            value={Math.floor(position || 0)}
-            onChange={(e) => { e.preventDefault(); e.stopPropagation(); seekTo(Number(e.target.value)); }}
-          />
-          <div className="text-sm text-white/70 w-28 text-right">{fmt(position)} / {fmt(duration)}</div>
-        </div>
+        {item?.type === "audio" && item.peaks && state.current?.type === "audio" && state.current.id === item.id ? (
+          <Waveform peaks={item.peaks} active onSeek={seekTo} />
+        ) : null}
+        <SeekBar seekTo={seekTo} />
       </div>
     </div>
   );
 }
 
+// Isolated so clock ticks only re-render the slider and time label, not the whole bar
+function SeekBar({ seekTo }: { seekTo: (seconds: number) => void }) {
+  const { position, duration } = usePlaybackTime();
+  return (
+    <div className="flex items-center gap-4">
+      <input
+        type="range"
+        className="w-full"
+        min={0}
+        max={Math.max(1, Math.floor(duration || 0))}
+        step={1}
+        value={Math.floor(position || 0)}
+        onChange={(e) => { e.preventDefault(); e.stopPropagation(); seekTo(Number(e.target.value)); }}
+      />
+      <div className="text-sm text-white/70 w-28 text-right">{fmt(position)} / {fmt(duration)}</div>
+    </div>
+  );
+}
+
 function fmt(s: number) {
   const m = Math.floor((s || 0) / 60);
   const sec = Math.floor((s || 0) % 60).toString().padStart(2, "0");
@@ -1,6 +1,10 @@
 "use client";
-import React, { createContext, useContext, useEffect, useMemo, useRef, useState } from "react";
-import { ensureYouTubePlayer, pause as ytPause, play as ytPlay, getTimes as ytGetTimes, seekTo as ytSeekTo } from "@/lib/youtubeManager";
+import React, { createContext, useContext, useEffect, useMemo, useRef, useState, useSyncExternalStore } from "react";
+import { ensureYouTubePlayer, markPlayIntent, pause as ytPause, play as ytPlay, getTimes as ytGetTimes, seekTo as ytSeekTo, setActiveVideo, subscribe as ytSubscribe, warmYouTubePlayer } from "@/lib/youtubeManager";
+import { loadPostsManifest } from "@/lib/manifestClient";
+import { getPlaybackTime, getServerPlaybackTime, sampleClock, setClockRunning, setClockSource, setPlaybackTime, subscribePlaybackTime, type PlaybackTime } from "@/lib/playbackClock";
+import { canRouteThroughEngine, connectDeck, crossfadeDecks, resumeAudioEngine, setDeckGainDb, setDeckLevel } from "@/lib/audioEngine";
+import { neighbourIndex, queueItemsFromManifest, sameItem, shuffleUpcoming, type QueueItem, type RepeatMode } from "@/lib/queue";
 
 export type NowPlayingKind =
   | { type: "audio"; id: string; title?: string; el: HTMLAudioElement | null }
@@ -9,14 +13,21 @@ export type NowPlayingKind =
 export type NowPlayingState = {
   current: NowPlayingKind | null;
   playing: boolean;
-  queue: NowPlayingKind[];
+  queue: QueueItem[];
   index: number; // index within queue for current
+  shuffle: boolean;
+  repeat: RepeatMode;
 };
 
 type Ctx = {
   state: NowPlayingState;
   requestPlayAudio: (el: HTMLAudioElement, meta: { id: string; title?: string }) => Promise<void>;
-  requestPlayYouTube: (videoId: string, meta: { title?: string; startSeconds?: number }) => Promise<void>;
+  requestPlayYouTube: (videoId: string, meta: { title?: string; startSeconds?: number; endSeconds?: number }) => Promise<void>;
+  playList: (items: QueueItem[], startIndex?: number) => Promise<void>;
+  playFromManifest: (slug: string, item: QueueItem) => Promise<void>;
+  enqueue: (items: QueueItem | QueueItem[]) => void;
+  setShuffle: (on: boolean) => void;
+  setRepeat: (mode: RepeatMode) => void;
   toggle: () => void;
   pauseAll: () => void;
   stop: () => void;
@@ -24,53 +35,326 @@ type Ctx = {
   seekTo: (seconds: number) => void;
   next: () => void;
   prev: () => void;
-  position: number;
-  duration: number;
 };
 
+// How long before the current item ends the next one is warmed up
+export const DEFAULT_PRELOAD_AHEAD_SECONDS = 30;
+// Overlap between consecutive direct-audio items; 0 switches decks when the current one ends.
+// NEXT_PUBLIC_CROSSFADE_SECONDS overrides it for the whole site.
+export const DEFAULT_CROSSFADE_SECONDS = (() => {
+  const fromEnv = Number(process.env.NEXT_PUBLIC_CROSSFADE_SECONDS);
+  return Number.isFinite(fromEnv) && fromEnv >= 0 ? fromEnv : 4;
+})();
+// How far ahead of the fade a precise timer is armed; timeupdate fires only every ~250 ms
+const CROSSFADE_ARM_SECONDS = 2;
+
 const NowPlayingContext = createContext<Ctx | null>(null);
 
-export function NowPlayingProvider({ children }: { children: React.ReactNode }) {
-  const [state, setState] = useState<NowPlayingState>({ current: null, playing: false, queue: [], index: -1 });
+type AudioItem = Extract<QueueItem, { type: "audio" }>;
+type YouTubeItem = Extract<QueueItem, { type: "youtube" }>;
+// `routed` decks play through lib/audioEngine; plain ones are used for cross-origin files
+type Deck = { el: HTMLAudioElement; src: string; routed: boolean };
+
+type ProviderProps = {
+  children: React.ReactNode;
+  preloadAheadSeconds?: number;
+  crossfadeSeconds?: number;
+};
+
+export function NowPlayingProvider({ children, preloadAheadSeconds = DEFAULT_PRELOAD_AHEAD_SECONDS, crossfadeSeconds = DEFAULT_CROSSFADE_SECONDS }: ProviderProps) {
+  const [state, setState] = useState<NowPlayingState>({ current: null, playing: false, queue: [], index: -1, shuffle: false, repeat: "off" });
+  // Event handlers (ended, manifest arrival) run outside render and need the latest state
+  const stateRef = useRef(state);
+  stateRef.current = state;
   const audioRef = useRef<HTMLAudioElement | null>(null);
-  const [position, setPosition] = useState(0);
-  const [duration, setDuration] = useState(0);
+  // Provider-owned <audio> decks in pairs: one plays, the other holds the warmed-up next item
+  const decksRef = useRef<{ routed: Deck[]; plain: Deck[] }>({ routed: [], plain: [] });
+  const activeDeckRef = useRef<Deck | null>(null);
+  // Pauses the outgoing deck once a crossfade has finished
+  const fadeTimerRef = useRef<ReturnType<typeof setTimeout> | null>(null);
+  // Starts the next crossfade at the exact moment it is due
+  const crossfadeTimerRef = useRef<ReturnType<typeof setTimeout> | null>(null);
+  // When the outgoing item ended, for the development handoff report
+  const endedAtRef = useRef<number | null>(null);
+  // Queue order from before shuffle was switched on, restored when it is switched off
+  const unshuffledRef = useRef<QueueItem[] | null>(null);
+
+  const getDecks = (routed: boolean): Deck[] => {
+    const pair = routed ? decksRef.current.routed : decksRef.current.plain;
+    if (!pair.length) {
+      for (let i = 0; i < 2; i++) {
+        const el = new Audio();
+        el.preload = "metadata";
+        pair.push({ el, src: "", routed: routed && connectDeck(el) });
+      }
+    }
+    return pair;
+  };
+
+  const decksFor = (src: string) => getDecks(canRouteThroughEngine(src));
+
+  const spareDeckFor = (src: string): Deck => {
+    const decks = decksFor(src);
+    return decks.find((d) => d !== activeDeckRef.current) ?? decks[0];
+  };
+
+  const stopFade = () => {
+    if (fadeTimerRef.current) clearTimeout(fadeTimerRef.current);
+    fadeTimerRef.current = null;
+  };
+
+  const cancelCrossfade = () => {
+    if (crossfadeTimerRef.current) clearTimeout(crossfadeTimerRef.current);
+    crossfadeTimerRef.current = null;
+  };
 
   const pauseAll = () => {
-    const cur = state.current;
+    const cur = stateRef.current.current;
     if (!cur) return;
     if (cur.type === "audio") {
       cur.el?.pause?.();
+      // A crossfade may still have the outgoing deck playing, or be about to start
+      stopFade();
+      cancelCrossfade();
+      for (const d of [...decksRef.current.routed, ...decksRef.current.plain]) d.el.pause();
     } else if (cur.type === "youtube") {
       ytPause(cur.id);
     }
     setState((s) => ({ ...s, playing: false }));
   };
 
-  const requestPlayAudio = async (el: HTMLAudioElement, meta: { id: string; title?: string }) => {
+  const onEnded = () => {
+    endedAtRef.current = performance.now();
+    const s = stateRef.current;
+    const item = s.queue[s.index];
+    if (s.repeat === "one" && item) {
+      void playItem(item, s.queue, s.index);
+      return;
+    }
+    const ni = neighbourIndex(s.queue.length, s.index, 1, s.repeat);
+    if (ni < 0) {
+      endedAtRef.current = null;
+      setState((x) => ({ ...x, playing: false }));
+      return;
+    }
+    void playItem(s.queue[ni], s.queue, ni);
+  };
+  const onEndedRef = useRef(onEnded);
+  onEndedRef.current = onEnded;
+
+  const startAudio = async (el: HTMLAudioElement, item: AudioItem, queue: QueueItem[], index: number, reload: boolean) => {
     pauseAll();
     audioRef.current = el;
-    // wire time updates
-    el.onloadedmetadata = () => setDuration(el.duration || 0);
-    el.ontimeupdate = () => setPosition(el.currentTime || 0);
+    // The shared clock samples while playing; metadata arrival is published straight away
+    el.onloadedmetadata = () => sampleClock();
+    el.onended = () => onEndedRef.current();
+    el.ontimeupdate = () => onTimeUpdateRef.current(el);
+    reportHandoff(el);
+    const current: NowPlayingKind = { type: "audio", id: item.id, title: item.title, el };
     try {
-      el.load();
+      if (reload) el.load();
       const p = el.play();
       if (p && typeof (p as any).then === "function") await p;
-      setState({ current: { type: "audio", id: meta.id, title: meta.title, el }, playing: true, queue: [{ type: "audio", id: meta.id, title: meta.title, el }], index: 0 });
+      setState((s) => ({ ...s, current, playing: true, queue, index }));
     } catch {
-      setState({ current: { type: "audio", id: meta.id, title: meta.title, el }, playing: false, queue: [{ type: "audio", id: meta.id, title: meta.title, el }], index: 0 });
+      setState((s) => ({ ...s, current, playing: false, queue, index }));
     }
   };
 
-  const requestPlayYouTube = async (videoId: string, meta: { title?: string; startSeconds?: number }) => {
+  const startYouTube = async (item: YouTubeItem, queue: QueueItem[], index: number) => {
+    const videoId = item.id;
+    markPlayIntent(videoId);
+    endedAtRef.current = null;
+    // Pinned before anything else can warm up a player and evict or displace it
+    setActiveVideo(videoId);
     pauseAll();
     await ensureYouTubePlayer(videoId);
-    if (typeof meta.startSeconds === 'number') {
-      ytSeekTo(videoId, meta.startSeconds);
+    // The offset goes into the load itself rather than a seek after playback starts
+    ytPlay(videoId, { startSeconds: item.startSeconds, endSeconds: item.endSeconds });
+    setState((s) => ({ ...s, current: { type: "youtube", id: videoId, title: item.title }, playing: true, queue, index }));
+  };
+
+  // Plays a queue item on a provider deck, reusing the deck that already buffered it
+  const playItem = async (item: QueueItem, queue: QueueItem[], index: number) => {
+    if (item.type === "youtube") return startYouTube(item, queue, index);
+    const decks = decksFor(item.src);
+    const active = activeDeckRef.current;
+    const deck = decks.find((d) => d.src === item.src) ?? (active && decks.includes(active) ? active : decks[0]);
+    activeDeckRef.current = deck;
+    if (deck.src !== item.src) {
+      deck.src = item.src;
+      deck.el.src = item.src;
+    } else if (deck.el.ended) {
+      deck.el.currentTime = 0;
+    }
+    if (typeof item.startSeconds === "number") deck.el.currentTime = item.startSeconds;
+    if (deck.routed) {
+      resumeAudioEngine();
+      setDeckLevel(deck.el, 1);
+    }
+    setDeckGainDb(deck.el, item.gainDb ?? 0);
+    return startAudio(deck.el, item, queue, index, false);
+  };
+
+  // Starts the warmed-up next deck under the tail of the current one and hands over to it
+  // Development check of each transition: how much of the outgoing item was left when the
+  // incoming one started producing audio, or how long the silence between them lasted.
+  const reportHandoff = (to: HTMLAudioElement, from?: HTMLAudioElement) => {
+    if (process.env.NODE_ENV === "production") return;
+    to.addEventListener(
+      "playing",
+      () => {
+        const endedAt = endedAtRef.current;
+        endedAtRef.current = null;
+        if (from && !from.ended) console.info(`[audio] crossfade overlap ${(from.duration - from.currentTime).toFixed(3)} s`);
+        else if (endedAt !== null) console.info(`[audio] handoff gap ${Math.round(performance.now() - endedAt)} ms`);
+      },
+      { once: true }
+    );
+  };
+
+  const crossfadeInto = (from: Deck, to: Deck, item: AudioItem, queue: QueueItem[], index: number, seconds: number) => {
+    stopFade();
+    cancelCrossfade();
+    reportHandoff(to.el, from.el);
+    from.el.onended = null;
+    from.el.ontimeupdate = null;
+    activeDeckRef.current = to;
+    audioRef.current = to.el;
+    to.el.onloadedmetadata = () => sampleClock();
+    to.el.onended = () => onEndedRef.current();
+    to.el.ontimeupdate = () => onTimeUpdateRef.current(to.el);
+    if (to.el.ended) to.el.currentTime = 0;
+    setDeckGainDb(to.el, item.gainDb ?? 0);
+    resumeAudioEngine();
+    crossfadeDecks(from.el, to.el, seconds);
+    void to.el.play()?.catch(() => setState((s) => ({ ...s, playing: false })));
+    fadeTimerRef.current = setTimeout(() => {
+      fadeTimerRef.current = null;
+      from.el.pause();
+    }, seconds * 1000 + 250);
+    const current: NowPlayingKind = { type: "audio", id: item.id, title: item.title, el: to.el };
+    setState((s) => ({ ...s, current, playing: true, queue, index }));
+  };
+
+  // The warmed-up deck `el` can fade into, or null when this transition cannot crossfade
+  const crossfadeTarget = (el: HTMLAudioElement) => {
+    const s = stateRef.current;
+    const from = activeDeckRef.current;
+    if (crossfadeSeconds <= 0 || fadeTimerRef.current || s.repeat === "one" || !from || from.el !== el || !from.routed || el.paused) return null;
+    const ni = neighbourIndex(s.queue.length, s.index, 1, s.repeat);
+    const upcoming = ni >= 0 ? s.queue[ni] : null;
+    if (!upcoming || upcoming.type !== "audio" || upcoming.src === from.src) return null;
+    const to = decksFor(upcoming.src).find((d) => d !== from && d.src === upcoming.src);
+    // Only fade into a deck that was warmed up and routed through the engine
+    if (!to || !to.routed) return null;
+    return { from, to, upcoming, queue: s.queue, index: ni };
+  };
+
+  // timeupdate only arms a timer for the fade's start; at ~4 Hz it would start up to 250 ms late
+  const scheduleCrossfade = (el: HTMLAudioElement) => {
+    if (crossfadeTimerRef.current) return;
+    const remaining = el.duration - el.currentTime;
+    if (!(remaining > 0) || remaining > crossfadeSeconds + CROSSFADE_ARM_SECONDS || !crossfadeTarget(el)) return;
+    const delay = (Math.max(0, remaining - crossfadeSeconds) * 1000) / (el.playbackRate || 1);
+    crossfadeTimerRef.current = setTimeout(() => {
+      crossfadeTimerRef.current = null;
+      const target = crossfadeTarget(el);
+      const left = el.duration - el.currentTime;
+      // A seek back while waiting leaves it to the next timeupdate to re-arm
+      if (!target || !(left > 0) || left > crossfadeSeconds + 0.1) return;
+      crossfadeInto(target.from, target.to, target.upcoming, target.queue, target.index, left);
+    }, delay);
+  };
+
+  // timeupdate keeps firing in background tabs, where the rAF clock is paused
+  const onTimeUpdate = (el: HTMLAudioElement) => {
+    if (el !== audioRef.current) return;
+    if (document.visibilityState === "hidden") sampleClock();
+    scheduleCrossfade(el);
+  };
+  const onTimeUpdateRef = useRef(onTimeUpdate);
+  onTimeUpdateRef.current = onTimeUpdate;
+
+  const requestPlayAudio = async (el: HTMLAudioElement, meta: { id: string; title?: string }) => {
+    unshuffledRef.current = null;
+    const item: AudioItem = { type: "audio", id: meta.id, title: meta.title, src: el.currentSrc || el.src };
+    await startAudio(el, item, [item], 0, true);
+  };
+
+  const requestPlayYouTube = async (videoId: string, meta: { title?: string; startSeconds?: number; endSeconds?: number }) => {
+    // The post player's button asks again for the video that is already current: pause or
+    // resume it in place rather than starting over at the embed offset
+    const cur = stateRef.current.current;
+    if (cur?.type === "youtube" && cur.id === videoId) {
+      if (stateRef.current.playing) ytPause(videoId);
+      else ytPlay(videoId);
+      setState((s) => ({ ...s, playing: !s.playing }));
+      return;
+    }
+    unshuffledRef.current = null;
+    const item: YouTubeItem = { type: "youtube", id: videoId, title: meta.title, startSeconds: meta.startSeconds, endSeconds: meta.endSeconds };
+    await startYouTube(item, [item], 0);
+  };
+
+  const playList = async (items: QueueItem[], startIndex = 0) => {
+    if (!items.length) return;
+    const index = Math.max(0, Math.min(items.length - 1, startIndex));
+    let queue = items;
+    unshuffledRef.current = null;
+    if (stateRef.current.shuffle) {
+      unshuffledRef.current = items;
+      queue = shuffleUpcoming(items, index);
+    }
+    await playItem(queue[index], queue, index);
+  };
+
+  // Starts `item` right away (keeping the click's user activation for autoplay), then widens
+  // the queue to every playable post in the manifest once it has loaded.
+  const playFromManifest = async (slug: string, item: QueueItem) => {
+    const started = playList([item], 0);
+    const manifest = await loadPostsManifest();
+    await started;
+    if (!manifest) return;
+    const items = queueItemsFromManifest(manifest);
+    const index = items.findIndex((it) => it.slug === slug && sameItem(it, item));
+    if (index < 0) return;
+    const shuffle = stateRef.current.shuffle;
+    const queue = shuffle ? shuffleUpcoming(items, index) : items;
+    unshuffledRef.current = shuffle ? items : null;
+    // Leave the queue alone if the listener already moved on to something else
+    setState((s) => (s.queue.length === 1 && sameItem(s.queue[s.index], item) ? { ...s, queue, index } : s));
+  };
+
+  const enqueue = (items: QueueItem | QueueItem[]) => {
+    const added = Array.isArray(items) ? items : [items];
+    if (!added.length) return;
+    const s = stateRef.current;
+    if (!s.current) {
+      void playList(added, 0);
+      return;
+    }
+    if (unshuffledRef.current) unshuffledRef.current = [...unshuffledRef.current, ...added];
+    const queue = [...s.queue, ...added];
+    setState((x) => ({ ...x, queue: x.shuffle ? shuffleUpcoming(queue, x.index) : queue }));
+  };
+
+  const setShuffle = (on: boolean) => {
+    const s = stateRef.current;
+    if (on === s.shuffle) return;
+    if (on) {
+      unshuffledRef.current = s.queue;
+      setState((x) => ({ ...x, shuffle: true, queue: shuffleUpcoming(s.queue, s.index) }));
+      return;
     }
-    ytPlay(videoId);
-    setState({ current: { type: "youtube", id: videoId, title: meta.title }, playing: true, queue: [{ type: "youtube", id: videoId, title: meta.title }], index: 0 });
+    const original = unshuffledRef.current ?? s.queue;
+    unshuffledRef.current = null;
+    const index = original.findIndex((it) => sameItem(it, s.queue[s.index]));
+    setState((x) => ({ ...x, shuffle: false, queue: original, index: index >= 0 ? index : x.index }));
+  };
+
+  const setRepeat = (mode: RepeatMode) => {
+    setState((s) => ({ ...s, repeat: mode }));
   };
 
   const toggle = () => {
@@ -99,13 +383,14 @@ export function NowPlayingProvider({ children }: { children: React.ReactNode })
       const el = audioRef.current;
       if (!el) return;
       const next = Math.max(0, Math.min((el.duration || 0), (el.currentTime || 0) + delta));
+      cancelCrossfade();
       el.currentTime = next;
-      setPosition(next);
+      setPlaybackTime(next);
     } else if (cur.type === "youtube") {
       const times = ytGetTimes(cur.id);
       const next = Math.max(0, Math.min(times.duration, times.current + delta));
       ytSeekTo(cur.id, next);
-      setPosition(next);
+      setPlaybackTime(next);
     }
   };
 
@@ -115,52 +400,80 @@ export function NowPlayingProvider({ children }: { children: React.ReactNode })
     if (cur.type === "audio") {
       const el = audioRef.current;
       if (!el) return;
+      cancelCrossfade();
       el.currentTime = seconds;
-      setPosition(seconds);
+      setPlaybackTime(seconds);
     } else if (cur.type === "youtube") {
       ytSeekTo(cur.id, seconds);
-      setPosition(seconds);
+      setPlaybackTime(seconds);
     }
   };
 
-  const next = () => {
-    if (state.queue.length <= 1) return;
-    const ni = Math.min(state.queue.length - 1, state.index + 1);
-    const item = state.queue[ni];
-    if (item.type === "audio") {
-      const el = (item as any).el as HTMLAudioElement | null;
-      if (el) void requestPlayAudio(el, { id: item.id, title: item.title });
-    } else {
-      void requestPlayYouTube(item.id, { title: item.title });
-    }
-    setState((s) => ({ ...s, index: ni }));
+  const step = (dir: 1 | -1) => {
+    const s = stateRef.current;
+    const ni = neighbourIndex(s.queue.length, s.index, dir, s.repeat);
+    if (ni < 0 || ni === s.index) return;
+    void playItem(s.queue[ni], s.queue, ni);
   };
 
-  const prev = () => {
-    if (state.queue.length <= 1) return;
-    const pi = Math.max(0, state.index - 1);
-    const item = state.queue[pi];
-    if (item.type === "audio") {
-      const el = (item as any).el as HTMLAudioElement | null;
-      if (el) void requestPlayAudio(el, { id: item.id, title: item.title });
+  const next = () => step(1);
+  const prev = () => step(-1);
+
+  // YouTube reports the end of a video through its state events rather than an ended handler
+  useEffect(() => {
+    const cur = state.current;
+    if (!cur || cur.type !== "youtube") return;
+    return ytSubscribe(cur.id, (evt) => {
+      if (evt.type === "state" && evt.data === 0) onEndedRef.current();
+    });
+  }, [state.current]);
+
+  // Warm up the next item shortly before the current one ends so the transition is near-instant
+  useEffect(() => {
+    if (!state.playing || state.repeat === "one") return;
+    const ni = neighbourIndex(state.queue.length, state.index, 1, state.repeat);
+    const candidate = ni >= 0 ? state.queue[ni] : null;
+    if (!candidate || sameItem(candidate, state.queue[state.index])) return;
+    const upcoming: QueueItem = candidate;
+    // Leave time for the next file to buffer before a crossfade would start
+    const lead = Math.max(preloadAheadSeconds, crossfadeSeconds + 5);
+    let warmed = false;
+    const check = () => {
+      if (warmed) return;
+      const { position, duration } = getPlaybackTime();
+      if (!(duration > 0) || duration - position > lead) return;
+      warmed = true;
+      if (upcoming.type === "youtube") {
+        warmYouTubePlayer(upcoming.id);
+        return;
+      }
+      const spare = spareDeckFor(upcoming.src);
+      if (spare.src === upcoming.src) return;
+      spare.src = upcoming.src;
+      spare.el.preload = "auto";
+      spare.el.src = upcoming.src;
+    };
+    check();
+    return subscribePlaybackTime(check);
+  }, [state.playing, state.queue, state.index, state.repeat, preloadAheadSeconds, crossfadeSeconds]);
+
+  // Point the shared playback clock at whatever is loaded; it samples once per frame while playing
+  useEffect(() => {
+    const cur = state.current;
+    setActiveVideo(cur?.type === "youtube" ? cur.id : null);
+    if (!cur) {
+      setClockSource(null);
+    } else if (cur.type === "youtube") {
+      setClockSource(() => ytGetTimes(cur.id));
     } else {
-      void requestPlayYouTube(item.id, { title: item.title });
+      const el = cur.el;
+      setClockSource(() => ({ current: el?.currentTime || 0, duration: el?.duration || 0 }));
     }
-    setState((s) => ({ ...s, index: pi }));
-  };
+  }, [state.current]);
 
-  // Keep position/duration updated for YouTube when active
   useEffect(() => {
-    let interval: any;
-    if (state.current?.type === "youtube") {
-      interval = setInterval(() => {
-        const t = ytGetTimes(state.current!.id);
-        setPosition(t.current);
-        setDuration(t.duration);
-      }, 500);
-    }
-    return () => interval && clearInterval(interval);
-  }, [state.current?.type, state.current && (state.current as any).id]);
+    setClockRunning(state.playing);
+  }, [state.playing]);
 
   useEffect(() => {
     const nav: any = typeof navigator !== 'undefined' ? navigator : null;
@@ -185,12 +498,17 @@ export function NowPlayingProvider({ children }: { children: React.ReactNode })
   useEffect(() => {
     const nav: any = typeof navigator !== 'undefined' ? navigator : null;
     if (!nav || !('mediaSession' in nav)) return;
-    if (typeof nav.mediaSession.setPositionState === 'function') {
+    if (typeof nav.mediaSession.setPositionState !== 'function') return;
+    // Subscribes to the clock directly so ticks don't re-render the provider
+    const update = () => {
+      const { position, duration } = getPlaybackTime();
       const dur = Number.isFinite(duration) ? duration : 0;
       const pos = Number.isFinite(position) ? position : 0;
       try { nav.mediaSession.setPositionState({ duration: Math.max(0, dur), playbackRate: 1, position: Math.max(0, pos) }); } catch {}
-    }
-  }, [position, duration, state.current && (state.current as any).id]);
+    };
+    update();
+    return subscribePlaybackTime(update);
+  }, [state.current && (state.current as any).id]);
 
   useEffect(() => {
     const nav: any = typeof navigator !== 'undefined' ? navigator : null;
@@ -205,13 +523,18 @@ export function NowPlayingProvider({ children }: { children: React.ReactNode })
   }, [toggle, seekBy, next, prev, stop]);
 
   const value = useMemo(
-    () => ({ state, requestPlayAudio, requestPlayYouTube, toggle, pauseAll, stop, seekBy, seekTo, next, prev, position, duration }),
-    [state, position, duration]
+    () => ({ state, requestPlayAudio, requestPlayYouTube, playList, playFromManifest, enqueue, setShuffle, setRepeat, toggle, pauseAll, stop, seekBy, seekTo, next, prev }),
+    [state]
   );
 
   return <NowPlayingContext.Provider value={value}>{children}</NowPlayingContext.Provider>;
 }
 
+// Only components that display time should use this; it re-renders on every clock tick.
+export function usePlaybackTime(): PlaybackTime {
+  return useSyncExternalStore(subscribePlaybackTime, getPlaybackTime, getServerPlaybackTime);
+}
+
 export function useNowPlaying() {
   const ctx = useContext(NowPlayingContext);
   if (!ctx) throw new Error("useNowPlaying must be used within NowPlayingProvider");
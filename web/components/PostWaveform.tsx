@@ -0,0 +1,34 @@
+"use client";
+import { useNowPlaying } from "@/components/NowPlayingContext";
+import Waveform from "@/components/Waveform";
+import type { QueueItem } from "@/lib/queue";
+
+type Props = {
+  slug: string;
+  title: string;
+  src: string;
+  peaks: string;
+  gainDb?: number;
+};
+
+// Waveform for a post's direct audio. Clicking seeks the shared player, or starts this post
+// from the clicked position when something else is loaded.
+export default function PostWaveform({ slug, title, src, peaks, gainDb }: Props) {
+  const { state, seekTo, playFromManifest } = useNowPlaying();
+  const active = state.current?.type === "audio" && state.current.id === src;
+
+  const onSeek = (seconds: number) => {
+    if (active) {
+      seekTo(seconds);
+      return;
+    }
+    const item: QueueItem = { type: "audio", id: src, title, slug, src, gainDb, peaks, startSeconds: seconds };
+    void playFromManifest(slug, item);
+  };
+
+  return (
+    <div className="w-full overflow-hidden rounded-md border border-white/10 bg-black/40 p-3">
+      <Waveform peaks={peaks} active={active} onSeek={onSeek} />
+    </div>
+  );
+}
@@ -0,0 +1,19 @@
+"use client";
+import { useEffect } from "react";
+import { useRouter } from "next/navigation";
+
+// Warms the router cache for a likely next navigation once the browser is idle.
+export default function PrefetchRoute({ href }: { href: string }) {
+  const router = useRouter();
+  useEffect(() => {
+    const w = window as any;
+    const run = () => router.prefetch(href);
+    if (typeof w.requestIdleCallback === "function") {
+      const id = w.requestIdleCallback(run, { timeout: 2000 });
+      return () => w.cancelIdleCallback(id);
+    }
+    const id = setTimeout(run, 500);
+    return () => clearTimeout(id);
+  }, [router, href]);
+  return null;
+}
@@ -0,0 +1,78 @@
+"use client";
+import { Profiler, useEffect, useMemo, useRef, useState } from "react";
+import MixCard from "@/components/MixCard";
+import type { Mix } from "@/components/MixCard";
+import { usePlaybackTime } from "@/components/NowPlayingContext";
+import { setPlaybackTime } from "@/lib/playbackClock";
+
+const CARD_COUNT = 100;
+
+const mixes: Mix[] = Array.from({ length: CARD_COUNT }, (_, i) => ({
+  id: `bench-${i}`,
+  title: `Bench mix ${i + 1}`,
+  genre: "House",
+  mood: "Chill",
+}));
+
+function TimeLabel() {
+  const { position, duration } = usePlaybackTime();
+  return <span>{position.toFixed(1)}s / {duration.toFixed(0)}s</span>;
+}
+
+type Rates = { cards: number; clock: number };
+
+// Counts commits per second for 100 cards vs. a time label while the clock ticks
+// at the YouTube poller's 2 Hz. Cards should stay at 0 renders/s.
+export default function RenderBench() {
+  const counts = useRef<Rates>({ cards: 0, clock: 0 });
+  const [rates, setRates] = useState<Rates>({ cards: 0, clock: 0 });
+  const [running, setRunning] = useState(false);
+
+  useEffect(() => {
+    if (!running) return;
+    let t = 0;
+    const tick = setInterval(() => {
+      t += 0.5;
+      setPlaybackTime(t, 3600);
+    }, 500);
+    counts.current = { cards: 0, clock: 0 };
+    const sample = setInterval(() => {
+      setRates(counts.current);
+      counts.current = { cards: 0, clock: 0 };
+    }, 1000);
+    return () => {
+      clearInterval(tick);
+      clearInterval(sample);
+    };
+  }, [running]);
+
+  // Stable element so the once-per-second rate update doesn't re-render the cards itself
+  const grid = useMemo(
+    () => (
+      <Profiler id="cards" onRender={() => counts.current.cards++}>
+        <div className="grid gap-6 sm:grid-cols-2 lg:grid-cols-3">
+          {mixes.map((m) => (
+            <MixCard key={m.id} mix={m} />
+          ))}
+        </div>
+      </Profiler>
+    ),
+    []
+  );
+
+  return (
+    <main className="mx-auto max-w-6xl px-4 py-10 space-y-6">
+      <div className="flex items-center gap-4 text-sm">
+        <button onClick={() => setRunning((r) => !r)} className="px-3 py-2 rounded-md bg-white/10 hover:bg-white/20">
+          {running ? "Stop clock" : "Start clock"}
+        </button>
+        <Profiler id="clock" onRender={() => counts.current.clock++}>
+          <TimeLabel />
+        </Profiler>
+        <span>cards: {rates.cards} renders/s</span>
+        <span>clock readers: {rates.clock} renders/s</span>
+      </div>
+      {grid}
+    </main>
+  );
+}
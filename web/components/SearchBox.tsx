@@ -0,0 +1,74 @@
+"use client";
+import Link from "next/link";
+import { useEffect, useRef, useState } from "react";
+import type { PostsManifest } from "@/lib/manifest";
+import { loadPostsManifest } from "@/lib/manifestClient";
+import { searchPosts, type SearchHit } from "@/lib/searchClient";
+
+const MAX_RESULTS = 20;
+
+export default function SearchBox() {
+  const [query, setQuery] = useState("");
+  const [manifest, setManifest] = useState<PostsManifest | null>(null);
+  const [hits, setHits] = useState<SearchHit[]>([]);
+  const requestId = useRef(0);
+
+  // The manifest is only fetched once the visitor shows interest in searching
+  const warmUp = () => {
+    if (!manifest) void loadPostsManifest().then(setManifest);
+  };
+
+  useEffect(() => {
+    if (!manifest || !query.trim()) {
+      setHits([]);
+      return;
+    }
+    const id = ++requestId.current;
+    const timer = setTimeout(() => {
+      void searchPosts(manifest, query).then((res) => {
+        // Drop results for queries that have since been replaced
+        if (id === requestId.current) setHits(res.slice(0, MAX_RESULTS));
+      });
+    }, 120);
+    return () => clearTimeout(timer);
+  }, [manifest, query]);
+
+  return (
+    <div className="relative w-full sm:w-80">
+      <input
+        type="search"
+        value={query}
+        onFocus={warmUp}
+        onPointerEnter={warmUp}
+        onChange={(e) => setQuery(e.target.value)}
+        placeholder="Search titles, tags, tracklists…"
+        aria-label="Search mixes"
+        className="w-full bg-black/50 border border-white/10 rounded px-3 py-2 text-sm outline-none focus:border-white/30"
+      />
+      {manifest && query.trim() ? (
+        <ul className="absolute z-30 mt-2 w-full max-h-96 overflow-auto rounded border border-white/10 bg-black/90 text-sm">
+          {hits.length ? (
+            hits.map((hit) => {
+              const post = manifest.posts[hit.postId];
+              return (
+                <li key={post.slug}>
+                  <Link href={`/posts/${post.slug}`} className="block px-3 py-2 hover:bg-white/10">
+                    <span className="block text-white">{post.title}</span>
+                    {hit.lines.length ? (
+                      <span className="block text-xs text-white/60">
+                        Tracklist #{hit.lines.slice(0, 5).map((l) => l + 1).join(", #")}
+                        {hit.lines.length > 5 ? "…" : ""}
+                      </span>
+                    ) : null}
+                  </Link>
+                </li>
+              );
+            })
+          ) : (
+            <li className="px-3 py-2 text-white/60">No matches</li>
+          )}
+        </ul>
+      ) : null}
+    </div>
+  );
+}
@@ -0,0 +1,78 @@
+"use client";
+import { useMemo, useSyncExternalStore } from "react";
+import { useNowPlaying } from "@/components/NowPlayingContext";
+import { getPlaybackTime, subscribePlaybackTime } from "@/lib/playbackClock";
+import type { QueueItem } from "@/lib/queue";
+import { buildTrackTimeline, findCurrentTrack, trackStart, type Track } from "@/lib/tracklist";
+
+type Props = {
+  tracks: Track[];
+  slug: string;
+  title: string;
+  audioUrl?: string;
+  gainDb?: number;
+  peaks?: string;
+  videoId?: string;
+  // Embed start offset; the stamps of a set embedded from this point count from it
+  videoStart?: number;
+};
+
+// A post's tracklist. While the post is playing the current track is highlighted, and
+// timestamps seek the shared player (or start the post from that point when it is not loaded).
+export default function Tracklist({ tracks, slug, title, audioUrl, gainDb, peaks, videoId, videoStart }: Props) {
+  const { state, seekTo, playFromManifest } = useNowPlaying();
+  const timeline = useMemo(() => buildTrackTimeline(tracks), [tracks]);
+  // Direct audio wins over the embed, as in the queue
+  const source: QueueItem | null = audioUrl
+    ? { type: "audio", id: audioUrl, title, slug, src: audioUrl, gainDb, peaks }
+    : videoId
+      ? { type: "youtube", id: videoId, title, slug }
+      : null;
+  const active = Boolean(source && state.current?.type === source.type && state.current.id === source.id);
+  const offset = source?.type === "youtube" ? videoStart ?? 0 : 0;
+  // Clock ticks only re-render when the result of the binary search changes
+  const current = useSyncExternalStore(
+    subscribePlaybackTime,
+    () => (active ? findCurrentTrack(timeline, getPlaybackTime().position - offset) : -1),
+    () => -1,
+  );
+
+  const onSeek = (stamp: number) => {
+    const seconds = stamp + offset;
+    if (active) {
+      seekTo(seconds);
+      return;
+    }
+    if (source) void playFromManifest(slug, { ...source, startSeconds: seconds });
+  };
+
+  return (
+    <ol className="list-decimal list-inside text-sm text-white/80 space-y-1">
+      {tracks.map((track, i) => {
+        const start = trackStart(tracks, i);
+        return (
+          <li key={i} className={i === current ? "text-white font-medium" : undefined} aria-current={i === current ? "true" : undefined}>
+            {start !== null && source ? (
+              <button
+                type="button"
+                onClick={() => onSeek(start)}
+                className="mr-2 font-mono text-xs text-white/60 hover:text-white tabular-nums"
+                aria-label={`Play from ${fmt(start)}`}
+              >
+                {fmt(start)}
+              </button>
+            ) : null}
+            {track.artist ? <span className="text-white/60">{track.artist} – </span> : null}
+            {track.title}
+          </li>
+        );
+      })}
+    </ol>
+  );
+}
+
+function fmt(s: number) {
+  const m = Math.floor(s / 60);
+  const sec = Math.floor(s % 60).toString().padStart(2, "0");
+  return `${m}:${sec}`;
+}
@@ -0,0 +1,196 @@
+"use client";
+import { useCallback, useEffect, useLayoutEffect, useMemo, useRef, useState } from "react";
+import MixCard from "@/components/MixCard";
+import type { Mix } from "@/components/MixCard";
+
+type Props = { mixes: Mix[] };
+
+const GAP = 24; // matches gap-6
+const ESTIMATED_ROW_HEIGHT = 340;
+const OVERSCAN_ROWS = 2;
+// Rendered before hydration (and in the exported HTML) while the viewport is unknown
+const INITIAL_ITEMS = 12;
+// Budget for the grid subtree; a 3-column window of ~8 rows stays well under this
+const DOM_NODE_BUDGET = 1500;
+
+// Avoids the server-render warning; layout effects only matter in the browser
+const useIsomorphicLayoutEffect = typeof window !== "undefined" ? useLayoutEffect : useEffect;
+
+const ARROW_STEPS: Record<string, (columns: number) => number> = {
+  ArrowRight: () => 1,
+  ArrowLeft: () => -1,
+  ArrowDown: (columns) => columns,
+  ArrowUp: (columns) => -columns,
+};
+
+// Same breakpoints as sm:grid-cols-2 lg:grid-cols-3
+function columnsFor(width: number): number {
+  if (width >= 1024) return 3;
+  if (width >= 640) return 2;
+  return 1;
+}
+
+type Layout = { columns: number; width: number; top: number; viewport: number; scroll: number };
+
+export default function VirtualMixGrid({ mixes }: Props) {
+  const containerRef = useRef<HTMLDivElement | null>(null);
+  const [layout, setLayout] = useState<Layout | null>(null);
+  const [rowHeight, setRowHeight] = useState(ESTIMATED_ROW_HEIGHT);
+  const [focusIndex, setFocusIndex] = useState<number | null>(null);
+  const pendingFocus = useRef<number | null>(null);
+
+  const measure = useCallback(() => {
+    const el = containerRef.current;
+    if (!el) return;
+    const rect = el.getBoundingClientRect();
+    const next: Layout = {
+      columns: columnsFor(window.innerWidth),
+      width: rect.width,
+      top: rect.top + window.scrollY,
+      viewport: window.innerHeight,
+      scroll: window.scrollY,
+    };
+    setLayout((prev) =>
+      prev && prev.columns === next.columns && prev.width === next.width && prev.top === next.top && prev.viewport === next.viewport && prev.scroll === next.scroll
+        ? prev
+        : next
+    );
+  }, []);
+
+  useIsomorphicLayoutEffect(() => {
+    measure();
+    let frame = 0;
+    // Coalesce scroll/resize bursts into one layout read per frame
+    const schedule = () => {
+      if (!frame) frame = requestAnimationFrame(() => { frame = 0; measure(); });
+    };
+    window.addEventListener("scroll", schedule, { passive: true });
+    window.addEventListener("resize", schedule);
+    const ro = new ResizeObserver(schedule);
+    if (containerRef.current) ro.observe(containerRef.current);
+    return () => {
+      window.removeEventListener("scroll", schedule);
+      window.removeEventListener("resize", schedule);
+      ro.disconnect();
+      cancelAnimationFrame(frame);
+    };
+  }, [measure]);
+
+  const columns = layout?.columns ?? 1;
+  const rows = Math.ceil(mixes.length / columns);
+  const stride = rowHeight + GAP;
+
+  const visible = useMemo(() => {
+    if (!layout) return { first: 0, last: -1, extra: null as number | null };
+    const offset = layout.scroll - layout.top;
+    const firstRow = Math.max(0, Math.floor(offset / stride) - OVERSCAN_ROWS);
+    const lastRow = Math.min(rows - 1, Math.ceil((offset + layout.viewport) / stride) + OVERSCAN_ROWS);
+    const first = firstRow * columns;
+    const last = Math.min(mixes.length - 1, (lastRow + 1) * columns - 1);
+    // Keep the focused card mounted so keyboard focus survives scrolling it out of view
+    const extra = focusIndex !== null && focusIndex < mixes.length && (focusIndex < first || focusIndex > last) ? focusIndex : null;
+    return { first, last, extra };
+  }, [layout, stride, rows, columns, mixes.length, focusIndex]);
+
+  // Grow the row height to the tallest mounted card so rows never overlap
+  useIsomorphicLayoutEffect(() => {
+    const el = containerRef.current;
+    if (!el || !layout) return;
+    let tallest = 0;
+    el.querySelectorAll<HTMLElement>("[data-index] > *").forEach((card) => {
+      tallest = Math.max(tallest, card.offsetHeight);
+    });
+    if (tallest > rowHeight) setRowHeight(tallest);
+  }, [visible, layout, rowHeight]);
+
+  useEffect(() => {
+    const i = pendingFocus.current;
+    if (i === null) return;
+    const target = containerRef.current?.querySelector<HTMLElement>(`[data-index="${i}"] a, [data-index="${i}"] button`);
+    if (target) {
+      pendingFocus.current = null;
+      target.focus({ preventScroll: true });
+    }
+  }, [visible]);
+
+  useEffect(() => {
+    if (process.env.NODE_ENV === "production" || !containerRef.current) return;
+    const nodes = containerRef.current.getElementsByTagName("*").length;
+    if (nodes > DOM_NODE_BUDGET) {
+      const heap = (performance as any).memory?.usedJSHeapSize;
+      console.warn(`VirtualMixGrid: ${nodes} DOM nodes mounted (budget ${DOM_NODE_BUDGET})${heap ? `, heap ${(heap / 1048576).toFixed(1)} MB` : ""}`);
+    }
+  }, [visible]);
+
+  const onKeyDown = (e: React.KeyboardEvent) => {
+    if (focusIndex === null) return;
+    const step = ARROW_STEPS[e.key];
+    if (!step) return;
+    const next = focusIndex + step(columns);
+    if (next < 0 || next >= mixes.length || !layout) return;
+    e.preventDefault();
+    const rowTop = layout.top + Math.floor(next / columns) * stride;
+    if (rowTop < window.scrollY || rowTop + rowHeight > window.scrollY + window.innerHeight) {
+      window.scrollTo({ top: rowTop - (window.innerHeight - rowHeight) / 2 });
+    }
+    pendingFocus.current = next;
+    setFocusIndex(next);
+  };
+
+  const onFocus = (e: React.FocusEvent) => {
+    const holder = (e.target as HTMLElement).closest<HTMLElement>("[data-index]");
+    if (holder) setFocusIndex(Number(holder.dataset.index));
+  };
+
+  if (!layout) {
+    return (
+      <div ref={containerRef} className="grid gap-6 sm:grid-cols-2 lg:grid-cols-3">
+        {mixes.slice(0, INITIAL_ITEMS).map((m) => (
+          <MixCard key={m.id} mix={m} href={`/posts/${m.id}`} />
+        ))}
+      </div>
+    );
+  }
+
+  const colWidth = (layout.width - GAP * (columns - 1)) / columns;
+  const indexes: number[] = [];
+  // The focused card goes in index order, so React never has to move its (focused) node
+  if (visible.extra !== null && visible.extra < visible.first) indexes.push(visible.extra);
+  for (let i = visible.first; i <= visible.last; i++) indexes.push(i);
+  if (visible.extra !== null && visible.extra > visible.last) indexes.push(visible.extra);
+
+  return (
+    <div
+      ref={containerRef}
+      role="list"
+      aria-rowcount={rows}
+      onKeyDown={onKeyDown}
+      onFocus={onFocus}
+      className="relative"
+      style={{ height: Math.max(0, rows * stride - GAP) }}
+    >
+      {indexes.map((i) => {
+        const m = mixes[i];
+        return (
+          // Keyed by mix so a card keeps its own node (and focus) while it stays mounted
+          <div
+            key={m.id}
+            role="listitem"
+            data-index={i}
+            aria-posinset={i + 1}
+            aria-setsize={mixes.length}
+            className="absolute"
+            style={{
+              top: Math.floor(i / columns) * stride,
+              left: (i % columns) * (colWidth + GAP),
+              width: colWidth,
+              height: rowHeight,
+            }}
+          >
+            <MixCard mix={m} href={`/posts/${m.id}`} />
+          </div>
+        );
+      })}
+    </div>
+  );
+}
@@ -0,0 +1,124 @@
+"use client";
+import { useEffect, useRef, useState } from "react";
+import { getPlaybackTime, subscribePlaybackTime } from "@/lib/playbackClock";
+import { loadPeaksForWidth } from "@/lib/waveform";
+
+type Props = {
+  peaks: string;
+  // Whether this audio is the one loaded in NowPlaying; only then does progress follow the clock
+  active: boolean;
+  onSeek?: (seconds: number) => void;
+  className?: string;
+};
+
+type Loaded = { peaks: Int8Array; duration: number };
+
+// Draws min/max columns for `width` device pixels straight from the Int8 pairs.
+function drawPeaks(canvas: HTMLCanvasElement, peaks: Int8Array, color: string) {
+  const ctx = canvas.getContext("2d");
+  if (!ctx) return;
+  const { width, height } = canvas;
+  const buckets = peaks.length / 2;
+  const mid = height / 2;
+  const scale = mid / 127;
+  ctx.clearRect(0, 0, width, height);
+  ctx.fillStyle = color;
+  for (let x = 0; x < width; x++) {
+    const from = Math.floor((x * buckets) / width);
+    const to = Math.max(from + 1, Math.floor(((x + 1) * buckets) / width));
+    let min = 127;
+    let max = -127;
+    for (let b = from; b < to && b < buckets; b++) {
+      if (peaks[2 * b] < min) min = peaks[2 * b];
+      if (peaks[2 * b + 1] > max) max = peaks[2 * b + 1];
+    }
+    if (max < min) continue;
+    const top = mid - max * scale;
+    ctx.fillRect(x, top, 1, Math.max(1, (max - min) * scale));
+  }
+}
+
+export default function Waveform({ peaks: id, active, onSeek, className }: Props) {
+  const boxRef = useRef<HTMLDivElement | null>(null);
+  const baseRef = useRef<HTMLCanvasElement | null>(null);
+  const playedRef = useRef<HTMLCanvasElement | null>(null);
+  const clipRef = useRef<HTMLDivElement | null>(null);
+  // Device pixels for the canvases, plus the CSS width the played canvas must keep when clipped
+  const [size, setSize] = useState<{ width: number; height: number; cssWidth: number } | null>(null);
+  const [loaded, setLoaded] = useState<Loaded | null>(null);
+
+  useEffect(() => {
+    const box = boxRef.current;
+    if (!box) return;
+    const measure = () => {
+      const dpr = window.devicePixelRatio || 1;
+      const rect = box.getBoundingClientRect();
+      const width = Math.round(rect.width * dpr);
+      const height = Math.round(rect.height * dpr);
+      setSize((s) => (s && s.width === width && s.height === height ? s : { width, height, cssWidth: rect.width }));
+    };
+    measure();
+    const ro = new ResizeObserver(measure);
+    ro.observe(box);
+    return () => ro.disconnect();
+  }, []);
+
+  // Only the zoom level the current width needs is fetched
+  useEffect(() => {
+    if (!size?.width) return;
+    let cancelled = false;
+    void loadPeaksForWidth(id, size.width).then((result) => {
+      if (!cancelled) setLoaded(result);
+    });
+    return () => {
+      cancelled = true;
+    };
+  }, [id, size?.width]);
+
+  useEffect(() => {
+    if (!loaded || !size) return;
+    for (const [canvas, color] of [[baseRef.current, "rgba(255,255,255,0.3)"], [playedRef.current, "rgba(255,255,255,0.9)"]] as const) {
+      if (!canvas) continue;
+      canvas.width = size.width;
+      canvas.height = size.height;
+      drawPeaks(canvas, loaded.peaks, color);
+    }
+  }, [loaded, size]);
+
+  // Progress is written straight to the clip box, so clock ticks never re-render the waveform
+  useEffect(() => {
+    const clip = clipRef.current;
+    if (!clip) return;
+    if (!active) {
+      clip.style.width = "0%";
+      return;
+    }
+    const update = () => {
+      const { position, duration } = getPlaybackTime();
+      const total = duration || loaded?.duration || 0;
+      clip.style.width = total > 0 ? `${Math.min(100, (position / total) * 100)}%` : "0%";
+    };
+    update();
+    return subscribePlaybackTime(update);
+  }, [active, loaded]);
+
+  const onClick = (e: React.MouseEvent<HTMLDivElement>) => {
+    e.preventDefault();
+    e.stopPropagation();
+    if (!onSeek || !loaded || !boxRef.current) return;
+    const rect = boxRef.current.getBoundingClientRect();
+    const fraction = Math.max(0, Math.min(1, (e.clientX - rect.left) / rect.width));
+    // The player's duration is exact; the one implied by the peaks is rounded up to a bucket
+    const total = (active && getPlaybackTime().duration) || loaded.duration;
+    onSeek(fraction * total);
+  };
+
+  return (
+    <div ref={boxRef} onClick={onClick} className={`relative h-12 w-full ${onSeek ? "cursor-pointer" : ""} ${className ?? ""}`}>
+      <canvas ref={baseRef} className="absolute inset-0 h-full w-full" aria-hidden />
+      <div ref={clipRef} className="absolute inset-y-0 left-0 overflow-hidden" style={{ width: 0 }}>
+        <canvas ref={playedRef} className="absolute inset-y-0 left-0 h-full" style={{ width: size ? `${size.cssWidth}px` : "100%" }} aria-hidden />
+      </div>
+    </div>
+  );
+}
@@ -1,7 +1,9 @@
 "use client";
 import { useEffect, useState } from "react";
-import { useNowPlaying } from "@/components/NowPlayingContext";
-import { ensureYouTubePlayer, subscribe, getTimes, seekTo } from "@/lib/youtubeManager";
+import Image from "next/image";
+import { useNowPlaying, usePlaybackTime } from "@/components/NowPlayingContext";
+import { setPlaybackTime } from "@/lib/playbackClock";
+import { ensureYouTubePlayer, subscribe, getTimes, seekTo, warmYouTubePlayer } from "@/lib/youtubeManager";
 
 declare global {
   interface Window {
@@ -11,63 +13,44 @@ declare global {
 }
 
 type Props = {
-  url: string;
+  // Canonical id from the content index; null when the embed URL was not recognised
+  videoId: string | null;
   title?: string;
+  cover?: string;
+  duration?: string;
+  // Embed offsets, normalized at build time by lib/embed.ts
+  startSeconds?: number;
+  endSeconds?: number;
 };
 
-function getStartSeconds(input: string): number | null {
-  try {
-    const u = new URL(input);
-    const t = u.searchParams.get("t");
-    if (!t) return null;
-    // supports seconds (e.g., 1928) or XmYs (e.g., 32m8s)
-    if (/^\d+$/.test(t)) return Number(t);
-    const m = t.match(/(?:(\d+)h)?(?:(\d+)m)?(?:(\d+)s)?/i);
-    if (!m) return null;
-    const h = Number(m[1] || 0), min = Number(m[2] || 0), s = Number(m[3] || 0);
-    return h * 3600 + min * 60 + s;
-  } catch { return null; }
-}
-
-function getVideoId(input: string): string | null {
-  try {
-    const u = new URL(input);
-    if (u.hostname.includes("youtu.be")) return u.pathname.replace(/^\//, "");
-    const v = u.searchParams.get("v");
-    if (v) return v;
-    const m1 = u.pathname.match(/\/embed\/([a-zA-Z0-9_-]{6,})/);
-    if (m1) return m1[1];
-    const m2 = u.pathname.match(/\/shorts\/([a-zA-Z0-9_-]{6,})/);
-    if (m2) return m2[1];
-  } catch {}
-  return null;
-}
+// With NEXT_PUBLIC_YT_PRELOAD=idle the player is built once the browser is idle;
+// otherwise nothing is fetched from YouTube until the visitor shows intent.
+const PRELOAD_ON_IDLE = process.env.NEXT_PUBLIC_YT_PRELOAD === "idle";
 
-export default function YouTubeAudioPlayer({ url, title }: Props) {
+export default function YouTubeAudioPlayer({ videoId: vid, title, cover, duration, startSeconds, endSeconds }: Props) {
   const [ready, setReady] = useState(false);
   const [playing, setPlaying] = useState(false);
-  const [duration, setDuration] = useState(0);
-  const [current, setCurrent] = useState(0);
-  const vid = getVideoId(url);
+  // Set on the first hover/focus/touch of the play button (or idle time with PRELOAD_ON_IDLE)
+  const [armed, setArmed] = useState(false);
   const { state: np, requestPlayYouTube } = useNowPlaying();
   const isActive = np.current?.type === "youtube" && np.current.id === (vid || "");
   const isGloballyPlaying = isActive && np.playing;
 
   useEffect(() => {
-    let interval: any;
-    const tick = () => {
-      if (!vid) return;
-      const { current: t, duration: d } = getTimes(vid);
-      setCurrent(t);
-      setDuration(d);
-    };
-    if (ready) interval = setInterval(tick, 500);
-    return () => interval && clearInterval(interval);
-  }, [ready]);
+    if (!PRELOAD_ON_IDLE || !vid) return;
+    const w = window as any;
+    const run = () => setArmed(true);
+    if (typeof w.requestIdleCallback === "function") {
+      const id = w.requestIdleCallback(run, { timeout: 4000 });
+      return () => w.cancelIdleCallback(id);
+    }
+    const id = setTimeout(run, 2000);
+    return () => clearTimeout(id);
+  }, [vid]);
 
-  // Ensure a cached player exists for this videoId
+  // Once armed, ensure a cached player exists for this videoId
   useEffect(() => {
-    if (!vid) return;
+    if (!vid || !armed) return;
     let unsubscribe: null | (() => void) = null;
     (async () => {
       await ensureYouTubePlayer(vid);
@@ -79,19 +62,32 @@ export default function YouTubeAudioPlayer({ url, title }: Props) {
           else if (st === 2 || st === 0) setPlaying(false);
         } else if (evt.type === 'ready') {
           setReady(true);
+        } else if (evt.type === 'destroyed') {
+          // Evicted from the player pool; the next play recreates it
+          setReady(false);
+          setPlaying(false);
+        } else if (evt.type === 'detached') {
+          // Single-player mode swapped another video into the shared iframe
+          setPlaying(false);
         }
       });
     })();
     return () => {
       if (unsubscribe) unsubscribe();
     };
-  }, []);
+  }, [vid, armed]);
+
+  const onIntent = () => {
+    if (!vid || armed) return;
+    warmYouTubePlayer(vid);
+    setArmed(true);
+  };
 
   const toggle = () => {
     if (!vid) return;
+    setArmed(true);
     // Delegate to NowPlaying so others get paused
-    const startSeconds = getStartSeconds(url) ?? undefined;
-    void requestPlayYouTube(vid, { title, startSeconds });
+    void requestPlayYouTube(vid, { title, startSeconds, endSeconds });
   };
 
   const seekBy = (delta: number) => {
@@ -99,28 +95,29 @@ export default function YouTubeAudioPlayer({ url, title }: Props) {
     const { current: cur, duration: dur } = getTimes(vid);
     const next = Math.max(0, Math.min(dur, cur + delta));
     seekTo(vid, next);
-    setCurrent(next);
+    if (isActive) setPlaybackTime(next);
   };
 
   const onSeek = (e: React.ChangeEvent<HTMLInputElement>) => {
     if (!vid || !ready) return;
     const v = Number(e.target.value);
     seekTo(vid, v);
-    setCurrent(v);
-  };
-
-  const fmt = (s: number) => {
-    const m = Math.floor(s / 60);
-    const sec = Math.floor(s % 60).toString().padStart(2, "0");
-    return `${m}:${sec}`;
+    if (isActive) setPlaybackTime(v);
   };
 
   return (
     <div className="w-full rounded border border-white/10 p-3 bg-black/30">
       <div className="flex items-center justify-end gap-3">
+        {/* Facade until the player exists: the cover stands in for the iframe */}
+        {!ready && !isActive && cover ? (
+          <Image src={cover} alt={title || ""} width={96} height={54} className="mr-auto rounded object-cover aspect-video" />
+        ) : null}
         <div className="flex items-center gap-3">
           <button
             onClick={(e) => { e.preventDefault(); e.stopPropagation(); toggle(); }}
+            onPointerEnter={onIntent}
+            onFocus={onIntent}
+            onTouchStart={onIntent}
             aria-label={playing ? "Pause" : "Play"}
             className="px-3 py-2 rounded-md bg-white/10 hover:bg-white/20 disabled:opacity-50 text-base"
             title={playing ? "Pause" : "Play"}
@@ -136,22 +133,54 @@ export default function YouTubeAudioPlayer({ url, title }: Props) {
           >
             <span aria-hidden className="text-sm font-medium">+10s</span>
           </button>
-          <span className="text-xs text-white/60">
-            {fmt(current)} / {fmt(duration)}
-          </span>
+          {ready || isActive ? (
+            <TimeLabel vid={vid} active={isActive} />
+          ) : duration ? (
+            <span className="text-xs text-white/60">{duration}</span>
+          ) : null}
         </div>
       </div>
-      <input
-        className="w-full mt-3"
-        type="range"
-        min={0}
-        max={Math.max(1, Math.floor(duration))}
-        step={1}
-        value={Math.floor(current)}
-        onClick={(e) => { e.preventDefault(); e.stopPropagation(); }}
-        onChange={(e) => { e.preventDefault(); e.stopPropagation(); onSeek(e); }}
-      />
+      {ready || isActive ? <SeekRange vid={vid} active={isActive} onSeek={onSeek} /> : null}
       {/* Uses shared offscreen player; no local iframe needed */}
     </div>
   );
 }
+
+// While this video is the active one, time comes from the shared playback clock;
+// otherwise the cached player is read directly on render.
+function useVideoTimes(vid: string | null, active: boolean): { current: number; duration: number } {
+  const clock = usePlaybackTime();
+  if (active) return { current: clock.position, duration: clock.duration };
+  return vid ? getTimes(vid) : { current: 0, duration: 0 };
+}
+
+function fmt(s: number) {
+  const m = Math.floor(s / 60);
+  const sec = Math.floor(s % 60).toString().padStart(2, "0");
+  return `${m}:${sec}`;
+}
+
+function TimeLabel({ vid, active }: { vid: string | null; active: boolean }) {
+  const { current, duration } = useVideoTimes(vid, active);
+  return (
+    <span className="text-xs text-white/60">
+      {fmt(current)} / {fmt(duration)}
+    </span>
+  );
+}
+
+function SeekRange({ vid, active, onSeek }: { vid: string | null; active: boolean; onSeek: (e: React.ChangeEvent<HTMLInputElement>) => void }) {
+  const { current, duration } = useVideoTimes(vid, active);
+  return (
+    <input
+      className="w-full mt-3"
+      type="range"
+      min={0}
+      max={Math.max(1, Math.floor(duration))}
+      step={1}
+      value={Math.floor(current)}
+      onClick={(e) => { e.preventDefault(); e.stopPropagation(); }}
+      onChange={(e) => { e.preventDefault(); e.stopPropagation(); onSeek(e); }}
+    />
+  );
+}
@@ -0,0 +1,43 @@
+import fs from "fs";
+import path from "path";
+
+// Written by scripts/analyze-audio.mjs; committed so builds don't need ffmpeg or the audio files.
+const analysisFile = path.join(process.cwd(), "content", "audio-analysis.json");
+
+export type AudioAnalysis = {
+  key: string;
+  integratedLufs: number | null;
+  peakDb: number | null;
+  gainDb: number;
+  peaks?: string; // id of the files in public/peaks/, see lib/waveform.ts
+};
+
+type AnalysisFile = { version: number; targetLufs: number; files: Record<string, AudioAnalysis> };
+
+let analysis: Record<string, AudioAnalysis> | null = null;
+
+function loadAnalysis(): Record<string, AudioAnalysis> {
+  if (analysis && process.env.NODE_ENV === "production") return analysis;
+  try {
+    analysis = (JSON.parse(fs.readFileSync(analysisFile, "utf-8")) as AnalysisFile).files;
+  } catch {
+    analysis = {};
+  }
+  return analysis;
+}
+
+export function getAudioAnalysis(audioUrl: string): AudioAnalysis | null {
+  return loadAnalysis()[audioUrl] ?? null;
+}
+
+export function getAudioPeaksId(audioUrl?: string): string | undefined {
+  if (!audioUrl) return undefined;
+  return getAudioAnalysis(audioUrl)?.peaks;
+}
+
+// Normalization gain for a post's audio, or undefined when it has not been analyzed.
+export function getAudioGainDb(audioUrl?: string): number | undefined {
+  if (!audioUrl) return undefined;
+  const gain = getAudioAnalysis(audioUrl)?.gainDb;
+  return typeof gain === "number" && gain !== 0 ? gain : undefined;
+}
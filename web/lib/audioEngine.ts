@@ -0,0 +1,110 @@
+// Web Audio graph for direct-audio mixes. Each <audio> deck streams through a
+// MediaElementAudioSourceNode (nothing is decoded into memory up front) into its own fade
+// GainNode and a shared master gain, so transitions can be scheduled on the audio clock.
+// A per-deck trim gain applies the loudness normalization measured at build time.
+//
+//   <audio> -> MediaElementSource -> trim gain -> fade gain -> master gain -> destination
+
+let ctx: AudioContext | null = null;
+let master: GainNode | null = null;
+// A media element can only ever be wrapped by one source node, so routing is permanent
+const fades = new WeakMap<HTMLAudioElement, GainNode>();
+const trims = new WeakMap<HTMLAudioElement, GainNode>();
+
+// Samples in the equal-power fade curves handed to setValueCurveAtTime
+const CURVE_POINTS = 64;
+
+export function isAudioEngineSupported(): boolean {
+  if (typeof window === "undefined") return false;
+  const w = window as any;
+  return Boolean(w.AudioContext || w.webkitAudioContext);
+}
+
+// Cross-origin media without CORS headers plays as silence through Web Audio, so only
+// same-origin files are routed; everything else keeps plain element playback.
+export function canRouteThroughEngine(src: string): boolean {
+  if (!isAudioEngineSupported()) return false;
+  try {
+    return new URL(src, window.location.href).origin === window.location.origin;
+  } catch {
+    return false;
+  }
+}
+
+function getContext(): AudioContext | null {
+  if (ctx) return ctx;
+  if (!isAudioEngineSupported()) return null;
+  const w = window as any;
+  const Ctor = w.AudioContext || w.webkitAudioContext;
+  ctx = new Ctor() as AudioContext;
+  master = ctx.createGain();
+  master.connect(ctx.destination);
+  return ctx;
+}
+
+// Contexts created outside a user gesture start suspended; call from a play click.
+export function resumeAudioEngine() {
+  if (ctx && ctx.state === "suspended") void ctx.resume().catch(() => {});
+}
+
+export function connectDeck(el: HTMLAudioElement): boolean {
+  if (fades.has(el)) return true;
+  const context = getContext();
+  if (!context || !master) return false;
+  const source = context.createMediaElementSource(el);
+  const trim = context.createGain();
+  const fade = context.createGain();
+  source.connect(trim);
+  trim.connect(fade);
+  fade.connect(master);
+  trims.set(el, trim);
+  fades.set(el, fade);
+  return true;
+}
+
+// Loudness normalization (see scripts/analyze-audio.mjs). Decks outside the graph can only
+// be turned down, through the element's own volume.
+export function setDeckGainDb(el: HTMLAudioElement, gainDb: number) {
+  const linear = 10 ** (gainDb / 20);
+  const trim = trims.get(el);
+  if (trim && ctx) {
+    trim.gain.setValueAtTime(linear, ctx.currentTime);
+    return;
+  }
+  el.volume = Math.min(1, linear);
+}
+
+export function isDeckConnected(el: HTMLAudioElement): boolean {
+  return fades.has(el);
+}
+
+// Drops any pending automation and sets the deck's fade gain right away.
+export function setDeckLevel(el: HTMLAudioElement, level: number) {
+  const fade = fades.get(el);
+  if (!fade || !ctx) return;
+  fade.gain.cancelScheduledValues(ctx.currentTime);
+  fade.gain.setValueAtTime(level, ctx.currentTime);
+}
+
+function equalPowerCurve(fadeIn: boolean): Float32Array {
+  const curve = new Float32Array(CURVE_POINTS);
+  for (let i = 0; i < CURVE_POINTS; i++) {
+    const t = i / (CURVE_POINTS - 1);
+    curve[i] = fadeIn ? Math.sin(t * Math.PI / 2) : Math.cos(t * Math.PI / 2);
+  }
+  return curve;
+}
+
+// Schedules an equal-power crossfade starting now on the audio clock. The ramps are
+// sample-accurate; starting the incoming element is left to the caller.
+export function crossfadeDecks(from: HTMLAudioElement, to: HTMLAudioElement, seconds: number) {
+  const out = fades.get(from);
+  const inn = fades.get(to);
+  if (!out || !inn || !ctx) return;
+  const now = ctx.currentTime;
+  const duration = Math.max(0.01, seconds);
+  out.gain.cancelScheduledValues(now);
+  inn.gain.cancelScheduledValues(now);
+  out.gain.setValueCurveAtTime(equalPowerCurve(false), now, duration);
+  inn.gain.setValueCurveAtTime(equalPowerCurve(true), now, duration);
+}
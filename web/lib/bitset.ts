@@ -0,0 +1,63 @@
+// Fixed-size bitsets over manifest post ids, serialized as base64 of little-endian 32-bit words.
+
+export type Bitset = Uint32Array;
+
+export function createBitset(size: number): Bitset {
+  return new Uint32Array(Math.ceil(size / 32));
+}
+
+export function setBit(bits: Bitset, i: number) {
+  bits[i >>> 5] |= 1 << (i & 31);
+}
+
+export function encodeBitset(bits: Bitset): string {
+  let binary = "";
+  for (const word of bits) {
+    binary += String.fromCharCode(word & 0xff, (word >>> 8) & 0xff, (word >>> 16) & 0xff, word >>> 24);
+  }
+  return btoa(binary);
+}
+
+export function decodeBitset(encoded: string): Bitset {
+  const binary = atob(encoded);
+  const bits = new Uint32Array(binary.length >> 2);
+  for (let i = 0; i < bits.length; i++) {
+    const o = i << 2;
+    bits[i] = (binary.charCodeAt(o) | (binary.charCodeAt(o + 1) << 8) | (binary.charCodeAt(o + 2) << 16) | (binary.charCodeAt(o + 3) << 24)) >>> 0;
+  }
+  return bits;
+}
+
+// In-place helpers return their first argument so calls can be chained
+export function orInto(target: Bitset, other: Bitset): Bitset {
+  for (let i = 0; i < target.length; i++) target[i] |= other[i];
+  return target;
+}
+
+export function andInto(target: Bitset, other: Bitset): Bitset {
+  for (let i = 0; i < target.length; i++) target[i] &= other[i];
+  return target;
+}
+
+export function countBits(bits: Bitset): number {
+  let n = 0;
+  for (let w of bits) {
+    w -= (w >>> 1) & 0x55555555;
+    w = (w & 0x33333333) + ((w >>> 2) & 0x33333333);
+    n += Math.imul((w + (w >>> 4)) & 0x0f0f0f0f, 0x01010101) >>> 24;
+  }
+  return n;
+}
+
+export function bitsetToIds(bits: Bitset): number[] {
+  const ids: number[] = [];
+  for (let i = 0; i < bits.length; i++) {
+    let w = bits[i];
+    while (w) {
+      const low = w & -w;
+      ids.push((i << 5) + 31 - Math.clz32(low));
+      w ^= low;
+    }
+  }
+  return ids;
+}
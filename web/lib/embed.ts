@@ -0,0 +1,61 @@
+// Canonical form of a post's embed. Every URL shape posts use (embed, watch, youtu.be, shorts,
+// live, with `start`/`end`/`t` offsets) is reduced to a video id and offsets in seconds.
+
+export type EmbedType = "youtube" | "soundcloud";
+
+export type YouTubeVideo = {
+  videoId: string;
+  startSeconds?: number;
+  endSeconds?: number;
+};
+
+export type NormalizedEmbed = { type: EmbedType; url: string } & Partial<YouTubeVideo>;
+
+const VIDEO_ID = /^[a-zA-Z0-9_-]{6,}$/;
+// Path prefixes that are followed by the video id
+const ID_PATHS = new Set(["embed", "shorts", "live", "v", "e"]);
+
+// "1928", "1928s", "32m8s" or "1h2m3s" -> seconds; undefined when absent, zero or malformed.
+export function parseYouTubeTime(value: string | null | undefined): number | undefined {
+  if (!value) return undefined;
+  const m = value.trim().match(/^(?:(\d+)h)?(?:(\d+)m)?(?:(\d+)s?)?$/i);
+  if (!m || (!m[1] && !m[2] && !m[3])) return undefined;
+  const seconds = Number(m[1] || 0) * 3600 + Number(m[2] || 0) * 60 + Number(m[3] || 0);
+  return seconds > 0 ? seconds : undefined;
+}
+
+export function parseYouTubeUrl(url: string): YouTubeVideo | null {
+  let u: URL;
+  try {
+    u = new URL(url);
+  } catch {
+    return null;
+  }
+  const host = u.hostname.replace(/^(?:www|m|music)\./, "");
+  const parts = u.pathname.split("/").filter(Boolean);
+  let id: string | null = null;
+  if (host === "youtu.be") {
+    // youtu.be/embed/<id> is a common copy-paste mistake
+    id = parts[0] === "embed" ? parts[1] : parts[0];
+  } else if (host === "youtube.com" || host === "youtube-nocookie.com") {
+    // /embed/watch?v=<id> and /watch?v=<id> both fall through to the query string
+    if (ID_PATHS.has(parts[0]) && parts[1] !== "watch") id = parts[1];
+    id = id || u.searchParams.get("v");
+  }
+  if (!id || !VIDEO_ID.test(id)) return null;
+  const hash = new URLSearchParams(u.hash.slice(1));
+  const startSeconds = parseYouTubeTime(u.searchParams.get("start") ?? u.searchParams.get("t") ?? hash.get("t"));
+  const endSeconds = parseYouTubeTime(u.searchParams.get("end"));
+  return {
+    videoId: id,
+    startSeconds,
+    endSeconds: endSeconds !== undefined && endSeconds > (startSeconds ?? 0) ? endSeconds : undefined,
+  };
+}
+
+export function normalizeEmbed(embed: { type: EmbedType; url: string } | null | undefined): NormalizedEmbed | null {
+  if (!embed) return null;
+  if (embed.type !== "youtube") return { type: embed.type, url: embed.url };
+  const video = parseYouTubeUrl(embed.url);
+  return video ? { type: "youtube", url: embed.url, ...video } : { type: "youtube", url: embed.url };
+}
@@ -0,0 +1,65 @@
+import type { PostListing } from "@/lib/posts";
+import { createBitset, encodeBitset, setBit } from "@/lib/bitset";
+import { parseClockTime } from "@/lib/time";
+
+export type FacetName = "tag" | "postType" | "year" | "duration";
+
+// value -> base64 bitset over manifest post ids
+export type FacetIndex = {
+  size: number;
+  facets: Record<FacetName, Record<string, string>>;
+};
+
+// Labels double as the facet values shown in the filter panel
+const DURATION_BUCKETS: { label: string; max: number }[] = [
+  { label: "< 30 min", max: 30 * 60 },
+  { label: "30–60 min", max: 60 * 60 },
+  { label: "1–2 h", max: 2 * 3600 },
+  { label: "2 h +", max: Infinity },
+];
+
+function durationBucket(duration?: string): string | null {
+  const seconds = duration ? parseClockTime(duration) : null;
+  if (seconds === null) return null;
+  return DURATION_BUCKETS.find((b) => seconds < b.max)!.label;
+}
+
+// `posts` must be in manifest order so bit positions line up with manifest rows.
+export function buildFacetIndex(posts: PostListing[]): FacetIndex {
+  const sets: Record<FacetName, Map<string, Uint32Array>> = {
+    tag: new Map(),
+    postType: new Map(),
+    year: new Map(),
+    duration: new Map(),
+  };
+  const mark = (facet: FacetName, value: string | null | undefined, id: number) => {
+    if (!value) return;
+    let bits = sets[facet].get(value);
+    if (!bits) {
+      bits = createBitset(posts.length);
+      sets[facet].set(value, bits);
+    }
+    setBit(bits, id);
+  };
+  posts.forEach((post, id) => {
+    for (const tag of post.tags ?? []) mark("tag", tag, id);
+    mark("postType", post.postType, id);
+    mark("year", post.date.slice(0, 4), id);
+    mark("duration", durationBucket(post.duration), id);
+  });
+
+  const encode = (map: Map<string, Uint32Array>) => {
+    const out: Record<string, string> = {};
+    map.forEach((bits, value) => (out[value] = encodeBitset(bits)));
+    return out;
+  };
+  return {
+    size: posts.length,
+    facets: {
+      tag: encode(sets.tag),
+      postType: encode(sets.postType),
+      year: encode(sets.year),
+      duration: encode(sets.duration),
+    },
+  };
+}
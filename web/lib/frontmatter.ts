@@ -0,0 +1,57 @@
+// Frontmatter detection and parsing for Markdown posts.
+// Parsers are tried in registration order; the first whose `test` matches handles the block.
+import { looksLikeJsonObject, parseYaml } from "./frontmatterParsers";
+
+export type FrontmatterParser = {
+  name: string;
+  test: (source: string) => boolean;
+  parse: (source: string) => unknown;
+};
+
+export type FrontmatterFence = {
+  source: string; // text between the --- fences
+  end: number; // index just past the closing fence (and its newline, if any)
+};
+
+// Equivalent to /^---\n([\s\S]*?)\n---\n?/ without running a regex over the whole file.
+export function findFrontmatterFence(text: string): FrontmatterFence | null {
+  if (!text.startsWith("---\n")) return null;
+  const close = text.indexOf("\n---", 4);
+  if (close === -1) return null;
+  let end = close + 4;
+  if (text.charCodeAt(end) === 10) end += 1;
+  return { source: text.slice(4, close), end };
+}
+
+export { looksLikeJsonObject };
+
+export const jsonFrontmatter: FrontmatterParser = {
+  name: "json",
+  test: looksLikeJsonObject,
+  parse: (source) => JSON.parse(source),
+};
+
+export const yamlFrontmatter: FrontmatterParser = {
+  name: "yaml",
+  test: () => true,
+  parse: parseYaml,
+};
+
+const parsers: FrontmatterParser[] = [jsonFrontmatter, yamlFrontmatter];
+
+// Custom parsers take priority over the built-in JSON and YAML ones.
+export function registerFrontmatterParser(parser: FrontmatterParser) {
+  parsers.unshift(parser);
+}
+
+// The worker pool only knows the built-in parsers, so callers fall back to inline parsing when this is true.
+export function hasCustomFrontmatterParsers(): boolean {
+  return parsers.length > 2;
+}
+
+export function parseFrontmatterSource(source: string): unknown {
+  for (const parser of parsers) {
+    if (parser.test(source)) return parser.parse(source);
+  }
+  throw new Error("No frontmatter parser matched");
+}
@@ -0,0 +1,35 @@
+// Built-in frontmatter parsers, shared by lib/frontmatter.ts and the parse pool's worker
+// (lib/posts.worker.js). Plain CommonJS so the worker can require it without the bundler.
+
+/** @param {number} code */
+function isSpace(code) {
+  return code === 32 || code === 10 || code === 13 || code === 9;
+}
+
+// Checks that the first and last non-whitespace characters are braces without allocating trimmed copies.
+/** @param {string} source @returns {boolean} */
+function looksLikeJsonObject(source) {
+  let start = 0;
+  let end = source.length - 1;
+  while (start <= end && isSpace(source.charCodeAt(start))) start++;
+  while (end > start && isSpace(source.charCodeAt(end))) end--;
+  return source.charCodeAt(start) === 123 && source.charCodeAt(end) === 125;
+}
+
+/** @type {{ load: (source: string) => unknown } | null} */
+let yamlModule = null;
+
+// js-yaml is only loaded the first time a YAML post is seen, then reused.
+/** @param {string} source @returns {unknown} */
+function parseYaml(source) {
+  if (!yamlModule) yamlModule = require("js-yaml");
+  return /** @type {{ load: (source: string) => unknown }} */ (yamlModule).load(source);
+}
+
+// What the built-in parsers do together: JSON when the block is an object, YAML otherwise.
+/** @param {string} source @returns {unknown} */
+function parseBuiltinFrontmatter(source) {
+  return looksLikeJsonObject(source) ? JSON.parse(source) : parseYaml(source);
+}
+
+module.exports = { looksLikeJsonObject, parseYaml, parseBuiltinFrontmatter };
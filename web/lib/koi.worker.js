@@ -0,0 +1,39 @@
+// Worker for components/KoiBackground.jsx: draws the comet field on a transferred
+// OffscreenCanvas so the animation never runs on the main thread.
+import { createKoiRenderer, startKoiLoop } from './koiRenderer';
+
+// How often frame-time stats are posted back when the page asked for them
+const STATS_INTERVAL_MS = 1000;
+
+let renderer = null;
+let stop = null;
+let statsTimer = 0;
+
+function run(visible) {
+  if (stop) stop();
+  stop = visible ? startKoiLoop(renderer, self) : null;
+}
+
+self.onmessage = (e) => {
+  const msg = e.data;
+  if (msg.type === 'init') {
+    const { canvas, width, height, reportStats } = msg;
+    canvas.width = width;
+    canvas.height = height;
+    renderer = createKoiRenderer(canvas, (w, h) => new OffscreenCanvas(w, h));
+    run(true);
+    if (reportStats) {
+      statsTimer = setInterval(() => self.postMessage({ type: 'stats', stats: renderer.stats() }), STATS_INTERVAL_MS);
+    }
+  } else if (!renderer) {
+    return;
+  } else if (msg.type === 'resize') {
+    renderer.resize(msg.width, msg.height);
+  } else if (msg.type === 'visibility') {
+    // Worker timers keep running in background tabs, unlike the page's own rAF
+    run(msg.visible);
+  } else if (msg.type === 'stop') {
+    run(false);
+    clearInterval(statsTimer);
+  }
+};
@@ -0,0 +1,95 @@
+import crypto from "crypto";
+import { getCoverFromEmbed, getPostListings, type PostFrontmatter, type PostListing } from "@/lib/posts";
+import { getAudioGainDb, getAudioPeaksId } from "@/lib/audioAnalysis";
+import { buildFacetIndex } from "@/lib/facets";
+import { buildSearchIndex } from "@/lib/searchIndex";
+
+// One compact row per published post, in the same newest-first order as getPostListings().
+// Client features refer to posts by their position in `posts`.
+export type ManifestEntry = {
+  slug: string;
+  title: string;
+  excerpt?: string; // already length-bounded, see makeExcerpt in lib/posts.ts
+  date: string;
+  postType: PostFrontmatter["postType"];
+  tags?: string[];
+  cover?: string;
+  videoId?: string;
+  videoStart?: number; // embed start/end offsets in seconds, see lib/embed.ts
+  videoEnd?: number;
+  audioUrl?: string;
+  gainDb?: number; // loudness normalization for audioUrl, from content/audio-analysis.json
+  peaks?: string; // waveform peaks id for audioUrl, see lib/waveform.ts
+  duration?: string;
+};
+
+export type PostsManifest = {
+  version: string;
+  posts: ManifestEntry[];
+  search: { version: string; shards: string[] };
+  facets: string; // file name of the FacetIndex under /data/
+};
+
+// All files served from /data/: the manifest plus the search shards and facets it points at
+type BuiltManifest = { fileName: string; files: Map<string, string> };
+
+let builtManifest: BuiltManifest | null = null;
+
+function toEntry(post: PostListing): ManifestEntry {
+  // JSON.stringify drops undefined fields, keeping rows small
+  return {
+    slug: post.slug,
+    title: post.title,
+    excerpt: post.excerpt || undefined,
+    date: post.date,
+    postType: post.postType,
+    tags: post.tags?.length ? post.tags : undefined,
+    cover: getCoverFromEmbed(post) ?? undefined,
+    videoId: post.videoId,
+    videoStart: post.videoStart,
+    videoEnd: post.videoEnd,
+    audioUrl: post.audioUrl,
+    gainDb: getAudioGainDb(post.audioUrl),
+    peaks: getAudioPeaksId(post.audioUrl),
+    duration: post.duration,
+  };
+}
+
+function hashOf(text: string): string {
+  return crypto.createHash("sha1").update(text).digest("hex").slice(0, 10);
+}
+
+function buildManifest(): BuiltManifest {
+  const listings = getPostListings();
+  const posts = listings.map(toEntry);
+  const search = buildSearchIndex(listings);
+  const facetsJson = JSON.stringify(buildFacetIndex(listings));
+  const facets = `facets.${hashOf(facetsJson)}.json`;
+  const version = hashOf(JSON.stringify(posts) + search.version + facets);
+  const manifest: PostsManifest = { version, posts, search: { version: search.version, shards: search.shards }, facets };
+  const fileName = `posts-manifest.${version}.json`;
+  const files = new Map(search.files);
+  files.set(facets, facetsJson);
+  files.set(fileName, JSON.stringify(manifest));
+  return { fileName, files };
+}
+
+function getBuiltManifest(): BuiltManifest {
+  if (process.env.NODE_ENV !== "production") return buildManifest();
+  if (!builtManifest) builtManifest = buildManifest();
+  return builtManifest;
+}
+
+// The file name carries the content hash, so it can be cached indefinitely.
+export function getPostsManifestFileName(): string {
+  return getBuiltManifest().fileName;
+}
+
+export function getPostsManifestUrl(): string {
+  return `/data/${getPostsManifestFileName()}`;
+}
+
+// File name -> JSON body for everything under /data/
+export function getDataFiles(): Map<string, string> {
+  return getBuiltManifest().files;
+}
@@ -0,0 +1,53 @@
+import { decodeBitset, type Bitset } from "@/lib/bitset";
+import type { FacetIndex, FacetName } from "@/lib/facets";
+import type { PostsManifest } from "@/lib/manifest";
+
+// The root layout publishes the hashed manifest URL as <meta name="posts-manifest">.
+const META_NAME = "posts-manifest";
+
+let manifestPromise: Promise<PostsManifest | null> | null = null;
+
+export function getPostsManifestUrl(): string | null {
+  if (typeof document === "undefined") return null;
+  const meta = document.querySelector<HTMLMetaElement>(`meta[name="${META_NAME}"]`);
+  return meta?.content || null;
+}
+
+// Fetched at most once per page load and shared by every caller.
+export function loadPostsManifest(): Promise<PostsManifest | null> {
+  if (manifestPromise) return manifestPromise;
+  const url = getPostsManifestUrl();
+  if (!url) return Promise.resolve(null);
+  manifestPromise = fetch(url)
+    .then((res) => (res.ok ? (res.json() as Promise<PostsManifest>) : null))
+    .catch(() => null)
+    .then((manifest) => {
+      if (!manifest) manifestPromise = null; // allow a retry after a failed fetch
+      return manifest;
+    });
+  return manifestPromise;
+}
+
+export type DecodedFacets = Record<FacetName, Map<string, Bitset>>;
+
+let facetsPromise: Promise<DecodedFacets | null> | null = null;
+
+// Bitsets are decoded once and then combined with cheap word-wise AND/OR.
+export function loadFacets(manifest: PostsManifest): Promise<DecodedFacets | null> {
+  if (facetsPromise) return facetsPromise;
+  facetsPromise = fetch(`/data/${manifest.facets}`)
+    .then((res) => (res.ok ? (res.json() as Promise<FacetIndex>) : null))
+    .catch(() => null)
+    .then((index) => {
+      if (!index) {
+        facetsPromise = null;
+        return null;
+      }
+      const decoded = {} as DecodedFacets;
+      for (const facet of Object.keys(index.facets) as FacetName[]) {
+        decoded[facet] = new Map(Object.entries(index.facets[facet]).map(([value, bits]) => [value, decodeBitset(bits)]));
+      }
+      return decoded;
+    });
+  return facetsPromise;
+}
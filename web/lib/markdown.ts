@@ -0,0 +1,15 @@
+// Plain text from a Markdown snippet, for excerpts. Checked by scripts/check-excerpts.mjs.
+
+export function stripMarkdown(md: string): string {
+  return md
+    .replace(/<[^>]+>/g, "")
+    .replace(/!\[[^\]]*\]\([^)]*\)/g, "")
+    .replace(/\[([^\]]*)\]\([^)]*\)/g, "$1")
+    .replace(/^\s{0,3}(?:#{1,6}\s+|>\s?|[-*+]\s+|\d+\.\s+)/gm, "")
+    // Emphasis only as matched pairs, each closed at the nearest marker so two spans on one
+    // line stay separate; underscores inside words (snake_case, DJ_Name) stay
+    .replace(/(\*\*|\*|~~|`)(\S(?:.*?\S)??)\1/g, "$2")
+    .replace(/(^|\W)(__|_)(\S(?:.*?\S)??)\2(?!\w)/g, "$1$3")
+    .replace(/\s+/g, " ")
+    .trim();
+}
@@ -0,0 +1,38 @@
+import os from "os";
+import path from "path";
+import { Worker } from "worker_threads";
+
+export type PoolResult = { ok: true; value: unknown } | { ok: false; error: string };
+
+// Resolved from the project root (like content/posts) so the bundler leaves it alone
+const workerScript = path.join(process.cwd(), "lib", "posts.worker.js");
+
+function poolSize(jobs: number): number {
+  const cores = typeof os.availableParallelism === "function" ? os.availableParallelism() : os.cpus().length;
+  // Leave one core for the main thread, which keeps doing I/O and hashing
+  return Math.max(1, Math.min(jobs, cores - 1));
+}
+
+function runWorker(sources: string[]): Promise<PoolResult[]> {
+  return new Promise((resolve, reject) => {
+    const worker = new Worker(workerScript, { workerData: sources });
+    // The worker exits on its own once it has posted its batch
+    worker.once("message", (results: PoolResult[]) => resolve(results));
+    worker.once("error", reject);
+    worker.once("exit", (code) => {
+      if (code !== 0) reject(new Error(`posts worker exited with code ${code}`));
+    });
+  });
+}
+
+// Parses frontmatter blocks across a pool sized to the available cores.
+// Results come back in the same order as `sources`.
+export async function parseFrontmatterInPool(sources: string[]): Promise<PoolResult[]> {
+  if (!sources.length) return [];
+  const chunk = Math.ceil(sources.length / poolSize(sources.length));
+  const runs: Promise<PoolResult[]>[] = [];
+  for (let i = 0; i < sources.length; i += chunk) {
+    runs.push(runWorker(sources.slice(i, i + chunk)));
+  }
+  return (await Promise.all(runs)).flat();
+}
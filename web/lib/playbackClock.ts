@@ -0,0 +1,104 @@
+// Playback position lives outside React context so ticking time only re-renders components
+// that read it (seek bars, time labels), not every useNowPlaying() subscriber.
+//
+// A single requestAnimationFrame loop samples the active source while something is playing
+// and the tab is visible, and fans the result out to subscribers.
+
+export type PlaybackTime = { position: number; duration: number };
+export type ClockSource = () => { current: number; duration: number };
+
+const ZERO: PlaybackTime = { position: 0, duration: 0 };
+// Subscribers are notified at most once per step of playback time
+const PUBLISH_STEP = 0.25;
+
+let snapshot: PlaybackTime = ZERO;
+const listeners = new Set<() => void>();
+
+let source: ClockSource | null = null;
+let running = false;
+let frame = 0;
+let visibilityBound = false;
+
+export function getPlaybackTime(): PlaybackTime {
+  return snapshot;
+}
+
+export function getServerPlaybackTime(): PlaybackTime {
+  return ZERO;
+}
+
+export function setPlaybackTime(position: number, duration: number = snapshot.duration) {
+  if (position === snapshot.position && duration === snapshot.duration) return;
+  snapshot = { position, duration };
+  listeners.forEach((fn) => fn());
+}
+
+export function subscribePlaybackTime(fn: () => void): () => void {
+  listeners.add(fn);
+  return () => {
+    listeners.delete(fn);
+  };
+}
+
+// Reads the active source once and publishes it if it moved by a visible amount.
+export function sampleClock() {
+  if (!source) return;
+  const { current, duration } = source();
+  const position = Number.isFinite(current) ? current : 0;
+  const dur = Number.isFinite(duration) ? duration : 0;
+  if (dur !== snapshot.duration || Math.floor(position / PUBLISH_STEP) !== Math.floor(snapshot.position / PUBLISH_STEP)) {
+    setPlaybackTime(position, dur);
+  }
+}
+
+function loop() {
+  frame = 0;
+  sampleClock();
+  schedule();
+}
+
+function schedule() {
+  if (frame || !running || !source || typeof window === "undefined") return;
+  if (document.visibilityState === "hidden") return;
+  frame = requestAnimationFrame(loop);
+}
+
+function cancel() {
+  if (frame) cancelAnimationFrame(frame);
+  frame = 0;
+}
+
+function bindVisibility() {
+  if (visibilityBound || typeof document === "undefined") return;
+  visibilityBound = true;
+  document.addEventListener("visibilitychange", () => {
+    if (document.visibilityState === "hidden") {
+      cancel();
+    } else {
+      sampleClock();
+      schedule();
+    }
+  });
+}
+
+// The source is whatever is currently loaded in the player (an audio element or a YouTube player).
+export function setClockSource(next: ClockSource | null) {
+  source = next;
+  cancel();
+  if (!next) {
+    setPlaybackTime(0, 0);
+    return;
+  }
+  sampleClock();
+  schedule();
+}
+
+export function setClockRunning(next: boolean) {
+  running = next;
+  bindVisibility();
+  if (next) schedule();
+  else {
+    cancel();
+    sampleClock();
+  }
+}
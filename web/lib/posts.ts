@@ -1,5 +1,12 @@
+import crypto from "crypto";
 import fs from "fs";
 import path from "path";
+import { StringDecoder } from "string_decoder";
+import { normalizeEmbed } from "@/lib/embed";
+import { findFrontmatterFence, hasCustomFrontmatterParsers, parseFrontmatterSource } from "@/lib/frontmatter";
+import { stripMarkdown } from "@/lib/markdown";
+import { parseFrontmatterInPool } from "@/lib/parsePool";
+import { parseTracklist, type Track } from "@/lib/tracklist";
 
 export type PostFrontmatter = {
   title: string;
@@ -13,83 +20,326 @@ export type PostFrontmatter = {
   tracklist?: string[];
   cover?: string; // optional custom cover image
   audioUrl?: string; // optional direct audio URL for mini player
+  duration?: string; // optional running time, e.g. "01:03:22"
+  summary?: string; // optional hand-written summary, used instead of the first paragraph
 };
 
-export type Post = PostFrontmatter & {
+// Canonical YouTube fields derived from `embed` once at index time, see lib/embed.ts
+export type EmbedFields = {
+  videoId?: string;
+  videoStart?: number;
+  videoEnd?: number;
+};
+
+export type Post = PostFrontmatter & EmbedFields & {
   content: string;
+  excerpt: string; // plain-text, length-bounded summary derived once at index time
+  tracks: Track[]; // tracklist lines split into timestamp, artist and title
+};
+
+// Listing pages only need frontmatter plus the precomputed excerpt.
+export type PostListing = PostFrontmatter & EmbedFields & {
+  excerpt: string;
 };
 
 const postsDir = path.join(process.cwd(), "content", "posts");
 
-function parseMarkdown(raw: string): { frontmatter: PostFrontmatter; content: string } {
-  const fmMatch = raw.match(/^---\n([\s\S]*?)\n---\n?/);
-  if (!fmMatch) {
+// Bump whenever parseMarkdown's output shape changes so stale cache entries are ignored.
+const PARSER_VERSION = 7;
+const parseCacheFile = path.join(process.cwd(), ".next", "cache", "posts", "parsed.json");
+
+type ParsedPost = { frontmatter: PostFrontmatter; video: EmbedFields; content: string; excerpt: string; tracks: Track[] };
+// mtime and size as of the last hash check, so listings can trust an entry without reading the file
+type FileStamp = { mtimeMs: number; size: number };
+type ParseCacheEntry = ParsedPost & FileStamp & { hash: string };
+type ParseCache = { version: number; entries: Record<string, ParseCacheEntry> };
+
+function splitMarkdown(raw: string): { fmContent: string; content: string } {
+  const fence = findFrontmatterFence(raw);
+  if (!fence) {
     throw new Error("Missing frontmatter block in markdown post");
   }
-  
-  const fmContent = fmMatch[1];
-  let frontmatter: PostFrontmatter;
-  
+  return { fmContent: fence.source, content: raw.slice(fence.end).trim() };
+}
+
+function parseFrontmatter(fmContent: string): PostFrontmatter {
   try {
-    // First try to parse as JSON (wrapped in {})
-    if (fmContent.trim().startsWith('{') && fmContent.trim().endsWith('}')) {
-      frontmatter = JSON.parse(fmContent);
-    } else {
-      // Fall back to YAML parsing if not JSON
-      const yaml = require('js-yaml');
-      frontmatter = yaml.load(fmContent) as PostFrontmatter;
-    }
+    return parseFrontmatterSource(fmContent) as PostFrontmatter;
   } catch (e) {
     throw new Error(`Invalid frontmatter: ${(e as Error).message}`);
   }
-  const content = raw.slice(fmMatch[0].length).trim();
-  return { frontmatter, content };
 }
 
-export function getCoverFromEmbed(post: PostFrontmatter): string | null {
-  if (post.cover) return post.cover;
-  if (post.embed?.type === "youtube") {
-    // Expect embed url like https://www.youtube.com/embed/<VIDEO_ID>
-    const match = post.embed.url.match(/\/embed\/([a-zA-Z0-9_-]{6,})/);
-    let id = match?.[1];
-    if (!id) {
-      try {
-        const u = new URL(post.embed.url);
-        id = u.searchParams.get("v") || undefined;
-        if (!id) {
-          const youtu = u.hostname.includes("youtu.be") ? u.pathname.replace(/^\//, "") : undefined;
-          const shorts = u.pathname.match(/\/shorts\/([a-zA-Z0-9_-]{6,})/);
-          id = youtu || shorts?.[1] || undefined;
-        }
-      } catch {}
+function firstParagraphOf(content: string): string {
+  const end = content.indexOf("\n\n");
+  return end === -1 ? content : content.slice(0, end);
+}
+
+const EXCERPT_MAX_CHARS = 200;
+
+function makeExcerpt(frontmatter: PostFrontmatter, firstParagraph: string): string {
+  const text = stripMarkdown(frontmatter.summary ?? firstParagraph);
+  if (text.length <= EXCERPT_MAX_CHARS) return text;
+  const cut = text.slice(0, EXCERPT_MAX_CHARS);
+  const lastSpace = cut.lastIndexOf(" ");
+  return `${(lastSpace > EXCERPT_MAX_CHARS / 2 ? cut.slice(0, lastSpace) : cut).trimEnd()}…`;
+}
+
+function toEmbedFields(frontmatter: PostFrontmatter): EmbedFields {
+  const embed = normalizeEmbed(frontmatter.embed);
+  if (!embed?.videoId) return {};
+  return { videoId: embed.videoId, videoStart: embed.startSeconds, videoEnd: embed.endSeconds };
+}
+
+function toParsedPost(frontmatter: PostFrontmatter, content: string): ParsedPost {
+  return {
+    frontmatter,
+    video: toEmbedFields(frontmatter),
+    content,
+    excerpt: makeExcerpt(frontmatter, firstParagraphOf(content)),
+    tracks: parseTracklist(frontmatter.tracklist),
+  };
+}
+
+function parseMarkdown(raw: string): ParsedPost {
+  const { fmContent, content } = splitMarkdown(raw);
+  return toParsedPost(parseFrontmatter(fmContent), content);
+}
+
+// Returns null while `head` may still be missing part of the frontmatter or first paragraph.
+function splitHead(head: string, eof: boolean): { fmContent: string; firstParagraph: string } | null {
+  const fence = findFrontmatterFence(head);
+  if (!fence) {
+    if (eof) throw new Error("Missing frontmatter block in markdown post");
+    return null;
+  }
+  const body = head.slice(fence.end).trimStart();
+  if (!eof && (!body || body.indexOf("\n\n") === -1)) return null;
+  return { fmContent: fence.source, firstParagraph: firstParagraphOf(eof ? body.trimEnd() : body) };
+}
+
+const HEAD_CHUNK_BYTES = 4096;
+
+// Reads a post only as far as the end of its first paragraph instead of loading the whole body.
+function readPostHead(file: string): { fmContent: string; firstParagraph: string } {
+  const fd = fs.openSync(file, "r");
+  try {
+    const buf = Buffer.alloc(HEAD_CHUNK_BYTES);
+    const decoder = new StringDecoder("utf8");
+    let head = "";
+    let pos = 0;
+    for (;;) {
+      const n = fs.readSync(fd, buf, 0, buf.length, pos);
+      pos += n;
+      head += n ? decoder.write(buf.subarray(0, n)) : decoder.end();
+      const split = splitHead(head, n === 0);
+      if (split) return split;
     }
-    if (id) return `https://i.ytimg.com/vi/${id}/hqdefault.jpg`;
+  } finally {
+    fs.closeSync(fd);
   }
+}
+
+function readParseCache(): ParseCache {
+  try {
+    const cache = JSON.parse(fs.readFileSync(parseCacheFile, "utf-8")) as ParseCache;
+    if (cache.version === PARSER_VERSION && cache.entries) return cache;
+  } catch {}
+  return { version: PARSER_VERSION, entries: {} };
+}
+
+function writeParseCache(cache: ParseCache) {
+  try {
+    fs.mkdirSync(path.dirname(parseCacheFile), { recursive: true });
+    // Write-then-rename so concurrent build workers never observe a half-written file
+    const tmp = `${parseCacheFile}.${process.pid}.tmp`;
+    fs.writeFileSync(tmp, JSON.stringify(cache));
+    fs.renameSync(tmp, parseCacheFile);
+  } catch {}
+}
+
+function hashContent(raw: string): string {
+  return crypto.createHash("sha1").update(raw).digest("hex");
+}
+
+export function getCoverFromEmbed(post: PostListing): string | null {
+  if (post.cover) return post.cover;
+  if (post.videoId) return `https://i.ytimg.com/vi/${post.videoId}/hqdefault.jpg`;
   // SoundCloud thumbnails would require API; return null unless provided via cover
   return null;
 }
 
-export function getAllPosts(): Post[] {
-  if (!fs.existsSync(postsDir)) return [];
-  const files = fs.readdirSync(postsDir).filter((f) => f.endsWith(".md"));
-  const posts: Post[] = files.map((file) => {
-    const raw = fs.readFileSync(path.join(postsDir, file), "utf-8");
-    const { frontmatter, content } = parseMarkdown(raw);
-    return { ...frontmatter, content };
+type PostIndex = {
+  bySlug: Map<string, Post>;
+  sorted: Post[];
+};
+
+let postIndex: PostIndex | null = null;
+let postListings: PostListing[] | null = null;
+let postIndexPromise: Promise<PostIndex> | null = null;
+
+// Below this many uncached posts, spawning workers costs more than parsing inline.
+const WORKER_MIN_POSTS = 200;
+
+function shouldUseWorkers(jobs: number): boolean {
+  // POSTS_WORKERS=0 forces the synchronous path regardless of catalogue size
+  if (process.env.POSTS_WORKERS === "0" || hasCustomFrontmatterParsers()) return false;
+  return jobs >= WORKER_MIN_POSTS;
+}
+
+function findCacheMisses(files: string[], hashes: string[], cache: ParseCache): number[] {
+  const misses: number[] = [];
+  files.forEach((file, i) => {
+    if (cache.entries[file]?.hash !== hashes[i]) misses.push(i);
   });
-  const published = posts.filter((p) => !p.draft);
-  return published.sort((a, b) => (a.date < b.date ? 1 : -1));
+  return misses;
+}
+
+function stampOf(stat: fs.Stats): FileStamp {
+  return { mtimeMs: stat.mtimeMs, size: stat.size };
+}
+
+function sameStamp(entry: ParseCacheEntry | undefined, stamp: FileStamp): entry is ParseCacheEntry {
+  return Boolean(entry && entry.mtimeMs === stamp.mtimeMs && entry.size === stamp.size);
+}
+
+function assemblePostIndex(files: string[], hashes: string[], stamps: FileStamp[], cache: ParseCache, parsed: Map<number, ParsedPost>): PostIndex {
+  const bySlug = new Map<string, Post>();
+  const entries: Record<string, ParseCacheEntry> = {};
+  // Files touched without changing their content only need new stamps
+  let restamped = false;
+  files.forEach((file, i) => {
+    const fresh = parsed.get(i);
+    const cached = cache.entries[file];
+    if (!fresh && !sameStamp(cached, stamps[i])) restamped = true;
+    const entry = fresh ? { hash: hashes[i], ...stamps[i], ...fresh } : { ...cached, ...stamps[i] };
+    entries[file] = entry;
+    const { frontmatter, video, content, excerpt, tracks } = entry;
+    if (frontmatter.draft) return;
+    bySlug.set(frontmatter.slug, { ...frontmatter, ...video, content, excerpt, tracks });
+  });
+  // Entries for deleted files are dropped because only current files are carried over
+  if (parsed.size || restamped || Object.keys(cache.entries).length !== files.length) {
+    writeParseCache({ version: PARSER_VERSION, entries });
+  }
+  const sorted = Array.from(bySlug.values()).sort((a, b) => (a.date < b.date ? 1 : -1));
+  return { bySlug, sorted };
+}
+
+function buildPostIndex(): PostIndex {
+  if (!fs.existsSync(postsDir)) return { bySlug: new Map(), sorted: [] };
+  const files = fs.readdirSync(postsDir).filter((f) => f.endsWith(".md"));
+  const raws = files.map((file) => fs.readFileSync(path.join(postsDir, file), "utf-8"));
+  const stamps = files.map((file) => stampOf(fs.statSync(path.join(postsDir, file))));
+  const hashes = raws.map(hashContent);
+  const cache = readParseCache();
+  const parsed = new Map<number, ParsedPost>();
+  for (const i of findCacheMisses(files, hashes, cache)) parsed.set(i, parseMarkdown(raws[i]));
+  return assemblePostIndex(files, hashes, stamps, cache, parsed);
+}
+
+async function buildPostIndexAsync(): Promise<PostIndex> {
+  if (!fs.existsSync(postsDir)) return { bySlug: new Map(), sorted: [] };
+  const files = (await fs.promises.readdir(postsDir)).filter((f) => f.endsWith(".md"));
+  const raws = await Promise.all(files.map((file) => fs.promises.readFile(path.join(postsDir, file), "utf-8")));
+  const stamps = (await Promise.all(files.map((file) => fs.promises.stat(path.join(postsDir, file))))).map(stampOf);
+  const hashes = raws.map(hashContent);
+  const cache = readParseCache();
+  const misses = findCacheMisses(files, hashes, cache);
+  const parsed = new Map<number, ParsedPost>();
+  if (shouldUseWorkers(misses.length)) {
+    const split = misses.map((i) => splitMarkdown(raws[i]));
+    const results = await parseFrontmatterInPool(split.map((s) => s.fmContent));
+    results.forEach((result, j) => {
+      if (!result.ok) throw new Error(`Invalid frontmatter in ${files[misses[j]]}: ${result.error}`);
+      parsed.set(misses[j], toParsedPost(result.value as PostFrontmatter, split[j].content));
+    });
+  } else {
+    for (const i of misses) parsed.set(i, parseMarkdown(raws[i]));
+  }
+  return assemblePostIndex(files, hashes, stamps, cache, parsed);
+}
+
+// Built once per process so static export reads and parses each post a single time.
+// In development the index is rebuilt on every call so edits show up without a restart.
+function getPostIndex(): PostIndex {
+  if (process.env.NODE_ENV !== "production") return buildPostIndex();
+  if (!postIndex) postIndex = buildPostIndex();
+  return postIndex;
+}
+
+function getPostIndexAsync(): Promise<PostIndex> {
+  if (process.env.NODE_ENV !== "production") return buildPostIndexAsync();
+  if (postIndex) return Promise.resolve(postIndex);
+  if (!postIndexPromise) {
+    // A failed build is not cached, so the next call retries instead of rethrowing forever
+    postIndexPromise = buildPostIndexAsync().then(
+      (index) => (postIndex = index),
+      (error) => {
+        postIndexPromise = null;
+        throw error;
+      }
+    );
+  }
+  return postIndexPromise;
+}
+
+export function getAllPosts(): Post[] {
+  return getPostIndex().sorted;
 }
 
 export function getPostBySlug(slug: string): Post | null {
-  const files = fs.existsSync(postsDir) ? fs.readdirSync(postsDir).filter((f) => f.endsWith(".md")) : [];
+  return getPostIndex().bySlug.get(slug) ?? null;
+}
+
+export async function getAllPostsAsync(): Promise<Post[]> {
+  return (await getPostIndexAsync()).sorted;
+}
+
+export async function getPostBySlugAsync(slug: string): Promise<Post | null> {
+  return (await getPostIndexAsync()).bySlug.get(slug) ?? null;
+}
+
+function buildPostListings(): PostListing[] {
+  // Reuse the full index when this process has already paid for it
+  if (postIndex) {
+    return postIndex.sorted.map(({ content, tracks, ...listing }) => listing);
+  }
+  if (!fs.existsSync(postsDir)) return [];
+  const files = fs.readdirSync(postsDir).filter((f) => f.endsWith(".md"));
+  const cache = readParseCache();
+  const bySlug = new Map<string, PostListing>();
   for (const file of files) {
-    const raw = fs.readFileSync(path.join(postsDir, file), "utf-8");
-    const { frontmatter, content } = parseMarkdown(raw);
-    if (frontmatter.slug === slug) {
-      if (frontmatter.draft) return null;
-      return { ...frontmatter, content };
+    const full = path.join(postsDir, file);
+    const cached = cache.entries[file];
+    // An unchanged file reuses the frontmatter and excerpt parsed with the full index
+    if (sameStamp(cached, stampOf(fs.statSync(full)))) {
+      if (!cached.frontmatter.draft) bySlug.set(cached.frontmatter.slug, { ...cached.frontmatter, ...cached.video, excerpt: cached.excerpt });
+      continue;
     }
+    const { fmContent, firstParagraph } = readPostHead(full);
+    const frontmatter = parseFrontmatter(fmContent);
+    if (frontmatter.draft) continue;
+    bySlug.set(frontmatter.slug, { ...frontmatter, ...toEmbedFields(frontmatter), excerpt: makeExcerpt(frontmatter, firstParagraph) });
   }
-  return null;
+  return Array.from(bySlug.values()).sort((a, b) => (a.date < b.date ? 1 : -1));
+}
+
+// Frontmatter plus excerpt for every published post, newest first.
+export function getPostListings(): PostListing[] {
+  if (process.env.NODE_ENV !== "production") return buildPostListings();
+  if (!postListings) postListings = buildPostListings();
+  return postListings;
+}
+
+export const POSTS_PER_PAGE = 24;
+
+export function getListingPageCount(): number {
+  return Math.max(1, Math.ceil(getPostListings().length / POSTS_PER_PAGE));
+}
+
+// 1-based page of listings; null when the page is out of range.
+export function getPostListingsPage(page: number): PostListing[] | null {
+  if (!Number.isInteger(page) || page < 1 || page > getListingPageCount()) return null;
+  return getPostListings().slice((page - 1) * POSTS_PER_PAGE, page * POSTS_PER_PAGE);
 }
@@ -0,0 +1,14 @@
+// Worker for lib/parsePool.ts: parses a batch of frontmatter blocks.
+// Uses the same built-in parsers as lib/frontmatter.ts.
+const { parentPort, workerData } = require("worker_threads");
+const { parseBuiltinFrontmatter } = require("./frontmatterParsers");
+
+parentPort.postMessage(
+  workerData.map((fmContent) => {
+    try {
+      return { ok: true, value: parseBuiltinFrontmatter(fmContent) };
+    } catch (e) {
+      return { ok: false, error: e.message };
+    }
+  })
+);
@@ -0,0 +1,53 @@
+import type { ManifestEntry, PostsManifest } from "@/lib/manifest";
+
+// One playable entry in the NowPlaying queue. Audio items are played on the provider's own
+// <audio> elements; YouTube items go through lib/youtubeManager.
+export type QueueItem =
+  | { type: "audio"; id: string; title?: string; slug?: string; src: string; gainDb?: number; peaks?: string; startSeconds?: number }
+  | { type: "youtube"; id: string; title?: string; slug?: string; startSeconds?: number; endSeconds?: number };
+
+export type RepeatMode = "off" | "all" | "one";
+
+// Direct audio wins over a YouTube embed, matching MixCard; entries with neither are skipped.
+export function queueItemFromEntry(entry: ManifestEntry): QueueItem | null {
+  if (entry.audioUrl) return { type: "audio", id: entry.audioUrl, title: entry.title, slug: entry.slug, src: entry.audioUrl, gainDb: entry.gainDb, peaks: entry.peaks };
+  if (entry.videoId) return { type: "youtube", id: entry.videoId, title: entry.title, slug: entry.slug, startSeconds: entry.videoStart, endSeconds: entry.videoEnd };
+  return null;
+}
+
+// Playable posts in manifest (listing) order, optionally limited to the given slugs in their order.
+export function queueItemsFromManifest(manifest: PostsManifest, slugs?: string[]): QueueItem[] {
+  let entries = manifest.posts;
+  if (slugs) {
+    const bySlug = new Map(manifest.posts.map((p) => [p.slug, p]));
+    entries = slugs.map((s) => bySlug.get(s)).filter((p): p is ManifestEntry => Boolean(p));
+  }
+  const items: QueueItem[] = [];
+  for (const entry of entries) {
+    const item = queueItemFromEntry(entry);
+    if (item) items.push(item);
+  }
+  return items;
+}
+
+export function sameItem(a: QueueItem | null | undefined, b: QueueItem | null | undefined): boolean {
+  return Boolean(a && b && a.type === b.type && a.id === b.id);
+}
+
+// Index of the item after (step 1) or before (step -1) `index`, or -1 at either end unless repeating.
+export function neighbourIndex(length: number, index: number, step: 1 | -1, repeat: RepeatMode): number {
+  if (length === 0) return -1;
+  const next = index + step;
+  if (next >= 0 && next < length) return next;
+  return repeat === "all" ? (next + length) % length : -1;
+}
+
+// Fisher–Yates over the items after `index`; what already played stays where it is.
+export function shuffleUpcoming(queue: QueueItem[], index: number): QueueItem[] {
+  const out = queue.slice();
+  for (let i = out.length - 1; i > index + 1; i--) {
+    const j = index + 1 + Math.floor(Math.random() * (i - index));
+    [out[i], out[j]] = [out[j], out[i]];
+  }
+  return out;
+}
@@ -0,0 +1,57 @@
+// Shared by the build-time index builder (lib/searchIndex.ts) and the client search box.
+
+// Bit flags for where a token occurs in a post
+export const FIELD_TITLE = 1;
+export const FIELD_TAG = 2;
+export const FIELD_TRACKLIST = 4;
+
+// [postId, fields, tracklist line indexes]; post ids are positions in the posts manifest
+export type Posting = [number, number, number[]?];
+
+// Tokens are sorted so a prefix lookup is a binary search plus a short scan.
+export type SearchShard = {
+  tokens: string[];
+  postings: Posting[][];
+};
+
+export const SHARD_PREFIX_LENGTH = 2;
+
+export function tokenize(text: string): string[] {
+  return text
+    .normalize("NFKD")
+    .replace(/[\u0300-\u036f]/g, "")
+    .toLowerCase()
+    .split(/[^a-z0-9\u00c0-\uffff]+/)
+    // Short numbers are mostly timestamps and track numbers
+    .filter((t) => t.length >= SHARD_PREFIX_LENGTH && !/^\d{1,2}$/.test(t));
+}
+
+export function shardKeyOf(token: string): string {
+  return token.slice(0, SHARD_PREFIX_LENGTH);
+}
+
+// Keeps file names ASCII-safe for tokens in any script
+export function shardFileName(key: string, version: string): string {
+  const encoded = Array.from(key).map((c) => c.codePointAt(0)!.toString(36)).join("-");
+  return `search-${encoded}.${version}.json`;
+}
+
+function lowerBound(tokens: string[], prefix: string): number {
+  let lo = 0;
+  let hi = tokens.length;
+  while (lo < hi) {
+    const mid = (lo + hi) >> 1;
+    if (tokens[mid] < prefix) lo = mid + 1;
+    else hi = mid;
+  }
+  return lo;
+}
+
+// All postings for tokens in the shard that start with `prefix`.
+export function lookupPrefix(shard: SearchShard, prefix: string): Posting[] {
+  const out: Posting[] = [];
+  for (let i = lowerBound(shard.tokens, prefix); i < shard.tokens.length && shard.tokens[i].startsWith(prefix); i++) {
+    out.push(...shard.postings[i]);
+  }
+  return out;
+}
@@ -0,0 +1,55 @@
+import type { PostsManifest } from "@/lib/manifest";
+import { FIELD_TAG, FIELD_TITLE, FIELD_TRACKLIST, lookupPrefix, shardFileName, shardKeyOf, tokenize, type SearchShard } from "@/lib/search";
+
+export type SearchHit = {
+  postId: number; // position in manifest.posts
+  score: number;
+  lines: number[]; // matching tracklist line indexes
+};
+
+const shardCache = new Map<string, Promise<SearchShard | null>>();
+
+// Only the shards for the typed prefixes are fetched, each at most once per page load.
+function loadShard(key: string, version: string): Promise<SearchShard | null> {
+  const file = shardFileName(key, version);
+  let shard = shardCache.get(file);
+  if (!shard) {
+    shard = fetch(`/data/${file}`)
+      .then((res) => (res.ok ? (res.json() as Promise<SearchShard>) : null))
+      .catch(() => null);
+    shardCache.set(file, shard);
+  }
+  return shard;
+}
+
+function fieldScore(fields: number): number {
+  return (fields & FIELD_TITLE ? 3 : 0) + (fields & FIELD_TAG ? 2 : 0) + (fields & FIELD_TRACKLIST ? 1 : 0);
+}
+
+// Every query token must prefix-match some indexed token of a post (AND semantics).
+export async function searchPosts(manifest: PostsManifest, query: string): Promise<SearchHit[]> {
+  const tokens = Array.from(new Set(tokenize(query)));
+  if (!tokens.length) return [];
+  const available = new Set(manifest.search.shards);
+  if (tokens.some((t) => !available.has(shardKeyOf(t)))) return [];
+  const shards = await Promise.all(tokens.map((t) => loadShard(shardKeyOf(t), manifest.search.version)));
+
+  let hits: Map<number, SearchHit> | null = null;
+  for (let i = 0; i < tokens.length; i++) {
+    const shard = shards[i];
+    const matches = new Map<number, SearchHit>();
+    for (const [postId, fields, lines] of shard ? lookupPrefix(shard, tokens[i]) : []) {
+      if (hits && !hits.has(postId)) continue;
+      const hit: SearchHit = matches.get(postId) ?? hits?.get(postId) ?? { postId, score: 0, lines: [] };
+      hit.score += fieldScore(fields);
+      if (lines) hit.lines.push(...lines);
+      matches.set(postId, hit);
+    }
+    hits = matches;
+  }
+
+  const results = Array.from(hits?.values() ?? []);
+  for (const hit of results) hit.lines = Array.from(new Set(hit.lines)).sort((a, b) => a - b);
+  // Manifest order is newest first, so lower ids win ties
+  return results.sort((a, b) => b.score - a.score || a.postId - b.postId);
+}
@@ -0,0 +1,67 @@
+import crypto from "crypto";
+import type { PostListing } from "@/lib/posts";
+import { FIELD_TAG, FIELD_TITLE, FIELD_TRACKLIST, shardFileName, shardKeyOf, tokenize, type Posting, type SearchShard } from "@/lib/search";
+
+export type SearchIndex = {
+  version: string;
+  shards: string[]; // shard keys, sorted
+  files: Map<string, string>; // file name -> serialized SearchShard
+};
+
+type TokenPostings = Map<number, { fields: number; lines: number[] }>;
+
+function addToken(index: Map<string, TokenPostings>, token: string, postId: number, field: number, line?: number) {
+  let postings = index.get(token);
+  if (!postings) {
+    postings = new Map();
+    index.set(token, postings);
+  }
+  let hit = postings.get(postId);
+  if (!hit) {
+    hit = { fields: 0, lines: [] };
+    postings.set(postId, hit);
+  }
+  hit.fields |= field;
+  if (line !== undefined && hit.lines[hit.lines.length - 1] !== line) hit.lines.push(line);
+}
+
+// Builds an inverted index over titles, tags and tracklists, split into prefix shards.
+// `posts` must be in manifest order so posting ids line up with manifest rows.
+export function buildSearchIndex(posts: PostListing[]): SearchIndex {
+  const index = new Map<string, TokenPostings>();
+  posts.forEach((post, postId) => {
+    for (const token of tokenize(post.title)) addToken(index, token, postId, FIELD_TITLE);
+    for (const tag of post.tags ?? []) {
+      for (const token of tokenize(tag)) addToken(index, token, postId, FIELD_TAG);
+    }
+    (post.tracklist ?? []).forEach((line, lineNo) => {
+      for (const token of tokenize(line)) addToken(index, token, postId, FIELD_TRACKLIST, lineNo);
+    });
+  });
+
+  const shards = new Map<string, SearchShard>();
+  for (const token of Array.from(index.keys()).sort()) {
+    const key = shardKeyOf(token);
+    let shard = shards.get(key);
+    if (!shard) {
+      shard = { tokens: [], postings: [] };
+      shards.set(key, shard);
+    }
+    const postings: Posting[] = [];
+    index.get(token)!.forEach(({ fields, lines }, postId) => {
+      postings.push(lines.length ? [postId, fields, lines] : [postId, fields]);
+    });
+    shard.tokens.push(token);
+    shard.postings.push(postings);
+  }
+
+  const serialized = new Map<string, string>();
+  shards.forEach((shard, key) => serialized.set(key, JSON.stringify(shard)));
+  const hash = crypto.createHash("sha1");
+  serialized.forEach((json, key) => hash.update(key).update(json));
+  const version = hash.digest("hex").slice(0, 10);
+
+  const files = new Map<string, string>();
+  serialized.forEach((json, key) => files.set(shardFileName(key, version), json));
+  return { version, shards: Array.from(shards.keys()), files };
+}
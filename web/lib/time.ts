@@ -0,0 +1,8 @@
+// "mm:ss" or "h:mm:ss" -> seconds; null when the text is not a clock time.
+export function parseClockTime(text: string): number | null {
+  const m = text.trim().match(/^(?:(\d{1,2}):)?(\d{1,3}):(\d{2})$/);
+  if (!m) return null;
+  const h = Number(m[1] || 0), min = Number(m[2]), s = Number(m[3]);
+  if (s >= 60 || (m[1] !== undefined && min >= 60)) return null;
+  return h * 3600 + min * 60 + s;
+}
@@ -0,0 +1,86 @@
+import { parseClockTime } from "@/lib/time";
+
+// One tracklist line split into its parts. startSeconds is null when the line has no timestamp.
+export type Track = {
+  startSeconds: number | null;
+  artist?: string;
+  title: string;
+};
+
+// Start times in ascending order with the index of the track each one belongs to.
+export type TrackTimeline = { starts: number[]; indices: number[] };
+
+// A leading "mm:ss" or "h:mm:ss", optionally bracketed and followed by a separator
+const STAMP = /^[[(]?((?:\d{1,2}:)?\d{1,3}:\d{2})[\])]?\s*(?:[-–—|.]\s+)?/;
+// Some lists put the stamp at the end instead: "1. Artist - Title - 1:20"
+const TRAILING_STAMP = /(?:\s+[-–—]\s*|\s+)[[(]?((?:\d{1,2}:)?\d{1,3}:\d{2})[\])]?$/;
+// A list ordinal such as "1. " or "12) "
+const ORDINAL = /^\d{1,3}[.)]\s+/;
+// The first spaced dash separates artist from title
+const ARTIST_SEPARATOR = /\s+[-–—]\s+/;
+
+export function parseTrackLine(line: string): Track {
+  let rest = line.trim();
+  let startSeconds: number | null = null;
+  const stamp = rest.match(STAMP);
+  if (stamp) {
+    startSeconds = parseClockTime(stamp[1]);
+    if (startSeconds !== null) rest = rest.slice(stamp[0].length);
+  }
+  if (startSeconds === null) {
+    rest = rest.replace(ORDINAL, "");
+    const trailing = rest.match(TRAILING_STAMP);
+    if (trailing && trailing.index !== undefined) {
+      startSeconds = parseClockTime(trailing[1]);
+      if (startSeconds !== null) rest = rest.slice(0, trailing.index);
+    }
+  }
+  const sep = rest.match(ARTIST_SEPARATOR);
+  if (!sep || sep.index === undefined || sep.index === 0) return { startSeconds, title: rest };
+  return {
+    startSeconds,
+    artist: rest.slice(0, sep.index).trim(),
+    title: rest.slice(sep.index + sep[0].length).trim(),
+  };
+}
+
+export function parseTracklist(lines?: string[]): Track[] {
+  return (lines ?? []).map(parseTrackLine);
+}
+
+// An unstamped opening track is taken to start at 0 when later lines are stamped; other
+// unstamped lines, and every line of a list with no stamps at all, are not seekable.
+export function trackStart(tracks: Track[], i: number): number | null {
+  const start = tracks[i].startSeconds;
+  if (start !== null || i !== 0) return start;
+  return tracks.some((t) => t.startSeconds !== null) ? 0 : null;
+}
+
+export function buildTrackTimeline(tracks: Track[]): TrackTimeline {
+  const stamped: { start: number; index: number }[] = [];
+  tracks.forEach((_, i) => {
+    const start = trackStart(tracks, i);
+    if (start !== null) stamped.push({ start, index: i });
+  });
+  // Array.prototype.sort is stable, so equal stamps keep tracklist order
+  stamped.sort((a, b) => a.start - b.start);
+  return { starts: stamped.map((s) => s.start), indices: stamped.map((s) => s.index) };
+}
+
+// Track playing at `position`: binary search for the last start at or before it; -1 before the first.
+export function findCurrentTrack(timeline: TrackTimeline, position: number): number {
+  const { starts, indices } = timeline;
+  let lo = 0;
+  let hi = starts.length - 1;
+  let found = -1;
+  while (lo <= hi) {
+    const mid = (lo + hi) >> 1;
+    if (starts[mid] <= position) {
+      found = mid;
+      lo = mid + 1;
+    } else {
+      hi = mid - 1;
+    }
+  }
+  return found === -1 ? -1 : indices[found];
+}
@@ -0,0 +1,50 @@
+// Precomputed waveform peaks written by scripts/analyze-audio.mjs: for each level, an Int8
+// array of [min, max] pairs, one pair per bucket of `level` frames at PEAK_SAMPLE_RATE.
+export const PEAK_SAMPLE_RATE = 48000;
+// Frames per bucket, finest first; each level is 4x coarser than the previous one
+export const PEAK_LEVELS = [1024, 4096, 16384, 65536];
+
+const COARSEST = PEAK_LEVELS[PEAK_LEVELS.length - 1];
+
+const cache = new Map<string, Promise<Int8Array | null>>();
+
+export function peaksUrl(id: string, level: number): string {
+  return `/peaks/${id}.${level}.bin`;
+}
+
+export function loadPeaks(id: string, level: number): Promise<Int8Array | null> {
+  const url = peaksUrl(id, level);
+  let pending = cache.get(url);
+  if (!pending) {
+    pending = fetch(url)
+      .then((res) => (res.ok ? res.arrayBuffer() : null))
+      .then((buf) => (buf ? new Int8Array(buf) : null))
+      .catch(() => null)
+      .then((peaks) => {
+        if (!peaks) cache.delete(url); // allow a retry after a failed fetch
+        return peaks;
+      });
+    cache.set(url, pending);
+  }
+  return pending;
+}
+
+// The coarsest level that still has a bucket for every column, or the finest one available.
+export function pickPeakLevel(totalFrames: number, columns: number): number {
+  for (let i = PEAK_LEVELS.length - 1; i >= 0; i--) {
+    if (totalFrames / PEAK_LEVELS[i] >= columns) return PEAK_LEVELS[i];
+  }
+  return PEAK_LEVELS[0];
+}
+
+// Fetches the tiny coarsest level first to learn the length, then only the level `columns` needs.
+export async function loadPeaksForWidth(id: string, columns: number): Promise<{ peaks: Int8Array; duration: number } | null> {
+  const coarse = await loadPeaks(id, COARSEST);
+  if (!coarse) return null;
+  const totalFrames = (coarse.length / 2) * COARSEST;
+  const duration = totalFrames / PEAK_SAMPLE_RATE;
+  const level = pickPeakLevel(totalFrames, columns);
+  if (level === COARSEST) return { peaks: coarse, duration };
+  const peaks = await loadPeaks(id, level);
+  return { peaks: peaks ?? coarse, duration };
+}
@@ -19,12 +19,171 @@ function loadApi(): Promise<void> {
   return apiReadyPromise;
 }
 
+export type PlayerMode = 'pool' | 'single';
+
+// 'pool' keeps one player per video id; 'single' keeps one hidden player and swaps
+// videos into it, so memory and startup cost stay flat across a listening session.
+let mode: PlayerMode = process.env.NEXT_PUBLIC_YT_PLAYER_MODE === 'single' ? 'single' : 'pool';
+
+// Key of the shared player in single mode; the video loaded into it is `attachedId`
+const SHARED = 'shared';
+let attachedId: string | null = null;
+// A seek requested while another video held the shared player; applied when it loads
+let pendingStart: { videoId: string; seconds: number } | null = null;
+// The NowPlaying video: never evicted, and never swapped out of the shared player by a warm-up
+let activeVideo: string | null = null;
+// Last position of videos whose player was destroyed or swapped out, for resuming them
+const resumeAt = new Map<string, number>();
+
+// Map iteration order doubles as the LRU order: least recently used first
 const players = new Map<string, any>();
 const readyPromises = new Map<string, Promise<void>>();
+const readyResolvers = new Map<string, () => void>();
 const listeners = new Map<string, Set<(state: any) => void>>();
+// In-flight creations by player key, so concurrent ensures share one YT.Player
+const creating = new Map<string, Promise<any>>();
+
+// Each player is a live iframe decoding in the background, so only a few are kept
+let maxPlayers = 3;
+const stats = { created: 0, evicted: 0, peak: 0, lastTimeToFirstAudio: null as number | null };
+
+// performance.now() of the latest play click per video, cleared when audio starts
+const playIntents = new Map<string, number>();
+
+export type PlayerPoolStats = {
+  mode: PlayerMode;
+  live: number;
+  liveIframes: number;
+  maxPlayers: number;
+  created: number;
+  evicted: number;
+  peak: number;
+  // Milliseconds from the last play click to the player reporting PLAYING
+  lastTimeToFirstAudio: number | null;
+};
+
+export function setPlayerMode(next: PlayerMode) {
+  if (next === mode) return;
+  for (const key of Array.from(players.keys())) destroyPlayer(key);
+  mode = next;
+}
+
+// Pins `videoId` as the one NowPlaying holds (null when it holds none)
+export function setActiveVideo(videoId: string | null) {
+  if (videoId === activeVideo) return;
+  // A position saved from an earlier listen must not leak into a fresh start
+  if (videoId) resumeAt.delete(videoId);
+  activeVideo = videoId;
+}
 
-function getOrCreateContainer(videoId: string): HTMLElement {
-  const id = `yt-offscreen-${videoId}`;
+export function setMaxPlayers(n: number) {
+  maxPlayers = Math.max(1, Math.floor(n));
+  evictOverflow();
+}
+
+export function getPlayerPoolStats(): PlayerPoolStats {
+  const liveIframes = typeof document === 'undefined' ? 0 : document.querySelectorAll('iframe[id^="yt-offscreen-"]').length;
+  return { mode, live: players.size, liveIframes, maxPlayers, ...stats };
+}
+
+// Loads only the IFrame API script, e.g. when a card's play button is hovered
+export function preloadYouTubeApi() {
+  void loadApi();
+}
+
+// Builds the player ahead of a likely play (hover, focus, touchstart or idle time)
+export function warmYouTubePlayer(videoId: string) {
+  void ensureYouTubePlayer(videoId);
+}
+
+export function markPlayIntent(videoId: string) {
+  if (typeof performance === 'undefined') return;
+  playIntents.set(videoId, performance.now());
+}
+
+function recordFirstAudio(videoId: string | null) {
+  const start = videoId ? playIntents.get(videoId) : undefined;
+  if (start === undefined) return;
+  playIntents.delete(videoId!);
+  const end = performance.now();
+  stats.lastTimeToFirstAudio = end - start;
+  try { performance.measure('yt-time-to-first-audio', { start, end }); } catch {}
+  if (process.env.NODE_ENV !== 'production') {
+    console.info(`[youtube] time to first audio for ${videoId}: ${Math.round(end - start)} ms`);
+  }
+}
+
+function touch(videoId: string) {
+  const p = players.get(videoId);
+  if (p === undefined) return;
+  players.delete(videoId);
+  players.set(videoId, p);
+}
+
+// UNSTARTED or CUED: nothing has played yet, so a load can begin at the right offset
+function isUnstarted(player: any): boolean {
+  const st = typeof player?.getPlayerState === 'function' ? player.getPlayerState() : -1;
+  return st === -1 || st === 5;
+}
+
+function isEnded(player: any): boolean {
+  return typeof player?.getPlayerState === 'function' && player.getPlayerState() === 0;
+}
+
+function isBusy(player: any): boolean {
+  const st = typeof player?.getPlayerState === 'function' ? player.getPlayerState() : -1;
+  // PLAYING or BUFFERING
+  return st === 1 || st === 3;
+}
+
+// The video id whose listeners hear events from the player stored under `key`
+function ownerOf(key: string): string | null {
+  return key === SHARED ? attachedId : key;
+}
+
+function emit(videoId: string | null, evt: any) {
+  if (!videoId) return;
+  listeners.get(videoId)?.forEach((fn) => fn(evt));
+}
+
+function rememberPosition(videoId: string | null, player: any) {
+  if (!videoId || typeof player?.getCurrentTime !== 'function') return;
+  const t = player.getCurrentTime();
+  if (t > 0) resumeAt.set(videoId, t);
+}
+
+function destroyPlayer(key: string) {
+  const player = players.get(key);
+  const owner = ownerOf(key);
+  rememberPosition(owner, player);
+  players.delete(key);
+  readyPromises.delete(key);
+  // Release anyone still awaiting a player that never got ready
+  readyResolvers.get(key)?.();
+  readyResolvers.delete(key);
+  try { player?.destroy?.(); } catch {}
+  // YT.Player replaces the container with its iframe under the same id
+  document.getElementById(containerIdOf(key))?.remove();
+  if (key === SHARED) attachedId = null;
+  stats.evicted++;
+  emit(owner, { type: 'destroyed' });
+}
+
+function evictOverflow(keep?: string) {
+  if (players.size <= maxPlayers) return;
+  for (const id of Array.from(players.keys())) {
+    if (players.size <= maxPlayers) break;
+    if (id === keep || ownerOf(id) === activeVideo || isBusy(players.get(id))) continue;
+    destroyPlayer(id);
+  }
+}
+
+function containerIdOf(key: string): string {
+  return `yt-offscreen-${key}`;
+}
+
+function getOrCreateContainer(key: string): HTMLElement {
+  const id = containerIdOf(key);
   let el = document.getElementById(id);
   if (!el) {
     el = document.createElement('div');
@@ -39,13 +198,13 @@ function getOrCreateContainer(videoId: string): HTMLElement {
   return el;
 }
 
-export async function ensureYouTubePlayer(videoId: string): Promise<any> {
-  if (players.has(videoId)) return players.get(videoId);
+async function createPlayer(key: string, videoId: string): Promise<any> {
   await loadApi();
-  const container = getOrCreateContainer(videoId);
+  const container = getOrCreateContainer(key);
   let resolveReady: () => void;
   const readyPromise = new Promise<void>((resolve) => { resolveReady = resolve; });
-  readyPromises.set(videoId, readyPromise);
+  readyPromises.set(key, readyPromise);
+  readyResolvers.set(key, resolveReady!);
   const player = new (window as any).YT.Player(container, {
     height: '0',
     width: '0',
@@ -59,40 +218,144 @@ export async function ensureYouTubePlayer(videoId: string): Promise<any> {
     },
     events: {
       onReady: () => {
-        const ls = listeners.get(videoId);
-        ls?.forEach((fn) => fn({ type: 'ready' }));
+        emit(ownerOf(key), { type: 'ready' });
+        readyResolvers.delete(key);
         resolveReady!();
       },
       onStateChange: (e: any) => {
-        const ls = listeners.get(videoId);
-        ls?.forEach((fn) => fn({ type: 'state', data: e.data }));
+        if (e.data === 1) recordFirstAudio(ownerOf(key));
+        emit(ownerOf(key), { type: 'state', data: e.data });
       },
     },
   });
-  players.set(videoId, player);
+  players.set(key, player);
+  stats.created++;
+  stats.peak = Math.max(stats.peak, players.size);
+  evictOverflow(key);
   await readyPromise;
   return player;
 }
 
-export function play(videoId: string) {
-  const p = players.get(videoId);
-  if (p && typeof p.playVideo === 'function') p.playVideo();
+function createOnce(key: string, videoId: string): Promise<any> {
+  let pending = creating.get(key);
+  if (!pending) {
+    const done = () => { creating.delete(key); };
+    pending = createPlayer(key, videoId).then(
+      (player) => { done(); return player; },
+      (err) => { done(); throw err; },
+    );
+    creating.set(key, pending);
+  }
+  return pending;
+}
+
+// Points the shared player at `videoId`; the previous video's listeners are told it left
+function attach(videoId: string, load: (player: any) => void) {
+  const player = players.get(SHARED);
+  if (!player || attachedId === videoId) return;
+  const prev = attachedId;
+  rememberPosition(prev, player);
+  attachedId = videoId;
+  load(player);
+  emit(prev, { type: 'detached' });
+}
+
+async function ensureSharedPlayer(videoId: string): Promise<any> {
+  const pending = creating.get(SHARED);
+  if (!pending && !players.has(SHARED)) {
+    attachedId = videoId;
+    return createOnce(SHARED, videoId);
+  }
+  await (pending ?? readyPromises.get(SHARED));
+  const player = players.get(SHARED);
+  // Never swap out a video that is still playing or paused in NowPlaying; play() switches explicitly
+  if (player && !isBusy(player) && attachedId !== activeVideo) attach(videoId, (p) => p.cueVideoById(videoId));
+  return player;
+}
+
+// The player currently holding `videoId`, if any
+function playerFor(videoId: string): any {
+  if (mode === 'single') return attachedId === videoId ? players.get(SHARED) : undefined;
+  return players.get(videoId);
+}
+
+export async function ensureYouTubePlayer(videoId: string): Promise<any> {
+  if (mode === 'single') return ensureSharedPlayer(videoId);
+  // A player is in `players` before it is ready; callers still wait for onReady
+  const pending = creating.get(videoId);
+  if (pending) return pending;
+  if (players.has(videoId)) {
+    touch(videoId);
+    return players.get(videoId);
+  }
+  return createOnce(videoId, videoId);
+}
+
+export type PlayRange = { startSeconds?: number; endSeconds?: number };
+
+// A video that has not started yet is loaded at `range.startSeconds` in one call, so it
+// never starts from 0 and then needs a seek round-trip. A paused or playing video just
+// resumes where the listener left it; only an ended one goes back to `range.startSeconds`.
+// A video whose player was evicted or swapped out is rebuilt and resumed where it stopped.
+export function play(videoId: string, range: PlayRange = {}) {
+  const key = mode === 'single' ? SHARED : videoId;
+  if (!players.has(key)) {
+    void resumePlayer(videoId, range);
+    return;
+  }
+  if (mode === 'single' && attachedId !== videoId) {
+    const pending = pendingStart?.videoId === videoId ? pendingStart.seconds : undefined;
+    const startSeconds = range.startSeconds ?? pending ?? resumeAt.get(videoId);
+    pendingStart = null;
+    resumeAt.delete(videoId);
+    attach(videoId, (p) => p.loadVideoById({ videoId, startSeconds, endSeconds: range.endSeconds }));
+    return;
+  }
+  touch(videoId);
+  const p = playerFor(videoId);
+  if (!p) return;
+  const saved = resumeAt.get(videoId);
+  if (range.startSeconds === undefined && saved !== undefined) {
+    // A freshly built player starts at 0
+    resumeAt.delete(videoId);
+    range = { ...range, startSeconds: saved };
+  }
+  if (range.startSeconds === undefined || !(isUnstarted(p) || isEnded(p))) {
+    if (typeof p.playVideo === 'function') p.playVideo();
+  } else if (isUnstarted(p) && typeof p.loadVideoById === 'function') {
+    p.loadVideoById({ videoId, startSeconds: range.startSeconds, endSeconds: range.endSeconds });
+  } else if (typeof p.seekTo === 'function') {
+    p.seekTo(range.startSeconds, true);
+    p.playVideo();
+  }
+}
+
+async function resumePlayer(videoId: string, range: PlayRange) {
+  await ensureYouTubePlayer(videoId);
+  // Give up rather than loop if the player could not be built
+  if (!players.has(mode === 'single' ? SHARED : videoId)) return;
+  play(videoId, range);
 }
 
 export function pause(videoId: string) {
-  const p = players.get(videoId);
+  const p = playerFor(videoId);
   if (p && typeof p.pauseVideo === 'function') p.pauseVideo();
 }
 
 export function getTimes(videoId: string): { current: number; duration: number } {
-  const p = players.get(videoId);
+  const p = playerFor(videoId);
   const current = p && typeof p.getCurrentTime === 'function' ? p.getCurrentTime() : 0;
   const duration = p && typeof p.getDuration === 'function' ? p.getDuration() : 0;
   return { current, duration };
 }
 
 export function seekTo(videoId: string, seconds: number) {
-  const p = players.get(videoId);
+  if (mode === 'single' && attachedId !== videoId) {
+    if (isBusy(players.get(SHARED)) || attachedId === activeVideo) pendingStart = { videoId, seconds };
+    else attach(videoId, (p) => p.cueVideoById({ videoId, startSeconds: seconds }));
+    return;
+  }
+  const p = playerFor(videoId);
   if (p && typeof p.seekTo === 'function') p.seekTo(seconds, true);
 }
 
@@ -105,5 +368,6 @@ export function subscribe(videoId: string, fn: (evt: any) => void) {
   set.add(fn);
   return () => {
     set?.delete(fn);
+    if (set?.size === 0 && listeners.get(videoId) === set) listeners.delete(videoId);
   };
 }
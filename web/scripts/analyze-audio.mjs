@@ -0,0 +1,322 @@
+#!/usr/bin/env node
+/**
+ * Measure loudness and waveform peaks of every post's audioUrl.
+ * Each file is decoded once by ffmpeg into a 48 kHz stereo float stream and measured
+ * in a single pass with bounded working memory: integrated loudness per EBU R128 /
+ * ITU-R BS.1770 (K-weighting, 400 ms blocks with 75% overlap, absolute and relative
+ * gating), sample peak, and min/max waveform peaks at several zoom levels.
+ * Results go to content/audio-analysis.json, which lib/manifest.ts reads at build time;
+ * peaks are written as Int8 [min, max] pairs to public/peaks/<id>.<framesPerBucket>.bin.
+ *
+ * Local files are read from public/ (audioUrl "/audio/x.mp3"); remote files are downloaded
+ * once into .next/cache/audio/. Unchanged files are skipped unless --force is given.
+ * Usage: node scripts/analyze-audio.mjs [--force]
+ * Requires ffmpeg on PATH.
+ */
+import { spawn } from 'node:child_process';
+import { createHash } from 'node:crypto';
+import { createWriteStream, existsSync, mkdirSync, readdirSync, readFileSync, renameSync, statSync, unlinkSync, writeFileSync } from 'node:fs';
+import { createRequire } from 'node:module';
+import { extname, join } from 'node:path';
+import { Readable } from 'node:stream';
+import { pipeline } from 'node:stream/promises';
+
+const require = createRequire(join(process.cwd(), 'package.json'));
+const POSTS_DIR = join(process.cwd(), 'content', 'posts');
+const PUBLIC_DIR = join(process.cwd(), 'public');
+const CACHE_DIR = join(process.cwd(), '.next', 'cache', 'audio');
+const OUTPUT = join(process.cwd(), 'content', 'audio-analysis.json');
+const PEAKS_DIR = join(process.cwd(), 'public', 'peaks');
+const FORCE = process.argv.includes('--force');
+
+// Bump when the measurement changes so stale entries are recomputed
+const ANALYSIS_VERSION = 2;
+// Mirrors PEAK_SAMPLE_RATE / PEAK_LEVELS in lib/waveform.ts: frames per bucket, finest first,
+// each level 4x coarser than the one before
+const SAMPLE_RATE = 48000;
+const PEAK_LEVELS = [1024, 4096, 16384, 65536];
+const CHANNELS = 2;
+// Streaming services normalize to about -14 LUFS; keep 1 dB of headroom below full scale
+const TARGET_LUFS = -14;
+const MAX_PEAK_DB = -1;
+
+/** Frontmatter of a post: JSON like the rest of content/posts, or YAML when js-yaml is installed */
+function extractFrontmatter(md) {
+  if (!md.startsWith('---')) return null;
+  const end = md.indexOf('\n---', 3);
+  if (end === -1) return null;
+  const block = md.slice(4, end).trim();
+  try {
+    if (block.startsWith('{')) return JSON.parse(block);
+    return require('js-yaml').load(block);
+  } catch {
+    return null;
+  }
+}
+
+function collectAudioUrls() {
+  const urls = new Set();
+  for (const f of readdirSync(POSTS_DIR).filter((name) => name.endsWith('.md'))) {
+    const fm = extractFrontmatter(readFileSync(join(POSTS_DIR, f), 'utf8'));
+    if (fm && !fm.draft && typeof fm.audioUrl === 'string' && fm.audioUrl.trim()) urls.add(fm.audioUrl.trim());
+  }
+  return [...urls];
+}
+
+/** Local path for an audioUrl plus a key that changes whenever the file does */
+async function resolveAudioFile(url) {
+  if (url.startsWith('/')) {
+    const file = join(PUBLIC_DIR, decodeURIComponent(url.split('?')[0]));
+    const st = statSync(file);
+    return { file, key: `${st.size}-${Math.floor(st.mtimeMs)}` };
+  }
+  mkdirSync(CACHE_DIR, { recursive: true });
+  const name = createHash('sha1').update(url).digest('hex') + (extname(new URL(url).pathname) || '.audio');
+  const file = join(CACHE_DIR, name);
+  if (!existsSync(file)) {
+    const res = await fetch(url);
+    if (!res.ok || !res.body) throw new Error(`HTTP ${res.status} fetching ${url}`);
+    const tmp = `${file}.${process.pid}.tmp`;
+    await pipeline(Readable.fromWeb(res.body), createWriteStream(tmp));
+    renameSync(tmp, file);
+  }
+  return { file, key: `${statSync(file).size}` };
+}
+
+/** Second-order IIR section, one state pair per channel (transposed direct form II) */
+function biquad(b0, b1, b2, a1, a2) {
+  const z1 = new Float64Array(CHANNELS);
+  const z2 = new Float64Array(CHANNELS);
+  return (x, ch) => {
+    const y = b0 * x + z1[ch];
+    z1[ch] = b1 * x - a1 * y + z2[ch];
+    z2[ch] = b2 * x - a2 * y;
+    return y;
+  };
+}
+
+// Histogram of gated block loudness: 0.1 LU bins from -70 to +5 LUFS keep memory constant.
+// Each bin also sums its blocks' power, so only the gate threshold is quantized.
+const HIST_MIN = -70;
+const HIST_STEP = 0.1;
+const HIST_BINS = 750;
+
+const loudnessOf = (power) => -0.691 + 10 * Math.log10(power);
+
+/** BS.1770 integrated loudness and sample peak over interleaved stereo frames */
+function createLoudnessMeter() {
+  // K-weighting coefficients for 48 kHz: a high shelf followed by a high-pass (RLB) stage
+  const shelf = biquad(1.53512485958697, -2.69169618940638, 1.19839281085285, -1.69065929318241, 0.73248077421585);
+  const highpass = biquad(1.0, -2.0, 1.0, -1.99004745483398, 0.99007225036621);
+  const hop = SAMPLE_RATE / 10; // 100 ms: a 400 ms block every 100 ms is 75% overlap
+  const subBlocks = [0, 0, 0, 0]; // mean square of the last four hops, summed over channels
+  const histogram = new Uint32Array(HIST_BINS);
+  const binPower = new Float64Array(HIST_BINS);
+  let hopEnergy = 0;
+  let hopFrames = 0;
+  let hops = 0;
+  let peak = 0;
+
+  function endHop() {
+    subBlocks[hops % 4] = hopEnergy / hop;
+    hops++;
+    hopEnergy = 0;
+    hopFrames = 0;
+    if (hops < 4) return;
+    const power = (subBlocks[0] + subBlocks[1] + subBlocks[2] + subBlocks[3]) / 4;
+    if (power <= 0) return;
+    const lufs = loudnessOf(power);
+    if (lufs < HIST_MIN) return; // absolute gate
+    const bin = Math.min(HIST_BINS - 1, Math.floor((lufs - HIST_MIN) / HIST_STEP));
+    histogram[bin]++;
+    binPower[bin] += power;
+  }
+
+  return {
+    push(samples) {
+      for (let i = 0; i + CHANNELS <= samples.length; i += CHANNELS) {
+        for (let ch = 0; ch < CHANNELS; ch++) {
+          const x = samples[i + ch];
+          const ax = Math.abs(x);
+          if (ax > peak) peak = ax;
+          const k = highpass(shelf(x, ch), ch);
+          hopEnergy += k * k; // left and right both have weight 1.0
+        }
+        if (++hopFrames === hop) endHop();
+      }
+    },
+    finish() {
+      const meanAbove = (fromBin) => {
+        let count = 0;
+        let sum = 0;
+        for (let b = Math.max(0, fromBin); b < HIST_BINS; b++) {
+          count += histogram[b];
+          sum += binPower[b];
+        }
+        return count ? sum / count : 0;
+      };
+      const ungated = meanAbove(0);
+      const peakDb = peak > 0 ? 20 * Math.log10(peak) : -Infinity;
+      if (!ungated) return { integratedLufs: null, peakDb };
+      const relativeGate = loudnessOf(ungated) - 10;
+      const gated = meanAbove(Math.floor((relativeGate - HIST_MIN) / HIST_STEP));
+      return { integratedLufs: loudnessOf(gated || ungated), peakDb };
+    },
+  };
+}
+
+/** Min/max per bucket of PEAK_LEVELS[0] frames, folded into the coarser levels at the end */
+function createPeakBuilder() {
+  const bucket = PEAK_LEVELS[0];
+  let out = new Int8Array(1 << 16);
+  let length = 0;
+  let lo = 1;
+  let hi = -1;
+  let frames = 0;
+  const toInt8 = (v) => Math.max(-127, Math.min(127, Math.round(v * 127)));
+
+  function endBucket() {
+    if (length + 2 > out.length) {
+      const grown = new Int8Array(out.length * 2);
+      grown.set(out);
+      out = grown;
+    }
+    out[length++] = toInt8(lo);
+    out[length++] = toInt8(hi);
+    lo = 1;
+    hi = -1;
+    frames = 0;
+  }
+
+  return {
+    push(samples) {
+      for (let i = 0; i + CHANNELS <= samples.length; i += CHANNELS) {
+        for (let ch = 0; ch < CHANNELS; ch++) {
+          const x = samples[i + ch];
+          if (x < lo) lo = x;
+          if (x > hi) hi = x;
+        }
+        if (++frames === bucket) endBucket();
+      }
+    },
+    finish() {
+      if (frames) endBucket();
+      const levels = new Map([[bucket, out.slice(0, length)]]);
+      let prev = levels.get(bucket);
+      for (let l = 1; l < PEAK_LEVELS.length; l++) {
+        const ratio = PEAK_LEVELS[l] / PEAK_LEVELS[l - 1];
+        const pairs = Math.ceil(prev.length / 2 / ratio);
+        const next = new Int8Array(pairs * 2);
+        for (let p = 0; p < pairs; p++) {
+          let min = 127;
+          let max = -127;
+          for (let j = p * ratio; j < Math.min((p + 1) * ratio, prev.length / 2); j++) {
+            if (prev[2 * j] < min) min = prev[2 * j];
+            if (prev[2 * j + 1] > max) max = prev[2 * j + 1];
+          }
+          next[2 * p] = min;
+          next[2 * p + 1] = max;
+        }
+        levels.set(PEAK_LEVELS[l], next);
+        prev = next;
+      }
+      return levels;
+    },
+  };
+}
+
+const peaksFile = (id, level) => join(PEAKS_DIR, `${id}.${level}.bin`);
+
+function writePeaks(id, levels) {
+  mkdirSync(PEAKS_DIR, { recursive: true });
+  for (const [level, data] of levels) writeFileSync(peaksFile(id, level), data);
+}
+
+/** Deletes peak files that no analyzed post refers to any more */
+function prunePeaks(files) {
+  if (!existsSync(PEAKS_DIR)) return;
+  const live = new Set(Object.values(files).map((f) => f.peaks).filter(Boolean));
+  for (const name of readdirSync(PEAKS_DIR)) {
+    if (!live.has(name.split('.')[0])) unlinkSync(join(PEAKS_DIR, name));
+  }
+}
+
+/** Decodes `file` with ffmpeg and feeds float frames to every analyzer as they arrive */
+function decodeInto(file, analyzers) {
+  return new Promise((resolve, reject) => {
+    const ff = spawn('ffmpeg', ['-v', 'error', '-i', file, '-f', 'f32le', '-ac', String(CHANNELS), '-ar', String(SAMPLE_RATE), 'pipe:1'], {
+      stdio: ['ignore', 'pipe', 'pipe'],
+    });
+    let carry = Buffer.alloc(0);
+    let stderr = '';
+    ff.stdout.on('data', (chunk) => {
+      const buf = carry.length ? Buffer.concat([carry, chunk]) : chunk;
+      // Whole frames only; a partial frame waits for the next chunk
+      const usable = buf.length - (buf.length % (4 * CHANNELS));
+      // Copy so the Float32Array is aligned regardless of the chunk's offset in its pool
+      const samples = new Float32Array(buf.buffer.slice(buf.byteOffset, buf.byteOffset + usable));
+      carry = buf.subarray(usable);
+      for (const a of analyzers) a.push(samples);
+    });
+    ff.stderr.on('data', (d) => { stderr += d; });
+    ff.on('error', reject);
+    ff.on('close', (code) => (code === 0 ? resolve() : reject(new Error(`ffmpeg exited with ${code}: ${stderr.slice(0, 300)}`))));
+  });
+}
+
+function gainFor({ integratedLufs, peakDb }) {
+  if (integratedLufs === null) return 0;
+  const gain = Math.min(TARGET_LUFS - integratedLufs, MAX_PEAK_DB - peakDb);
+  return Math.round(gain * 10) / 10;
+}
+
+function readPrevious() {
+  try {
+    const prev = JSON.parse(readFileSync(OUTPUT, 'utf8'));
+    return prev.version === ANALYSIS_VERSION ? prev.files : {};
+  } catch {
+    return {};
+  }
+}
+
+async function main() {
+  const previous = readPrevious();
+  const files = {};
+  let analyzed = 0;
+  let failed = 0;
+  for (const url of collectAudioUrls()) {
+    try {
+      const { file, key } = await resolveAudioFile(url);
+      const prev = previous[url];
+      if (!FORCE && prev?.key === key && existsSync(peaksFile(prev.peaks, PEAK_LEVELS[0]))) {
+        files[url] = prev;
+        continue;
+      }
+      const meter = createLoudnessMeter();
+      const peaks = createPeakBuilder();
+      const started = Date.now();
+      await decodeInto(file, [meter, peaks]);
+      const { integratedLufs, peakDb } = meter.finish();
+      // The id changes with the file, so browsers never see stale cached peaks
+      const id = createHash('sha1').update(`${url}\n${key}`).digest('hex').slice(0, 12);
+      writePeaks(id, peaks.finish());
+      const round = (n) => (Number.isFinite(n) ? Math.round(n * 100) / 100 : null);
+      files[url] = { key, integratedLufs: round(integratedLufs), peakDb: round(peakDb), gainDb: gainFor({ integratedLufs, peakDb }), peaks: id };
+      analyzed++;
+      console.log(`${url}: ${files[url].integratedLufs} LUFS, peak ${files[url].peakDb} dBFS, gain ${files[url].gainDb} dB (${Date.now() - started} ms)`);
+    } catch (e) {
+      failed++;
+      // Keep the last good measurement rather than dropping normalization for this file
+      if (previous[url]) files[url] = previous[url];
+      console.error(`${url}: ${String(e).slice(0, 300)}`);
+    }
+  }
+  const tmp = `${OUTPUT}.${process.pid}.tmp`;
+  writeFileSync(tmp, JSON.stringify({ version: ANALYSIS_VERSION, targetLufs: TARGET_LUFS, files }, null, 2) + '\n');
+  renameSync(tmp, OUTPUT);
+  prunePeaks(files);
+  console.log(`Analyzed ${analyzed}, reused ${Object.keys(files).length - analyzed}, failed ${failed}`);
+  if (failed) process.exitCode = 1;
+}
+
+main();
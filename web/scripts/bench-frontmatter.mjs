@@ -0,0 +1,107 @@
+#!/usr/bin/env node
+/**
+ * Benchmark per-post frontmatter parse cost over synthetic posts.
+ * Compares the original regex + double-trim parser with lib/frontmatter.ts.
+ * Usage: node scripts/bench-frontmatter.mjs [count] [yamlShare]
+ */
+import { copyFileSync, mkdirSync, readFileSync, writeFileSync } from 'node:fs';
+import { createRequire } from 'node:module';
+import { join } from 'node:path';
+import { performance } from 'node:perf_hooks';
+
+const require = createRequire(join(process.cwd(), 'package.json'));
+const COUNT = Number(process.argv[2] || 10000);
+const YAML_SHARE = Number(process.argv[3] || 0.1);
+
+/** Transpile lib/frontmatter.ts with the project's TypeScript and load it as CommonJS.
+ * Its sibling lib/frontmatterParsers.js is copied next to it so the relative require resolves. */
+function loadFrontmatterModule() {
+  const ts = require('typescript');
+  const src = readFileSync(join(process.cwd(), 'lib', 'frontmatter.ts'), 'utf8');
+  const out = ts.transpileModule(src, {
+    compilerOptions: { module: ts.ModuleKind.CommonJS, target: ts.ScriptTarget.ES2019 },
+  });
+  // Inside node_modules so the compiled module can still resolve js-yaml
+  const dir = join(process.cwd(), 'node_modules', '.cache', 'bench');
+  mkdirSync(dir, { recursive: true });
+  copyFileSync(join(process.cwd(), 'lib', 'frontmatterParsers.js'), join(dir, 'frontmatterParsers.js'));
+  const file = join(dir, 'frontmatter.cjs');
+  writeFileSync(file, out.outputText);
+  return require(file);
+}
+
+/** The parser as it was before lib/frontmatter.ts existed */
+function legacyParse(raw) {
+  const fmMatch = raw.match(/^---\n([\s\S]*?)\n---\n?/);
+  if (!fmMatch) throw new Error('Missing frontmatter block in markdown post');
+  const fmContent = fmMatch[1];
+  let frontmatter;
+  if (fmContent.trim().startsWith('{') && fmContent.trim().endsWith('}')) {
+    frontmatter = JSON.parse(fmContent);
+  } else {
+    const yaml = require('js-yaml');
+    frontmatter = yaml.load(fmContent);
+  }
+  return { frontmatter, content: raw.slice(fmMatch[0].length).trim() };
+}
+
+function currentParse(fm, raw) {
+  const fence = fm.findFrontmatterFence(raw);
+  if (!fence) throw new Error('Missing frontmatter block in markdown post');
+  return { frontmatter: fm.parseFrontmatterSource(fence.source), content: raw.slice(fence.end).trim() };
+}
+
+function syntheticPost(i, yaml) {
+  const tracklist = Array.from({ length: 40 }, (_, t) => `${String(t * 2).padStart(2, '0')}:${String(t % 60).padStart(2, '0')} Artist ${t} - Track ${i}-${t}`);
+  const data = {
+    title: `Synthetic Set ${i}`,
+    slug: `synthetic-set-${i}`,
+    date: `2025-${String((i % 12) + 1).padStart(2, '0')}-01`,
+    postType: 'DJ-Set',
+    draft: false,
+    tags: ['House', 'Techno', `Tag${i % 50}`],
+    embed: { type: 'youtube', url: `https://www.youtube.com/embed/vid${String(i).padStart(8, '0')}` },
+    tracklist,
+  };
+  const body = `Synthetic set number ${i}.\n\n${'Longer body paragraph. '.repeat(40)}`;
+  if (!yaml) return `---\n${JSON.stringify(data, null, 2)}\n---\n\n${body}\n`;
+  const lines = [
+    `title: "${data.title}"`,
+    `slug: ${data.slug}`,
+    `date: "${data.date}"`,
+    `postType: ${data.postType}`,
+    'draft: false',
+    `tags: [${data.tags.join(', ')}]`,
+    'embed:',
+    '  type: youtube',
+    `  url: "${data.embed.url}"`,
+    'tracklist:',
+    ...tracklist.map((t) => `  - "${t}"`),
+  ];
+  return `---\n${lines.join('\n')}\n---\n\n${body}\n`;
+}
+
+function time(label, posts, parse) {
+  // Warm up the JIT before measuring
+  for (let i = 0; i < Math.min(500, posts.length); i++) parse(posts[i]);
+  const start = performance.now();
+  for (const raw of posts) parse(raw);
+  const ms = performance.now() - start;
+  console.log(`${label.padEnd(22)} ${ms.toFixed(1).padStart(9)} ms total  ${((ms * 1000) / posts.length).toFixed(2).padStart(8)} µs/post`);
+}
+
+function main() {
+  const fm = loadFrontmatterModule();
+  const yamlEvery = YAML_SHARE > 0 ? Math.round(1 / YAML_SHARE) : 0;
+  const mixed = Array.from({ length: COUNT }, (_, i) => syntheticPost(i, yamlEvery > 0 && i % yamlEvery === 0));
+  const jsonOnly = Array.from({ length: COUNT }, (_, i) => syntheticPost(i, false));
+
+  console.log(`Frontmatter Parse Benchmark (${COUNT} posts, ${(YAML_SHARE * 100).toFixed(0)}% YAML in mixed set)`);
+  console.log('==========================================================');
+  time('legacy / json only', jsonOnly, legacyParse);
+  time('current / json only', jsonOnly, (raw) => currentParse(fm, raw));
+  time('legacy / mixed', mixed, legacyParse);
+  time('current / mixed', mixed, (raw) => currentParse(fm, raw));
+}
+
+main();
@@ -0,0 +1,49 @@
+#!/usr/bin/env node
+/**
+ * Check that lib/markdown.ts turns Markdown snippets into the plain text excerpts expect.
+ * Usage: node scripts/check-excerpts.mjs
+ */
+import { mkdirSync, readFileSync, writeFileSync } from 'node:fs';
+import { createRequire } from 'node:module';
+import { join } from 'node:path';
+
+const require = createRequire(join(process.cwd(), 'package.json'));
+
+/** Transpile lib/markdown.ts with the project's TypeScript and load it as CommonJS */
+function loadMarkdown() {
+  const ts = require('typescript');
+  const src = readFileSync(join(process.cwd(), 'lib', 'markdown.ts'), 'utf8');
+  const out = ts.transpileModule(src, {
+    compilerOptions: { module: ts.ModuleKind.CommonJS, target: ts.ScriptTarget.ES2019 },
+  });
+  const dir = join(process.cwd(), 'node_modules', '.cache', 'scripts');
+  mkdirSync(dir, { recursive: true });
+  const file = join(dir, 'markdown.cjs');
+  writeFileSync(file, out.outputText);
+  return require(file);
+}
+
+const CASES = [
+  ['**Bold** set', 'Bold set'],
+  ['**a** b **c**', 'a b c'],
+  ['*one* and *two*', 'one and two'],
+  ['__x__ then _y_', 'x then y'],
+  ['`a` and `b`', 'a and b'],
+  ['~~old~~ new ~~gone~~', 'old new gone'],
+  ['*a*b*', 'ab*'],
+  ['snake_case and DJ_Name', 'snake_case and DJ_Name'],
+  ['2 * 3 * 4', '2 * 3 * 4'],
+  ['# Heading with [a link](https://example.com)', 'Heading with a link'],
+];
+
+const { stripMarkdown } = loadMarkdown();
+let failed = 0;
+for (const [input, expected] of CASES) {
+  const actual = stripMarkdown(input);
+  if (actual !== expected) {
+    failed++;
+    console.log(`FAIL ${JSON.stringify(input)}\n  expected: ${JSON.stringify(expected)}\n  actual:   ${JSON.stringify(actual)}`);
+  }
+}
+console.log(`${CASES.length - failed}/${CASES.length} excerpt cases pass`);
+if (failed) process.exitCode = 1;
@@ -0,0 +1,122 @@
+#!/usr/bin/env node
+/**
+ * Stress lib/youtubeManager.ts with many concurrent ensureYouTubePlayer calls
+ * against a minimal fake DOM and IFrame API, and check that exactly one
+ * YT.Player and one iframe exist per video id (and one in single-player mode).
+ * Usage: node scripts/stress-youtube-ensure.mjs [concurrency]
+ */
+import { mkdirSync, readFileSync, writeFileSync } from 'node:fs';
+import { createRequire } from 'node:module';
+import { join } from 'node:path';
+
+const require = createRequire(join(process.cwd(), 'package.json'));
+const CONCURRENCY = Number(process.argv[2] || 200);
+
+/** Transpile lib/youtubeManager.ts with the project's TypeScript and load it as CommonJS */
+function loadManager() {
+  const ts = require('typescript');
+  const src = readFileSync(join(process.cwd(), 'lib', 'youtubeManager.ts'), 'utf8');
+  const out = ts.transpileModule(src, {
+    compilerOptions: { module: ts.ModuleKind.CommonJS, target: ts.ScriptTarget.ES2019 },
+  });
+  const dir = join(process.cwd(), 'node_modules', '.cache', 'bench');
+  mkdirSync(dir, { recursive: true });
+  const file = join(dir, 'youtubeManager.cjs');
+  writeFileSync(file, out.outputText);
+  return require(file);
+}
+
+/** Just enough of the DOM for youtubeManager: elements by id, body.appendChild, iframe queries */
+function installFakeDom() {
+  const byId = new Map();
+  let constructed = 0;
+  const later = (fn) => setTimeout(fn, Math.random() * 5);
+
+  class FakeElement {
+    constructor(tag) {
+      this.tagName = tag.toUpperCase();
+      this.id = '';
+      this.style = {};
+    }
+    remove() {
+      if (byId.get(this.id) === this) byId.delete(this.id);
+    }
+  }
+
+  class FakePlayer {
+    constructor(container, opts) {
+      constructed++;
+      // Like the real API, the container is replaced by an iframe with the same id
+      const iframe = new FakeElement('iframe');
+      iframe.id = container.id;
+      byId.set(iframe.id, iframe);
+      this.state = -1;
+      this.opts = opts;
+      later(() => opts.events.onReady());
+    }
+    getPlayerState() { return this.state; }
+    playVideo() { this.state = 1; later(() => this.opts.events.onStateChange({ data: 1 })); }
+    pauseVideo() { this.state = 2; }
+    cueVideoById() { this.state = 5; }
+    loadVideoById() { this.playVideo(); }
+    seekTo() {}
+    getCurrentTime() { return 0; }
+    getDuration() { return 0; }
+    destroy() {}
+  }
+
+  const window = { location: { protocol: 'http:', host: 'localhost' } };
+  const document = {
+    getElementById: (id) => byId.get(id) ?? null,
+    createElement: (tag) => new FakeElement(tag),
+    querySelectorAll: (sel) => {
+      const prefix = sel.match(/\^="([^"]+)"/)?.[1] ?? '';
+      return [...byId.values()].filter((el) => el.tagName === 'IFRAME' && el.id.startsWith(prefix));
+    },
+    body: {
+      appendChild: (el) => {
+        if (el.tagName === 'SCRIPT') {
+          // The API script arrives a little later, which is what opens the race window
+          later(() => {
+            window.YT = { Player: FakePlayer };
+            window.onYouTubeIframeAPIReady?.();
+          });
+          return;
+        }
+        byId.set(el.id, el);
+      },
+    },
+  };
+  globalThis.window = window;
+  globalThis.document = document;
+  return { constructed: () => constructed, iframes: (id) => document.querySelectorAll(`iframe[id^="${id}"]`).length };
+}
+
+function check(label, ok, detail) {
+  console.log(`${ok ? 'ok  ' : 'FAIL'} ${label}${detail ? ` (${detail})` : ''}`);
+  if (!ok) process.exitCode = 1;
+}
+
+const dom = installFakeDom();
+const yt = loadManager();
+
+// Pool mode: many concurrent ensures for one id, interleaved with play calls
+const players = await Promise.all(
+  Array.from({ length: CONCURRENCY }, (_, i) => {
+    const p = yt.ensureYouTubePlayer('abc123xyz');
+    if (i % 10 === 0) yt.play('abc123xyz');
+    return p;
+  }),
+);
+check('pool: one YT.Player constructed', dom.constructed() === 1, `${dom.constructed()} constructed`);
+check('pool: every caller got the same player', players.every((p) => p === players[0]));
+check('pool: one iframe in the DOM', dom.iframes('yt-offscreen-abc123xyz') === 1, `${dom.iframes('yt-offscreen-abc123xyz')} iframes`);
+
+// Single-player mode: concurrent ensures for different ids share one iframe
+yt.setPlayerMode('single');
+const before = dom.constructed();
+const ids = Array.from({ length: CONCURRENCY }, (_, i) => `vid${String(i).padStart(8, '0')}`);
+await Promise.all(ids.map((id) => yt.ensureYouTubePlayer(id)));
+check('single: one YT.Player constructed', dom.constructed() - before === 1, `${dom.constructed() - before} constructed`);
+check('single: one iframe in the DOM', dom.iframes('yt-offscreen-') === 1, `${dom.iframes('yt-offscreen-')} iframes`);
+console.log(yt.getPlayerPoolStats());
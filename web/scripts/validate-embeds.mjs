@@ -3,9 +3,11 @@
  * Validate YouTube embeds in content/posts by calling YouTube oEmbed.
  * No API key required. Reports invalid/malformed URLs and suggestions.
  */
-import { readdirSync, readFileSync } from 'node:fs';
+import { mkdirSync, readdirSync, readFileSync, writeFileSync } from 'node:fs';
+import { createRequire } from 'node:module';
 import { join } from 'node:path';
 
+const require = createRequire(join(process.cwd(), 'package.json'));
 const POSTS_DIR = join(process.cwd(), 'content', 'posts');
 
 /** Extract the JSON frontmatter between first pair of --- lines */
@@ -22,40 +24,25 @@ function extractFrontmatterJSON(md) {
   }
 }
 
-/** Normalize various YouTube embed forms to a canonical watch URL for oEmbed */
-function toWatchUrl(maybeUrl) {
-  try {
-    const u = new URL(maybeUrl);
-    // Fix common mistake: youtu.be/embed/<id> -> youtu.be/<id>
-    if (u.hostname === 'youtu.be') {
-      const parts = u.pathname.split('/').filter(Boolean);
-      if (parts[0] === 'embed' && parts[1]) return `https://www.youtube.com/watch?v=${parts[1]}`;
-      if (parts[0]) return `https://www.youtube.com/watch?v=${parts[0]}`;
-    }
-    // Handle /embed/watch?v=<id>
-    if (u.hostname.includes('youtube.com')) {
-      if (u.pathname.startsWith('/embed/watch')) {
-        const id = u.searchParams.get('v');
-        if (id) return `https://www.youtube.com/watch?v=${id}`;
-      }
-      // Handle /embed/<id>
-      if (u.pathname.startsWith('/embed/')) {
-        const id = u.pathname.split('/').pop();
-        if (id) return `https://www.youtube.com/watch?v=${id}`;
-      }
-      // Already a watch URL
-      if (u.pathname === '/watch' && u.searchParams.get('v')) {
-        return `https://www.youtube.com/watch?v=${u.searchParams.get('v')}`;
-      }
-    }
-    // Fallback: return as-is
-    return maybeUrl;
-  } catch {
-    return maybeUrl;
-  }
+/**
+ * Transpile lib/embed.ts with the project's TypeScript and load it as CommonJS, so this
+ * script recognises exactly the URL forms the site build does
+ */
+function loadEmbed() {
+  const ts = require('typescript');
+  const src = readFileSync(join(process.cwd(), 'lib', 'embed.ts'), 'utf8');
+  const out = ts.transpileModule(src, {
+    compilerOptions: { module: ts.ModuleKind.CommonJS, target: ts.ScriptTarget.ES2019 },
+  });
+  const dir = join(process.cwd(), 'node_modules', '.cache', 'scripts');
+  mkdirSync(dir, { recursive: true });
+  const file = join(dir, 'embed.cjs');
+  writeFileSync(file, out.outputText);
+  return require(file);
 }
 
 async function validate() {
+  const { parseYouTubeUrl } = loadEmbed();
   const files = readdirSync(POSTS_DIR).filter(f => f.endsWith('.md'));
   const results = [];
   for (const f of files) {
@@ -71,7 +58,12 @@ async function validate() {
       results.push({ file: f, status: 'skip', reason: 'No YouTube embed' });
       continue;
     }
-    const watchUrl = toWatchUrl(embed.url);
+    const video = parseYouTubeUrl(embed.url);
+    if (!video) {
+      results.push({ file: f, status: 'invalid', url: embed.url, normalized: '-', reason: 'Unrecognised YouTube URL' });
+      continue;
+    }
+    const watchUrl = `https://www.youtube.com/watch?v=${video.videoId}`;
     const oembed = `https://www.youtube.com/oembed?format=json&url=${encodeURIComponent(watchUrl)}`;
     try {
       const res = await fetch(oembed, { method: 'GET' });